@@ -0,0 +1,40 @@
+"""
+Minimal in-memory stand-in for the bpy API the converters use, so they can be
+benchmarked with a plain python. Only put it on sys.path when bpy isn't available
+"""
+
+import os
+from types import SimpleNamespace
+
+from . import ops, props, types
+
+# tells the benchmarks they're not running in Blender
+STAND_IN = True
+
+app = SimpleNamespace(version=(4, 2, 0), version_string="stand-in", background=True)
+
+path = SimpleNamespace(basename=lambda filepath: os.path.basename(filepath))
+
+scene = SimpleNamespace(
+    name="Scene",
+    unit_settings=SimpleNamespace(
+        scale_length=1.0, system="METRIC", length_unit="METERS"
+    ),
+    collection=types.Collection("Scene Collection"),
+)
+
+data = SimpleNamespace(
+    filepath="",
+    scenes=[scene],
+    meshes=types.IDCollection(types.Mesh),
+    curves=types.IDCollection(types.Curve),
+    objects=types.IDCollection(types.Object),
+    collections=types.IDCollection(types.Collection),
+    materials=types.IDCollection(types.Material),
+    node_groups=types.IDCollection(types.NodeTree),
+    libraries=types.BlendDataLibraries(),
+)
+
+context = SimpleNamespace(scene=scene, collection=scene.collection, active_object=None)
+
+__all__ = ["app", "context", "data", "ops", "path", "props", "types"]
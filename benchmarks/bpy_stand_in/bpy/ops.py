@@ -0,0 +1,25 @@
+"""
+the few operators the converters call
+"""
+
+from types import SimpleNamespace
+from typing import Any, Set
+
+
+def collection_instance_add(collection: str = "", **options: Any) -> Set[str]:
+    """
+    adds an empty instancing the collection to the active collection and makes
+    it the active object
+    """
+    import bpy
+
+    instanced = bpy.data.collections[collection]
+    instance = bpy.data.objects.new(instanced.name, None)
+    instance.instance_type = "COLLECTION"
+    instance.instance_collection = instanced
+    bpy.context.collection.objects.link(instance)
+    bpy.context.active_object = instance
+    return {"FINISHED"}
+
+
+object = SimpleNamespace(collection_instance_add=collection_instance_add)
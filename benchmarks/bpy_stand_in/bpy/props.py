@@ -0,0 +1,22 @@
+"""
+property definitions of the bpy stand-in, they only have to be importable
+"""
+
+from typing import Any, Tuple
+
+
+def _property(kind: str):
+    def define(**options: Any) -> Tuple[str, dict]:
+        return kind, options
+
+    define.__name__ = kind
+    return define
+
+
+BoolProperty = _property("BoolProperty")
+CollectionProperty = _property("CollectionProperty")
+EnumProperty = _property("EnumProperty")
+FloatProperty = _property("FloatProperty")
+IntProperty = _property("IntProperty")
+PointerProperty = _property("PointerProperty")
+StringProperty = _property("StringProperty")
@@ -0,0 +1,893 @@
+"""
+data-block and collection types of the bpy stand-in
+
+element collections keep their properties in numpy arrays so foreach_get and
+foreach_set are bulk copies, like in Blender
+"""
+
+import contextlib
+import copy
+import pickle
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from mathutils import Matrix, Vector
+
+
+class bpy_struct:
+    pass
+
+
+class ID(bpy_struct):
+    def __init__(self, name: str) -> None:
+        self._name = name
+        # the bpy.data collection that keeps the names unique
+        self._owner: Optional[IDCollection] = None
+        self._properties: Dict[str, Any] = {}
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        if self._owner is None:
+            self._name = name
+        else:
+            self._owner._rename(self, name)
+
+    @property
+    def name_full(self) -> str:
+        return self.name
+
+    def __getitem__(self, key: str) -> Any:
+        return self._properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._properties[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._properties
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._properties.get(key, default)
+
+    def user_remap(self, new_id: "ID") -> None:
+        """
+        points every direct reference to this data-block at new_id
+        """
+        import bpy
+
+        datablocks = [bpy.context.scene.collection]
+        for collection in vars(bpy.data).values():
+            if isinstance(collection, IDCollection):
+                datablocks.extend(collection)
+        for datablock in datablocks:
+            for name, value in vars(datablock).items():
+                if value is self:
+                    setattr(datablock, name, new_id)
+                elif isinstance(value, list):
+                    for index, item in enumerate(value):
+                        if item is self:
+                            value[index] = new_id
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # written without bpy.data, remembering whether it was part of it
+        state = dict(vars(self))
+        state["_owner"] = None
+        state["_registered"] = self._owner is not None
+        return state
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class IDCollection:
+    """
+    bpy.data.meshes, bpy.data.objects, ...
+    """
+
+    def __init__(self, id_type: type) -> None:
+        self._id_type = id_type
+        self._items: List[ID] = []
+        self._names: Dict[str, ID] = {}
+
+    def new(self, name: str, *args: Any, **kwargs: Any) -> ID:
+        item = self._id_type(name, *args, **kwargs)
+        self._add(item)
+        return item
+
+    def remove(self, item: ID, **kwargs: Any) -> None:
+        self._items.remove(item)
+        del self._names[item.name]
+        item._owner = None
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self._names.get(name, default)
+
+    def _add(self, item: ID) -> None:
+        item._name = self._unique_name(item.name)
+        item._owner = self
+        self._names[item.name] = item
+        self._items.append(item)
+
+    def _rename(self, item: ID, name: str) -> None:
+        del self._names[item.name]
+        item._name = self._unique_name(name)
+        self._names[item.name] = item
+
+    def _unique_name(self, name: str) -> str:
+        # taken names get a .001, .002, ... suffix like in Blender
+        unique_name = name
+        number = 0
+        while unique_name in self._names:
+            number += 1
+            unique_name = f"{name}.{number:03d}"
+        return unique_name
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            item = self.get(key)
+            if item is None:
+                raise KeyError(key)
+            return item
+        return self._items[key]
+
+    def __iter__(self) -> Iterator[ID]:
+        return iter(list(self._items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class _Element:
+    """
+    a single vertex, loop, point, ... reading and writing its collection's arrays
+    """
+
+    __slots__ = ("_collection", "_index")
+
+    def __init__(self, collection: "ElementCollection", index: int) -> None:
+        object.__setattr__(self, "_collection", collection)
+        object.__setattr__(self, "_index", index)
+
+    def __getattr__(self, name: str) -> Any:
+        return self._collection._get(self._index, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._collection._set(self._index, name, value)
+
+
+class ElementCollection:
+    """
+    a collection of elements with fixed size properties, e.g. MeshVertices
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, Tuple[int, Any]],
+        defaults: Optional[Dict[str, Sequence[float]]] = None,
+        aliases: Optional[Dict[str, Tuple[str, Any]]] = None,
+        count: int = 0,
+    ) -> None:
+        self._fields = fields
+        self._defaults = defaults or {}
+        self._aliases = aliases or {}
+        self._arrays: Dict[str, np.ndarray] = {
+            name: np.zeros((0, width), dtype=dtype)
+            for name, (width, dtype) in fields.items()
+        }
+        self.add(count)
+
+    def __len__(self) -> int:
+        return len(next(iter(self._arrays.values())))
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index: int) -> _Element:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return _Element(self, index)
+
+    def __iter__(self) -> Iterator[_Element]:
+        return (_Element(self, index) for index in range(len(self)))
+
+    def add(self, count: int) -> None:
+        if count <= 0:
+            return
+        for name, (width, dtype) in self._fields.items():
+            added = np.zeros((count, width), dtype=dtype)
+            if name in self._defaults:
+                added[:] = self._defaults[name]
+            self._arrays[name] = np.concatenate([self._arrays[name], added])
+
+    def resize(self, count: int) -> None:
+        if count > len(self):
+            self.add(count - len(self))
+        else:
+            for name in self._arrays:
+                self._arrays[name] = self._arrays[name][:count]
+
+    def foreach_get(self, name: str, buffer: Any) -> None:
+        values = self._array(name).ravel()
+        buffer[: len(values)] = values
+
+    def foreach_set(self, name: str, buffer: Any) -> None:
+        array = self._array(name)
+        array[...] = np.asarray(buffer, dtype=array.dtype).reshape(array.shape)
+
+    def _array(self, name: str) -> np.ndarray:
+        if name in self._aliases:
+            name, index = self._aliases[name]
+            return self._arrays[name][:, index]
+        return self._arrays[name]
+
+    def _get(self, index: int, name: str) -> Any:
+        if name not in self._arrays and name not in self._aliases:
+            return self._attribute(index, name)
+        value = self._array(name)[index].tolist()
+        if not isinstance(value, list):
+            return value
+        if len(value) == 1:
+            return value[0]
+        return Vector(value)
+
+    def _set(self, index: int, name: str, value: Any) -> None:
+        self._array(name)[index] = value
+
+    def _attribute(self, index: int, name: str) -> Any:
+        raise AttributeError(name)
+
+
+class MeshPolygons(ElementCollection):
+    """
+    loop_total is derived from loop_start like in blender 4
+    """
+
+    def __init__(self, mesh: "Mesh") -> None:
+        self._mesh = mesh
+        super().__init__(
+            {
+                "loop_start": (1, np.int32),
+                "loop_total": (1, np.int32),
+                "material_index": (1, np.int32),
+                "normal": (3, np.float32),
+                "area": (1, np.float32),
+            }
+        )
+
+    def foreach_set(self, name: str, buffer: Any) -> None:
+        super().foreach_set(name, buffer)
+        if name == "loop_start" and len(self):
+            starts = self._arrays["loop_start"][:, 0]
+            ends = np.append(starts[1:], len(self._mesh.loops))
+            self._arrays["loop_total"][:, 0] = ends - starts
+
+    def _attribute(self, index: int, name: str) -> Any:
+        if name == "loop_indices":
+            start = int(self._arrays["loop_start"][index, 0])
+            return range(start, start + int(self._arrays["loop_total"][index, 0]))
+        if name == "index":
+            return index
+        raise AttributeError(name)
+
+
+class MeshLayers:
+    """
+    uv_layers and vertex_colors, every layer holds one value per face corner
+    """
+
+    def __init__(self, mesh: "Mesh", field: str, width: int) -> None:
+        self._mesh = mesh
+        self._field = field
+        self._width = width
+        self._layers: List[Any] = []
+        self.active = None
+
+    def new(self, name: str = "") -> Any:
+        layer = SimpleNamespace(
+            name=name or f"{self._field}_{len(self._layers)}",
+            data=ElementCollection(
+                {self._field: (self._width, np.float32)}, count=len(self._mesh.loops)
+            ),
+        )
+        self._layers.append(layer)
+        if self.active is None:
+            self.active = layer
+        return layer
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._layers)
+
+
+class Attribute(bpy_struct):
+    _domain_sizes = {"POINT": "vertices", "EDGE": "edges", "FACE": "polygons"}
+
+    def __init__(self, mesh: "Mesh", name: str, data_type: str, domain: str) -> None:
+        self.name = name
+        self.data_type = data_type
+        self.domain = domain
+        count = len(getattr(mesh, self._domain_sizes.get(domain, "loops")))
+        if data_type in ("FLOAT_COLOR", "BYTE_COLOR"):
+            self.data = ElementCollection(
+                {"color": (4, np.float32)},
+                aliases={"color_srgb": ("color", slice(None))},
+                count=count,
+            )
+        elif data_type == "FLOAT_VECTOR":
+            self.data = ElementCollection({"vector": (3, np.float32)}, count=count)
+        else:
+            self.data = ElementCollection({"value": (1, np.float32)}, count=count)
+
+
+class AttributeGroup:
+    def __init__(self, mesh: "Mesh") -> None:
+        self._mesh = mesh
+        self._attributes: List[Attribute] = []
+
+    def new(self, name: str, type: str, domain: str) -> Attribute:
+        attribute = Attribute(self._mesh, name, type, domain)
+        self._attributes.append(attribute)
+        return attribute
+
+    def get(self, name: str, default: Any = None) -> Any:
+        for attribute in self._attributes:
+            if attribute.name == name:
+                return attribute
+        return default
+
+    def remove(self, attribute: Attribute) -> None:
+        self._attributes.remove(attribute)
+
+    def __len__(self) -> int:
+        return len(self._attributes)
+
+    def __iter__(self) -> Iterator[Attribute]:
+        return iter(self._attributes)
+
+
+class ColorAttributes(AttributeGroup):
+    """
+    color attributes are stored with the other attributes of the mesh
+    """
+
+    def __init__(self, mesh: "Mesh") -> None:
+        super().__init__(mesh)
+        self.active_color: Optional[Attribute] = None
+
+    def new(self, name: str, type: str, domain: str) -> Attribute:
+        attribute = self._mesh.attributes.new(name, type, domain)
+        self._attributes.append(attribute)
+        return attribute
+
+
+class NodeSocket(bpy_struct):
+    def __init__(self, node: "Node", name: str, default_value: Any = None) -> None:
+        self.node = node
+        self.name = name
+        self.default_value = default_value
+        self.links: List[NodeLink] = []
+
+    @property
+    def is_linked(self) -> bool:
+        return bool(self.links)
+
+
+class NodeSockets:
+    """
+    node inputs or outputs, by name or by index
+    """
+
+    def __init__(self, node: "Node", defaults: Dict[str, Any]) -> None:
+        self._sockets = {
+            name: NodeSocket(node, name, value) for name, value in defaults.items()
+        }
+
+    def __getitem__(self, key) -> NodeSocket:
+        if isinstance(key, int):
+            return list(self._sockets.values())[key]
+        return self._sockets[key]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self._sockets.get(name, default)
+
+    def __iter__(self) -> Iterator[NodeSocket]:
+        return iter(self._sockets.values())
+
+    def __len__(self) -> int:
+        return len(self._sockets)
+
+
+# node type name -> (node.type, input defaults, output names) of the nodes the
+# add-on creates, other node types get no sockets
+NODE_TYPES: Dict[str, Tuple[str, Dict[str, Any], Tuple[str, ...]]] = {
+    "ShaderNodeBsdfPrincipled": (
+        "BSDF_PRINCIPLED",
+        {
+            "Base Color": (0.8, 0.8, 0.8, 1.0),
+            "Metallic": 0.0,
+            "Roughness": 0.5,
+            "Alpha": 1.0,
+            "Emission Color": (1.0, 1.0, 1.0, 1.0),
+            "Emission Strength": 0.0,
+        },
+        ("BSDF",),
+    ),
+    "ShaderNodeOutputMaterial": (
+        "OUTPUT_MATERIAL",
+        {"Surface": None, "Volume": None, "Displacement": None},
+        (),
+    ),
+    "NodeGroupInput": ("GROUP_INPUT", {}, ("Geometry",)),
+    "NodeGroupOutput": ("GROUP_OUTPUT", {"Geometry": None}, ()),
+    "GeometryNodeInstanceOnPoints": (
+        "INSTANCE_ON_POINTS",
+        {"Points": None, "Instance": None},
+        ("Instances",),
+    ),
+    "GeometryNodeMeshIcoSphere": (
+        "MESH_PRIMITIVE_ICO_SPHERE",
+        {"Radius": 1.0, "Subdivisions": 1},
+        ("Mesh",),
+    ),
+}
+
+
+class Node(bpy_struct):
+    def __init__(self, bl_idname: str) -> None:
+        node_type, inputs, outputs = NODE_TYPES.get(bl_idname, ("CUSTOM", {}, ()))
+        self.bl_idname = bl_idname
+        self.type = node_type
+        self.name = bl_idname
+        self.location = (0.0, 0.0)
+        self.inputs = NodeSockets(self, inputs)
+        self.outputs = NodeSockets(self, dict.fromkeys(outputs))
+
+
+class NodeLink(bpy_struct):
+    def __init__(self, from_socket: NodeSocket, to_socket: NodeSocket) -> None:
+        self.from_socket = from_socket
+        self.to_socket = to_socket
+        self.from_node = from_socket.node
+        self.to_node = to_socket.node
+
+
+class NodeLinks(list):
+    def new(self, output: NodeSocket, input: NodeSocket) -> NodeLink:
+        link = NodeLink(output, input)
+        output.links.append(link)
+        input.links.append(link)
+        self.append(link)
+        return link
+
+    def remove(self, link: NodeLink) -> None:
+        link.from_socket.links.remove(link)
+        link.to_socket.links.remove(link)
+        super().remove(link)
+
+
+class Nodes(list):
+    def __init__(self, links: NodeLinks) -> None:
+        super().__init__()
+        self._links = links
+
+    def new(self, type: str) -> Node:
+        node = Node(type)
+        self.append(node)
+        return node
+
+    def remove(self, node: Node) -> None:
+        for link in list(self._links):
+            if node in (link.from_node, link.to_node):
+                self._links.remove(link)
+        super().remove(node)
+
+    def __iter__(self) -> Iterator[Node]:
+        # removing nodes while iterating is fine in Blender
+        return iter(list(super().__iter__()))
+
+
+class NodeTreeInterface:
+    def __init__(self) -> None:
+        self.items_tree: List[SimpleNamespace] = []
+
+    def new_socket(self, name: str, in_out: str, socket_type: str) -> SimpleNamespace:
+        socket = SimpleNamespace(name=name, in_out=in_out, socket_type=socket_type)
+        self.items_tree.append(socket)
+        return socket
+
+
+class NodeTree(ID):
+    def __init__(self, name: str, type: str = "GeometryNodeTree") -> None:
+        super().__init__(name)
+        self.type = type
+        self.links = NodeLinks()
+        self.nodes = Nodes(self.links)
+        self.interface = NodeTreeInterface()
+
+
+class Material(ID):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.diffuse_color = (0.8, 0.8, 0.8, 1.0)
+        self.metallic = 0.0
+        self.roughness = 0.4
+        self.blend_method = "OPAQUE"
+        self.node_tree: Optional[NodeTree] = None
+
+    @property
+    def use_nodes(self) -> bool:
+        return self.node_tree is not None
+
+    @use_nodes.setter
+    def use_nodes(self, use_nodes: bool) -> None:
+        if not use_nodes or self.node_tree is not None:
+            return
+
+        # the default node setup of a new material
+        self.node_tree = NodeTree(f"{self.name} Shader", "ShaderNodeTree")
+        bsdf = self.node_tree.nodes.new("ShaderNodeBsdfPrincipled")
+        output = self.node_tree.nodes.new("ShaderNodeOutputMaterial")
+        self.node_tree.links.new(bsdf.outputs["BSDF"], output.inputs["Surface"])
+
+
+class Mesh(ID):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.vertices = ElementCollection({"co": (3, np.float32)})
+        self.edges = ElementCollection({"vertices": (2, np.int32)})
+        self.loops = ElementCollection(
+            {"vertex_index": (1, np.int32), "normal": (3, np.float32)}
+        )
+        self.polygons = MeshPolygons(self)
+        self.materials: List[Material] = []
+        self.uv_layers = MeshLayers(self, "uv", 2)
+        self.vertex_colors = MeshLayers(self, "color", 4)
+        self.attributes = AttributeGroup(self)
+        self.color_attributes = ColorAttributes(self)
+
+    def from_pydata(
+        self,
+        vertices: Sequence[Sequence[float]],
+        edges: Sequence[Sequence[int]],
+        faces: Sequence[Sequence[int]],
+    ) -> None:
+        co = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        self.vertices.resize(0)
+        self.vertices.add(len(co))
+        self.vertices.foreach_set("co", co.ravel())
+
+        loop_totals = np.fromiter((len(face) for face in faces), dtype=np.int32)
+        loop_starts = (np.cumsum(loop_totals) - loop_totals).astype(np.int32)
+        corners = np.fromiter(
+            (index for face in faces for index in face),
+            dtype=np.int32,
+            count=int(loop_totals.sum()),
+        )
+
+        self.loops.resize(0)
+        self.loops.add(len(corners))
+        self.loops.foreach_set("vertex_index", corners)
+
+        self.polygons.resize(0)
+        self.polygons.add(len(loop_totals))
+        self.polygons.foreach_set("loop_start", loop_starts)
+
+        self._calc_edges(edges)
+        self.update()
+
+    def _calc_edges(self, loose_edges: Sequence[Sequence[int]] = ()) -> None:
+        """
+        edges of the faces, plus the loose ones
+        """
+        corners = self.loops._arrays["vertex_index"][:, 0]
+        loop_starts = self.polygons._arrays["loop_start"][:, 0]
+        loop_totals = self.polygons._arrays["loop_total"][:, 0]
+
+        next_corners = np.arange(len(corners)) + 1
+        face_ends = loop_starts + loop_totals
+        wrap = np.isin(next_corners, face_ends)
+        next_corners[wrap] = np.repeat(loop_starts, loop_totals)[wrap]
+        pairs = np.sort(np.stack([corners, corners[next_corners]], axis=1), axis=1)
+        if len(loose_edges):
+            pairs = np.concatenate([pairs, np.sort(np.asarray(loose_edges), axis=1)])
+        pairs = np.unique(pairs, axis=0) if len(pairs) else pairs.reshape(0, 2)
+        self.edges.resize(0)
+        self.edges.add(len(pairs))
+        self.edges.foreach_set("vertices", pairs.ravel())
+
+    def update(self, calc_edges: bool = False, *args: Any, **kwargs: Any) -> None:
+        """
+        recalculates the face normals and areas and flat loop normals, and the
+        edges with calc_edges
+        """
+        if calc_edges:
+            self._calc_edges()
+        if not self.polygons:
+            return
+
+        co = self.vertices._arrays["co"].astype(np.float64)
+        corners = co[self.loops._arrays["vertex_index"][:, 0]]
+        loop_starts = self.polygons._arrays["loop_start"][:, 0]
+        loop_totals = self.polygons._arrays["loop_total"][:, 0]
+
+        # newell's method, the cross products of the corners sum up to twice the area
+        next_corners = np.arange(len(corners)) + 1
+        wrap = np.isin(next_corners, loop_starts + loop_totals)
+        next_corners[wrap] = np.repeat(loop_starts, loop_totals)[wrap]
+        cross = np.cross(corners, corners[next_corners])
+        summed = np.add.reduceat(cross, loop_starts, axis=0)
+        length = np.linalg.norm(summed, axis=1)
+
+        self.polygons._arrays["area"][:, 0] = length / 2
+        normals = np.divide(
+            summed,
+            length[:, None],
+            out=np.zeros_like(summed),
+            where=length[:, None] > 0,
+        )
+        self.polygons._arrays["normal"][:] = normals
+        self.loops._arrays["normal"][:] = np.repeat(normals, loop_totals, axis=0)
+
+    def normals_split_custom_set(self, normals: Sequence[Sequence[float]]) -> None:
+        self.loops.foreach_set(
+            "normal", np.asarray(normals, dtype=np.float32).reshape(-1, 3)
+        )
+
+    def shade_smooth(self) -> None:
+        pass
+
+    def shade_flat(self) -> None:
+        pass
+
+
+class Spline(bpy_struct):
+    def __init__(self, type: str) -> None:
+        self.type = type
+        self.points = ElementCollection(
+            {"co": (4, np.float32)},
+            defaults={"co": (0.0, 0.0, 0.0, 1.0)},
+            aliases={"weight": ("co", 3)},
+            count=0 if type == "BEZIER" else 1,
+        )
+        self.bezier_points = ElementCollection(
+            {
+                "co": (3, np.float32),
+                "handle_left": (3, np.float32),
+                "handle_right": (3, np.float32),
+            },
+            count=1 if type == "BEZIER" else 0,
+        )
+        self.use_cyclic_u = False
+        self.use_endpoint_u = False
+        self.use_bezier_u = False
+        self.use_smooth = True
+        self.order_u = 4
+        self.resolution_u = 12
+
+    @property
+    def point_count_u(self) -> int:
+        return len(self.bezier_points) if self.type == "BEZIER" else len(self.points)
+
+    def calc_length(self, resolution: int = 0) -> float:
+        """
+        length of the control polygon, Blender evaluates the curve instead
+        """
+        if self.type == "BEZIER":
+            co = self.bezier_points._arrays["co"].astype(np.float64)
+        else:
+            co = self.points._arrays["co"][:, :3].astype(np.float64)
+        if self.use_cyclic_u and len(co):
+            co = np.concatenate([co, co[:1]])
+        return float(np.linalg.norm(np.diff(co, axis=0), axis=1).sum())
+
+
+class CurveSplines:
+    def __init__(self) -> None:
+        self._splines: List[Spline] = []
+
+    def new(self, type: str) -> Spline:
+        spline = Spline(type)
+        self._splines.append(spline)
+        return spline
+
+    def remove(self, spline: Spline) -> None:
+        self._splines.remove(spline)
+
+    def clear(self) -> None:
+        self._splines.clear()
+
+    def __getitem__(self, index: int) -> Spline:
+        return self._splines[index]
+
+    def __len__(self) -> int:
+        return len(self._splines)
+
+    def __iter__(self) -> Iterator[Spline]:
+        return iter(self._splines)
+
+
+class Curve(ID):
+    def __init__(self, name: str, type: str = "CURVE") -> None:
+        super().__init__(name)
+        self.type = type
+        self.dimensions = "3D"
+        self.splines = CurveSplines()
+        self.materials: List[Material] = []
+
+
+class Collection(ID):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.objects = _LinkedObjects()
+        self.children = _LinkedObjects()
+
+
+class _LinkedObjects(list):
+    def __contains__(self, item: Any) -> bool:
+        if isinstance(item, str):
+            return any(linked.name == item for linked in self)
+        return any(linked is item for linked in self)
+
+    def link(self, item: Any) -> None:
+        if item in self:
+            raise RuntimeError(f"'{item.name}' is already in the collection")
+        self.append(item)
+
+    def unlink(self, item: Any) -> None:
+        self.remove(item)
+
+
+class Modifier(bpy_struct):
+    def __init__(self, name: str, type: str) -> None:
+        self.name = name
+        self.type = type
+
+
+class ObjectModifiers(list):
+    def new(self, name: str, type: str) -> Modifier:
+        modifier = Modifier(name, type)
+        self.append(modifier)
+        return modifier
+
+
+class Object(ID):
+    def __init__(self, name: str, object_data: Optional[ID] = None) -> None:
+        super().__init__(name)
+        self.data = object_data
+        self.matrix_world = Matrix()
+        self.location = Vector()
+        self.modifiers = ObjectModifiers()
+        self.parent: Optional[Object] = None
+        self.empty_display_type = "PLAIN_AXES"
+        self.empty_display_size = 1.0
+        self.instance_type = "NONE"
+        self.instance_collection: Optional[Collection] = None
+
+    @property
+    def type(self) -> str:
+        if isinstance(self.data, Mesh):
+            return "MESH"
+        if isinstance(self.data, Curve):
+            return "CURVE"
+        return "EMPTY"
+
+    @property
+    def users_collection(self) -> List[Collection]:
+        import bpy
+
+        collections = [bpy.context.scene.collection, *bpy.data.collections]
+        return [collection for collection in collections if self in collection.objects]
+
+    def copy(self) -> "Object":
+        import bpy
+
+        # the copy shares the object data, like Object.copy() in Blender
+        duplicate = copy.copy(self)
+        vars(duplicate).pop("_registered", None)
+        duplicate._properties = dict(self._properties)
+        duplicate.modifiers = ObjectModifiers(self.modifiers)
+        bpy.data.objects._add(duplicate)
+        return duplicate
+
+
+MeshPolygon = _Element
+MeshVertex = _Element
+MeshLoop = _Element
+
+
+def __getattr__(name: str) -> type:
+    # any other type is only used in annotations and isinstance checks
+    stand_in = type(name, (bpy_struct,), {})
+    globals()[name] = stand_in
+    return stand_in
+
+
+def _reachable_ids(roots: Sequence[Any]) -> List[ID]:
+    """
+    the data-blocks in roots and everything they reference
+    """
+    found: List[ID] = []
+    seen = set()
+    stack = list(roots)
+    while stack:
+        value = stack.pop()
+        if id(value) in seen or isinstance(value, (str, bytes, np.ndarray, type)):
+            continue
+        seen.add(id(value))
+        if isinstance(value, ID):
+            found.append(value)
+        if isinstance(value, (list, tuple, set)):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif hasattr(value, "__dict__"):
+            stack.extend(item for name, item in vars(value).items() if name != "_owner")
+    return found
+
+
+class BlendDataLibraries:
+    """
+    bpy.data.libraries, libraries are pickles of the data-blocks instead of .blend
+    files. only appending is supported
+    """
+
+    def write(
+        self,
+        filepath: str,
+        datablocks: Any,
+        path_remap: str = "NONE",
+        fake_user: bool = False,
+        compress: bool = False,
+    ) -> None:
+        with open(filepath, "wb") as file:
+            pickle.dump(list(datablocks), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @contextlib.contextmanager
+    def load(
+        self, filepath: str, link: bool = False, relative: bool = False
+    ) -> Iterator[Tuple[SimpleNamespace, SimpleNamespace]]:
+        import bpy
+
+        with open(filepath, "rb") as file:
+            written = pickle.load(file)
+
+        id_collections = {
+            name: collection
+            for name, collection in vars(bpy.data).items()
+            if isinstance(collection, IDCollection)
+        }
+        attributes = {
+            collection._id_type: name for name, collection in id_collections.items()
+        }
+
+        # (collection name, data-block name) -> data-block in the library
+        library = {}
+        for datablock in _reachable_ids(written):
+            if getattr(datablock, "_registered", False):
+                library[(attributes[type(datablock)], datablock.name)] = datablock
+
+        data_from = SimpleNamespace(**{name: [] for name in id_collections})
+        for name, datablock_name in library:
+            getattr(data_from, name).append(datablock_name)
+        data_to = SimpleNamespace(**{name: [] for name in id_collections})
+
+        yield data_from, data_to
+
+        requested = []
+        for name in id_collections:
+            appended = [library.get((name, item)) for item in getattr(data_to, name)]
+            setattr(data_to, name, appended)
+            requested.extend(item for item in appended if item is not None)
+
+        # appended with everything they use, taken names get a suffix
+        for datablock in _reachable_ids(requested):
+            if vars(datablock).pop("_registered", False):
+                id_collections[attributes[type(datablock)]]._add(datablock)
@@ -0,0 +1,238 @@
+"""
+Minimal stand-in for Blender's mathutils module, only covers what the converters use
+"""
+
+import math
+from typing import Iterable, List, Sequence, Union
+
+import numpy as np
+
+
+class Vector:
+    def __init__(self, values: Iterable[float] = (0.0, 0.0, 0.0)) -> None:
+        self._values: List[float] = list(map(float, values))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __setitem__(self, index, value) -> None:
+        self._values[index] = float(value)
+
+    def __repr__(self) -> str:
+        return f"Vector({tuple(self._values)})"
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __add__(self, other: "Vector") -> "Vector":
+        return Vector(a + b for a, b in zip(self._values, other))
+
+    def __sub__(self, other: "Vector") -> "Vector":
+        return Vector(a - b for a, b in zip(self._values, other))
+
+    def __mul__(self, scalar: float) -> "Vector":
+        return Vector(a * scalar for a in self._values)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar: float) -> "Vector":
+        return Vector(a / scalar for a in self._values)
+
+    def __neg__(self) -> "Vector":
+        return Vector(-a for a in self._values)
+
+    def _component(index: int):
+        def getter(self) -> float:
+            return self._values[index]
+
+        def setter(self, value: float) -> None:
+            self._values[index] = float(value)
+
+        return property(getter, setter)
+
+    x = _component(0)
+    y = _component(1)
+    z = _component(2)
+    w = _component(3)
+    del _component
+
+    @property
+    def xyz(self) -> "Vector":
+        return Vector(self._values[:3])
+
+    @property
+    def length(self) -> float:
+        return math.sqrt(sum(a * a for a in self._values))
+
+    def dot(self, other: "Vector") -> float:
+        return sum(a * b for a, b in zip(self._values, other))
+
+    def cross(self, other: "Vector") -> "Vector":
+        ax, ay, az = self._values[:3]
+        bx, by, bz = list(other)[:3]
+        return Vector((ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx))
+
+    def normalize(self) -> None:
+        length = self.length
+        if length > 0.0:
+            self._values = [a / length for a in self._values]
+
+    def normalized(self) -> "Vector":
+        vector = self.copy()
+        vector.normalize()
+        return vector
+
+    def copy(self) -> "Vector":
+        return Vector(self._values)
+
+
+class Matrix:
+    def __init__(self, rows: Sequence[Sequence[float]] = None) -> None:
+        if rows is None:
+            rows = np.identity(4)
+        self._rows: List[List[float]] = [
+            [float(value) for value in row] for row in rows
+        ]
+
+    @classmethod
+    def Identity(cls, size: int) -> "Matrix":
+        return cls(np.identity(size))
+
+    @classmethod
+    def Translation(cls, vector: Sequence[float]) -> "Matrix":
+        matrix = np.identity(4)
+        matrix[:3, 3] = list(vector)[:3]
+        return cls(matrix)
+
+    @classmethod
+    def Diagonal(cls, vector: Sequence[float]) -> "Matrix":
+        return cls(np.diag(list(vector)))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self):
+        return (Vector(row) for row in self._rows)
+
+    def __getitem__(self, index: int) -> Vector:
+        return Vector(self._rows[index])
+
+    def __repr__(self) -> str:
+        return f"Matrix({tuple(tuple(row) for row in self._rows)})"
+
+    def __matmul__(self, other: Union["Matrix", Vector]) -> Union["Matrix", Vector]:
+        if isinstance(other, Matrix):
+            return Matrix(np.array(self._rows) @ np.array(other._rows))
+
+        values = list(other)
+        size = len(self._rows)
+        if len(values) == size - 1:
+            # a 3D vector is transformed by a 4x4 matrix as a point
+            rows = self._rows
+            return Vector(
+                sum(row[i] * values[i] for i in range(size - 1)) + row[size - 1]
+                for row in rows[: size - 1]
+            )
+        return Vector(
+            sum(row[i] * values[i] for i in range(size)) for row in self._rows
+        )
+
+    @property
+    def translation(self) -> Vector:
+        return Vector(row[-1] for row in self._rows[:3])
+
+    def to_3x3(self) -> "Matrix":
+        return Matrix(row[:3] for row in self._rows[:3])
+
+    def to_4x4(self) -> "Matrix":
+        matrix = np.identity(4)
+        size = min(len(self._rows), 4)
+        matrix[:size, :size] = np.array(self._rows)[:size, :size]
+        return Matrix(matrix)
+
+    def decompose(self) -> "tuple[Vector, Quaternion, Vector]":
+        """
+        splits the matrix in translation, rotation and scale, like Blender
+        a negative determinant flips the sign of every scale component
+        """
+        basis = np.array(self._rows)[:3, :3]
+        scale = np.linalg.norm(basis, axis=0)
+        if np.linalg.det(basis) < 0.0:
+            scale = -scale
+        rotation = basis / np.where(scale == 0.0, 1.0, scale)
+        return self.translation, Quaternion.from_matrix(rotation), Vector(scale)
+
+    def inverted(self) -> "Matrix":
+        return Matrix(np.linalg.inv(np.array(self._rows)))
+
+    def transposed(self) -> "Matrix":
+        return Matrix(np.array(self._rows).T)
+
+    def copy(self) -> "Matrix":
+        return Matrix(self._rows)
+
+
+class Quaternion:
+    def __init__(self, values: Iterable[float] = (1.0, 0.0, 0.0, 0.0)) -> None:
+        self.w, self.x, self.y, self.z = map(float, values)
+
+    def __iter__(self):
+        return iter((self.w, self.x, self.y, self.z))
+
+    def __repr__(self) -> str:
+        return f"Quaternion({(self.w, self.x, self.y, self.z)})"
+
+    @classmethod
+    def from_matrix(cls, rotation: np.ndarray) -> "Quaternion":
+        # Shepperd's method, picks the largest component to stay stable
+        m = rotation
+        trace = m[0, 0] + m[1, 1] + m[2, 2]
+        if trace > 0.0:
+            s = math.sqrt(trace + 1.0) * 2.0
+            values = (
+                0.25 * s,
+                (m[2, 1] - m[1, 2]) / s,
+                (m[0, 2] - m[2, 0]) / s,
+                (m[1, 0] - m[0, 1]) / s,
+            )
+        elif m[0, 0] > m[1, 1] and m[0, 0] > m[2, 2]:
+            s = math.sqrt(1.0 + m[0, 0] - m[1, 1] - m[2, 2]) * 2.0
+            values = (
+                (m[2, 1] - m[1, 2]) / s,
+                0.25 * s,
+                (m[0, 1] + m[1, 0]) / s,
+                (m[0, 2] + m[2, 0]) / s,
+            )
+        elif m[1, 1] > m[2, 2]:
+            s = math.sqrt(1.0 + m[1, 1] - m[0, 0] - m[2, 2]) * 2.0
+            values = (
+                (m[0, 2] - m[2, 0]) / s,
+                (m[0, 1] + m[1, 0]) / s,
+                0.25 * s,
+                (m[1, 2] + m[2, 1]) / s,
+            )
+        else:
+            s = math.sqrt(1.0 + m[2, 2] - m[0, 0] - m[1, 1]) * 2.0
+            values = (
+                (m[1, 0] - m[0, 1]) / s,
+                (m[0, 2] + m[2, 0]) / s,
+                (m[1, 2] + m[2, 1]) / s,
+                0.25 * s,
+            )
+        return cls(values)
+
+    def to_matrix(self) -> Matrix:
+        w, x, y, z = self.w, self.x, self.y, self.z
+        return Matrix(
+            (
+                (1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)),
+                (2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)),
+                (2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)),
+            )
+        )
@@ -0,0 +1,516 @@
+"""
+Times the converters in bpy_speckle/converter over synthetic inputs of growing size
+
+Runs with a regular python against the in-memory bpy stand-in in bpy_stand_in/,
+or inside Blender against the real API:
+
+    python benchmarks/converter_benchmark.py --output results.json
+    blender --background --factory-startup --python-exit-code 1 \\
+        --python benchmarks/converter_benchmark.py -- --output results.json
+
+Pass an earlier --output file as --baseline to compare the median times, the run
+fails if a converter got slower than --threshold allows. Stand-in timings are only
+comparable with other stand-in timings, Blender timings with the same Blender.
+"""
+
+import argparse
+import ast
+import gc
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+STAND_IN_PATH = Path(__file__).resolve().parent / "bpy_stand_in"
+
+# name -> (sizes, prepare), prepare builds the inputs of one size and returns
+# the timed callable and the blender data-blocks to remove afterwards
+CASES: Dict[str, Tuple[Tuple[int, ...], Callable[[int], Tuple[Callable, list]]]] = {}
+
+
+def benchmark(name: str, sizes: Tuple[int, ...]) -> Callable:
+    def register(prepare: Callable) -> Callable:
+        CASES[name] = (sizes, prepare)
+        return prepare
+
+    return register
+
+
+def load_converters() -> str:
+    """
+    makes bpy, specklepy and the converters importable, returns the backend name
+    """
+    try:
+        import bpy
+    except ImportError:
+        sys.path.insert(0, str(STAND_IN_PATH))
+        import bpy
+
+    # a bare package skips bpy_speckle/__init__.py, which registers the UI
+    if "bpy_speckle" not in sys.modules:
+        package = types.ModuleType("bpy_speckle")
+        package.__path__ = [str(REPO_ROOT / "bpy_speckle")]
+        # the operations read the add-on version from it
+        package.bl_info = read_bl_info()
+        sys.modules["bpy_speckle"] = package
+
+    if getattr(bpy, "STAND_IN", False):
+        return "stand-in"
+
+    from importlib.util import find_spec
+
+    if find_spec("specklepy") is None:
+        from bpy_speckle.installer import ensure_dependencies
+
+        ensure_dependencies(f"Blender {bpy.app.version[0]}.{bpy.app.version[1]}")
+
+    return f"blender {bpy.app.version_string}"
+
+
+def read_bl_info() -> Dict[str, Any]:
+    """
+    reads bl_info from bpy_speckle/__init__.py without running it
+    """
+    source = (REPO_ROOT / "bpy_speckle" / "__init__.py").read_text()
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "bl_info"
+            for target in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    return {}
+
+
+def remove_blender_data(data_blocks: List[Any]) -> None:
+    """
+    removes objects, meshes and curves created by a converter or a fixture
+    """
+    import bpy
+
+    for data_block in data_blocks:
+        if isinstance(data_block, bpy.types.Object):
+            data = data_block.data
+            bpy.data.objects.remove(data_block)
+            if data is not None:
+                remove_blender_data([data])
+        elif isinstance(data_block, bpy.types.Mesh):
+            bpy.data.meshes.remove(data_block)
+        elif isinstance(data_block, bpy.types.Curve):
+            bpy.data.curves.remove(data_block)
+
+
+def grid(size: int) -> Tuple[List[float], List[List[int]], int]:
+    """
+    a wavy grid of about size quads, returns flat vertices, quads and the side length
+    """
+    import numpy as np
+
+    side = max(int(math.sqrt(size)), 1)
+    x, y = np.meshgrid(np.arange(side + 1), np.arange(side + 1))
+    z = np.sin(x * 0.3) * np.cos(y * 0.3)
+    vertices = np.stack([x, y, z], axis=-1).reshape(-1, 3).astype(np.float64)
+
+    rows, columns = np.meshgrid(np.arange(side), np.arange(side), indexing="ij")
+    first = (rows * (side + 1) + columns).ravel()
+    quads = np.stack([first, first + 1, first + side + 2, first + side + 1], axis=1)
+
+    return vertices.ravel().tolist(), quads.tolist(), side
+
+
+def helix(point_count: int, turns: float = 10.0) -> List[float]:
+    import numpy as np
+
+    t = np.linspace(0.0, turns * 2 * math.pi, point_count)
+    return np.stack([np.cos(t), np.sin(t), t * 0.1], axis=1).ravel().tolist()
+
+
+def random_colors(count: int) -> List[int]:
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    channels = rng.integers(0, 256, size=(count, 3), dtype=np.int64)
+    argb = (255 << 24) | (channels[:, 0] << 16) | (channels[:, 1] << 8) | channels[:, 2]
+    return argb.astype(np.uint32).view(np.int32).tolist()
+
+
+@benchmark("to_native.mesh", sizes=(1_000, 10_000, 40_000))
+def prepare_mesh_to_native(size: int) -> Tuple[Callable, list]:
+    from specklepy.objects.geometry import Mesh
+    from bpy_speckle.converter.to_native import meshes_to_native
+
+    vertices, quads, _ = grid(size)
+    faces = [value for quad in quads for value in [4, *quad]]
+    vertex_normals = [0.0, 0.0, 1.0] * (len(vertices) // 3)
+    mesh = Mesh(vertices=vertices, faces=faces, vertexNormals=vertex_normals, units="m")
+
+    return lambda: meshes_to_native(mesh, [mesh], "benchmark", 1.0), []
+
+
+@benchmark("to_native.polyline", sizes=(1_000, 10_000, 100_000))
+def prepare_polyline_to_native(size: int) -> Tuple[Callable, list]:
+    from specklepy.objects.geometry import Polyline
+    from bpy_speckle.converter.to_native import polyline_to_native
+
+    polyline = Polyline(value=helix(size), units="m")
+
+    return lambda: polyline_to_native(polyline, "benchmark", "benchmark"), []
+
+
+@benchmark("to_native.curve", sizes=(1_000, 10_000, 100_000))
+def prepare_curve_to_native(size: int) -> Tuple[Callable, list]:
+    from specklepy.objects.geometry import Curve, Polyline
+    from bpy_speckle.converter.to_native import curve_to_native
+
+    points = helix(size)
+    degree = 3
+    curve = Curve(
+        degree=degree,
+        periodic=False,
+        rational=False,
+        points=points,
+        weights=[1.0] * size,
+        knots=[0.0] * degree
+        + list(range(size - degree + 1))
+        + [size - degree] * degree,
+        closed=False,
+        displayValue=Polyline(value=points, units="m"),
+        units="m",
+        bbox=None,
+    )
+
+    return lambda: curve_to_native(curve, "benchmark", "benchmark"), []
+
+
+@benchmark("to_native.pointcloud", sizes=(10_000, 100_000, 1_000_000))
+def prepare_pointcloud_to_native(size: int) -> Tuple[Callable, list]:
+    import numpy as np
+    from bpy_speckle.converter.to_native import pointcloud_to_native
+    from bpy_speckle.converter.utils import Pointcloud
+
+    rng = np.random.default_rng(0)
+    pointcloud = Pointcloud(
+        points=rng.random(size * 3).tolist(),
+        colors=random_colors(size),
+        sizes=rng.random(size).tolist(),
+        units="m",
+    )
+
+    return lambda: pointcloud_to_native(pointcloud, "benchmark", "benchmark"), []
+
+
+@benchmark("to_native.merged_points", sizes=(1_000, 10_000, 50_000))
+def prepare_merged_points_to_native(size: int) -> Tuple[Callable, list]:
+    import numpy as np
+    from specklepy.objects.geometry import Point
+    from bpy_speckle.converter.to_native import points_to_merged_native
+
+    rng = np.random.default_rng(0)
+    points = [
+        Point(x=x, y=y, z=z, units="m", applicationId=f"point-{i}")
+        for i, (x, y, z) in enumerate(rng.random((size, 3)).tolist())
+    ]
+
+    return lambda: points_to_merged_native(points, "benchmark", "benchmark"), []
+
+
+@benchmark("to_native.merged_curves", sizes=(100, 1_000, 10_000))
+def prepare_merged_curves_to_native(size: int) -> Tuple[Callable, list]:
+    from specklepy.objects.geometry import Circle, Line, Plane, Point, Vector
+    from bpy_speckle.converter.to_native import curves_to_merged_native
+
+    # alternating lines and circles, the two cheapest and most common segments
+    curves: List[Any] = []
+    for i in range(size):
+        origin = Point(x=float(i), y=0.0, z=0.0, units="m")
+        if i % 2:
+            curves.append(
+                Line(
+                    start=origin,
+                    end=Point(x=float(i), y=1.0, z=0.0, units="m"),
+                    units="m",
+                )
+            )
+        else:
+            plane = Plane(
+                origin=origin,
+                normal=Vector(x=0.0, y=0.0, z=1.0, units="m"),
+                xdir=Vector(x=1.0, y=0.0, z=0.0, units="m"),
+                ydir=Vector(x=0.0, y=1.0, z=0.0, units="m"),
+                units="m",
+            )
+            curves.append(Circle(plane=plane, center=origin, radius=0.4, units="m"))
+
+    return lambda: curves_to_merged_native(curves, "benchmark", "benchmark"), []
+
+
+@benchmark("to_speckle.mesh", sizes=(1_000, 5_000, 20_000))
+def prepare_mesh_to_speckle(size: int) -> Tuple[Callable, list]:
+    import bpy
+    import numpy as np
+    from bpy_speckle.converter.to_speckle.mesh_to_speckle import (
+        mesh_to_speckle_meshes,
+    )
+
+    vertices, quads, side = grid(size)
+    mesh = bpy.data.meshes.new("benchmark")
+    mesh.from_pydata(np.reshape(vertices, (-1, 3)).tolist(), [], quads)
+    mesh.update()
+
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    corners = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", corners)
+    uvs = np.reshape(vertices, (-1, 3))[corners, :2] / side
+    uv_layer.data.foreach_set("uv", uvs.astype(np.float32).ravel())
+
+    blender_object = bpy.data.objects.new("benchmark", mesh)
+
+    return (
+        lambda: mesh_to_speckle_meshes(blender_object, mesh, 1.0, "m"),
+        [blender_object],
+    )
+
+
+@benchmark("to_speckle.pointcloud", sizes=(10_000, 100_000, 1_000_000))
+def prepare_pointcloud_to_speckle(size: int) -> Tuple[Callable, list]:
+    import bpy
+    import numpy as np
+    from bpy_speckle.converter.to_speckle.point_to_speckle import (
+        mesh_to_speckle_pointcloud,
+    )
+
+    rng = np.random.default_rng(0)
+    mesh = bpy.data.meshes.new("benchmark")
+    mesh.vertices.add(size)
+    mesh.vertices.foreach_set("co", rng.random(size * 3).astype(np.float32))
+
+    color_attribute = mesh.color_attributes.new("Color", "FLOAT_COLOR", "POINT")
+    color_attribute.data.foreach_set(
+        "color_srgb", rng.random(size * 4).astype(np.float32)
+    )
+    mesh.color_attributes.active_color = color_attribute
+
+    radius_attribute = mesh.attributes.new("radius", "FLOAT", "POINT")
+    radius_attribute.data.foreach_set("value", rng.random(size).astype(np.float32))
+    mesh.update()
+
+    blender_object = bpy.data.objects.new("benchmark", mesh)
+
+    return (
+        lambda: mesh_to_speckle_pointcloud(blender_object, mesh, 1.0, "m"),
+        [blender_object],
+    )
+
+
+def curve_object(spline_type: str, point_count: int) -> Any:
+    """
+    a curve object with a single bezier or NURBS spline following a helix
+    """
+    import bpy
+    import numpy as np
+
+    co = np.reshape(helix(point_count), (-1, 3)).astype(np.float32)
+    curve = bpy.data.curves.new("benchmark", type="CURVE")
+    curve.dimensions = "3D"
+    spline = curve.splines.new(spline_type)
+
+    if spline_type == "BEZIER":
+        spline.bezier_points.add(point_count - 1)
+        tangent = np.gradient(co, axis=0) / 3
+        spline.bezier_points.foreach_set("co", co.ravel())
+        spline.bezier_points.foreach_set("handle_left", (co - tangent).ravel())
+        spline.bezier_points.foreach_set("handle_right", (co + tangent).ravel())
+    else:
+        spline.points.add(point_count - 1)
+        weighted = np.ones((point_count, 4), dtype=np.float32)
+        weighted[:, :3] = co
+        spline.points.foreach_set("co", weighted.ravel())
+        spline.order_u = 4
+        spline.use_endpoint_u = True
+
+    return bpy.data.objects.new("benchmark", curve)
+
+
+@benchmark("to_speckle.bezier_curve", sizes=(100, 1_000, 10_000))
+def prepare_bezier_to_speckle(size: int) -> Tuple[Callable, list]:
+    from bpy_speckle.converter.to_speckle.curve_to_speckle import curve_to_speckle
+
+    blender_object = curve_object("BEZIER", size)
+
+    return lambda: curve_to_speckle(blender_object), [blender_object]
+
+
+@benchmark("to_speckle.nurbs_curve", sizes=(100, 1_000, 10_000))
+def prepare_nurbs_to_speckle(size: int) -> Tuple[Callable, list]:
+    from bpy_speckle.converter.to_speckle.curve_to_speckle import curve_to_speckle
+
+    blender_object = curve_object("NURBS", size)
+
+    return lambda: curve_to_speckle(blender_object), [blender_object]
+
+
+def measure(run: Callable, repeat: int, warmup: int) -> Dict[str, Any]:
+    """
+    times run, blender data it returns is removed between the runs
+    """
+    timings: List[float] = []
+    for index in range(warmup + repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = run()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+
+        remove_blender_data(result if isinstance(result, list) else [result])
+        if index >= warmup:
+            timings.append(elapsed)
+
+    return {
+        "runs": len(timings),
+        "min_seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "max_seconds": max(timings),
+    }
+
+
+def run_benchmarks(
+    names: List[str], repeat: int, warmup: int, largest: Optional[int]
+) -> List[Dict[str, Any]]:
+    results = []
+    for name in names:
+        sizes, prepare = CASES[name]
+        for size in sizes[:largest]:
+            run, inputs = prepare(size)
+            try:
+                timing = measure(run, repeat, warmup)
+            finally:
+                remove_blender_data(inputs)
+
+            results.append({"name": name, "size": size, **timing})
+            print(
+                f"{name:<28} {size:>9}  median {timing['median_seconds'] * 1000:10.2f} ms"
+                f"  min {timing['min_seconds'] * 1000:10.2f} ms",
+                flush=True,
+            )
+    return results
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    compares the median times with the baseline, returns the regressions
+    """
+    baseline_results = {
+        (result["name"], result["size"]): result for result in baseline["results"]
+    }
+
+    regressions = []
+    print(f"\ncompared with the {baseline['environment']['backend']} baseline")
+    for result in results:
+        key = (result["name"], result["size"])
+        if key not in baseline_results:
+            print(f"{key[0]:<28} {key[1]:>9}  not in baseline")
+            continue
+
+        ratio = result["median_seconds"] / baseline_results[key]["median_seconds"]
+        if ratio > 1 + threshold:
+            status = "SLOWER"
+            regressions.append({**result, "baseline_ratio": ratio})
+        elif ratio < 1 / (1 + threshold):
+            status = "faster"
+        else:
+            status = "same"
+        print(f"{key[0]:<28} {key[1]:>9}  {ratio:6.2f}x  {status}")
+
+    return regressions
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--case",
+        action="append",
+        help="only run the cases whose name contains this, can be repeated",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per size")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per size")
+    parser.add_argument(
+        "--quick", action="store_true", help="only run the smallest size of each case"
+    )
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown of the median that counts as a regression",
+    )
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (sizes, _) in CASES.items():
+            print(f"{name:<28} {', '.join(str(size) for size in sizes)}")
+        return 0
+
+    names = [
+        name
+        for name in CASES
+        if not args.case or any(pattern in name for pattern in args.case)
+    ]
+    if not names:
+        parser.error(f"no case matches {args.case}")
+
+    backend = load_converters()
+
+    import numpy
+    import specklepy
+
+    environment = {
+        "backend": backend,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": numpy.__version__,
+        "specklepy": getattr(specklepy, "__version__", "unknown"),
+    }
+    print(f"converter benchmarks on {backend}, {args.repeat} runs per size\n")
+
+    results = run_benchmarks(names, args.repeat, args.warmup, 1 if args.quick else None)
+    report = {
+        "environment": environment,
+        "settings": {"repeat": args.repeat, "warmup": args.warmup},
+        "results": results,
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+    if not args.baseline:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["environment"]["backend"] != backend:
+        print(
+            f"\nwarning: the baseline was measured on {baseline['environment']['backend']}"
+        )
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # Blender passes the script's own arguments after "--"
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
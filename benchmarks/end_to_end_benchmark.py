@@ -0,0 +1,520 @@
+"""
+Times whole loads and publishes against an in-process fake Speckle server
+
+Synthetic models from model_generator.py are put on the server in fake_server.py,
+then load_operation receives and converts them and publish_operation sends the
+loaded objects back. Each run reports the wall time, the requests and bytes per
+endpoint, the phases the operation recorded and the peak python memory of one
+extra traced run. --profile-conversions adds the per type conversion profile:
+
+    python benchmarks/end_to_end_benchmark.py --preset small --preset medium
+    python benchmarks/end_to_end_benchmark.py --latency 0.05 --bandwidth 10
+    blender --background --factory-startup --python-exit-code 1 \\
+        --python benchmarks/end_to_end_benchmark.py -- --output results.json
+
+The server runs in the same process, so its own work counts towards the wall time
+like a local server's would. Peak memory comes from tracemalloc and only covers
+python and numpy allocations, not Blender's, the peak resident memory sampled by
+the operation covers everything. --memory-budget loads in memory budget mode.
+--scene-cache also times loads that write the converted model to the scene cache,
+then loads appended from it instead of converted.
+--baseline and --threshold compare median times like in converter_benchmark.py.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from converter_benchmark import compare, load_converters  # noqa: E402
+from fake_server import FakeSpeckleServer  # noqa: E402
+
+ACCOUNT_ID = "benchmark-account"
+ACCOUNT_TOKEN = "benchmark-token"
+
+# bpy.data collections whose new data-blocks are removed after every load
+DATA_COLLECTIONS = (
+    "objects",
+    "meshes",
+    "curves",
+    "collections",
+    "materials",
+    "node_groups",
+)
+
+
+def register_account(server: FakeSpeckleServer) -> Any:
+    """
+    adds an account for the fake server to the local accounts and pools a client
+    for it that talks plain http, the add-on always connects with https
+    """
+    from specklepy.core.api.client import SpeckleClient
+    from specklepy.core.api.credentials import Account
+    from specklepy.core.helpers import speckle_path_provider
+
+    from bpy_speckle.connector.utils import account_manager
+
+    account = Account.model_validate(
+        {
+            "id": ACCOUNT_ID,
+            "token": ACCOUNT_TOKEN,
+            "isDefault": True,
+            "serverInfo": {"name": "Fake Speckle Server", "url": server.url},
+            "userInfo": {
+                "id": "benchmark-user",
+                "name": "Benchmark User",
+                "email": "benchmark@example.com",
+            },
+        }
+    )
+    accounts_folder = speckle_path_provider.accounts_folder_path()
+    (accounts_folder / f"{ACCOUNT_ID}.json").write_text(account.model_dump_json())
+    account_manager.invalidate_account_registry()
+
+    client = SpeckleClient(host=server.url, use_ssl=False)
+    client.authenticate_with_account(account)
+    key = (account.id, account.serverInfo.url, threading.get_ident())
+    account_manager._client_pool[key] = (account.token, client)
+    return account
+
+
+def clear_local_cache() -> None:
+    """
+    removes the local object cache, so every load downloads all objects
+    """
+    from specklepy.transports.sqlite import SQLiteTransport
+
+    base_path = Path(SQLiteTransport.get_base_path("Speckle"))
+    for name in ("Objects.db", "Objects.db-wal", "Objects.db-shm"):
+        try:
+            (base_path / name).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def serialize_model(root: Any) -> Tuple[str, Dict[str, str]]:
+    """
+    returns the root id and the serialized objects of a model
+    """
+    from specklepy.core.api import operations
+    from specklepy.transports.memory import MemoryTransport
+
+    memory = MemoryTransport()
+    root_id = operations.send(root, [memory], use_default_cache=False)
+    return root_id, memory.objects
+
+
+def load_models(presets: List[str], paths: List[Path]) -> List[Tuple[str, str, dict]]:
+    """
+    returns the label, root id and serialized objects of every model to benchmark
+    """
+    from model_generator import PRESETS, generate_model, open_model
+
+    models = []
+    for preset in presets:
+        root_id, objects = serialize_model(generate_model(PRESETS[preset]))
+        models.append((preset, root_id, objects))
+
+    for path in paths:
+        root_id, transport = open_model(path)
+        if hasattr(transport, "get_all_objects"):
+            objects = dict(transport.get_all_objects())
+            transport.close()
+        else:
+            objects = transport.objects
+        models.append((path.stem, root_id, objects))
+
+    return models
+
+
+def benchmark_context(**selection: str) -> SimpleNamespace:
+    """
+    the parts of bpy.context the operations use, with the selection made in the UI
+    """
+    import bpy
+
+    window_manager = SimpleNamespace(
+        selected_account_id=ACCOUNT_ID,
+        progress_begin=lambda *args: None,
+        progress_update=lambda *args: None,
+        progress_end=lambda *args: None,
+        **{f"selected_{name}": value for name, value in selection.items()},
+    )
+    return SimpleNamespace(
+        window_manager=window_manager,
+        scene=bpy.context.scene,
+        screen=SimpleNamespace(areas=[]),
+    )
+
+
+def snapshot_blender_data() -> Dict[str, set]:
+    import bpy
+
+    return {name: set(getattr(bpy.data, name)) for name in DATA_COLLECTIONS}
+
+
+def remove_blender_data_since(snapshot: Dict[str, set]) -> None:
+    """
+    removes the data-blocks created after the snapshot was taken
+    """
+    import bpy
+
+    scene_children = bpy.context.scene.collection.children
+    for child in list(scene_children):
+        if child not in snapshot["collections"]:
+            scene_children.unlink(child)
+
+    for name in DATA_COLLECTIONS:
+        data_collection = getattr(bpy.data, name)
+        for data_block in list(data_collection):
+            if data_block not in snapshot[name]:
+                data_collection.remove(data_block)
+
+
+def measure(
+    run: Callable[[], Any],
+    teardown: Callable[[Any], None],
+    server: FakeSpeckleServer,
+    repeat: int,
+    warmup: int,
+    trace_memory: bool,
+) -> Dict[str, Any]:
+    """
+    times run, teardown gets what it returned after every run
+    requests are those of the last timed run, peak memory comes from an extra run
+    """
+    timings: List[float] = []
+    for index in range(warmup + repeat):
+        gc.collect()
+        server.reset_stats()
+        start = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start
+        teardown(result)
+        if index >= warmup:
+            timings.append(elapsed)
+
+    from bpy_speckle.connector.utils.operation_timings import get_last_summary
+
+    endpoints = server.stats()
+    summary = get_last_summary()
+    measurement: Dict[str, Any] = {
+        "runs": len(timings),
+        "min_seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "max_seconds": max(timings),
+        "requests": sum(stats["requests"] for stats in endpoints.values()),
+        "bytes_received": sum(stats["received"] for stats in endpoints.values()),
+        "bytes_sent": sum(stats["sent"] for stats in endpoints.values()),
+        "endpoints": endpoints,
+        # recorded by the operation itself during the last timed run
+        "phases": summary["phases"] if summary else [],
+        "peak_rss_bytes": summary["rss_peak"] if summary else None,
+    }
+    if summary and summary.get("conversions"):
+        measurement["conversions"] = summary["conversions"]
+
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = run()
+            measurement["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        teardown(result)
+
+    return measurement
+
+
+def benchmark_model(
+    server: FakeSpeckleServer,
+    label: str,
+    root_id: str,
+    objects: Dict[str, str],
+    args: argparse.Namespace,
+) -> List[Dict[str, Any]]:
+    """
+    benchmarks loading the model and publishing what was loaded
+    """
+    import bpy
+
+    from bpy_speckle.connector.operations import load_operation, publish_operation
+    from bpy_speckle.connector.utils.memory_budget import MemoryBudget
+
+    project_id = server.add_project(f"{label} model")
+    model_id = server.add_model(project_id, label)
+    server.add_objects(project_id, objects)
+    version_id = server.add_version(project_id, model_id, root_id)
+
+    context = benchmark_context(
+        project_id=project_id,
+        model_id=model_id,
+        model_name=label,
+        version_id=version_id,
+    )
+
+    def load() -> Dict[str, set]:
+        clear_local_cache()
+        snapshot = snapshot_blender_data()
+        memory_budget = None
+        if args.memory_budget is not None:
+            memory_budget = MemoryBudget(limit=int(args.memory_budget * 2**20))
+        if not load_operation(
+            context,
+            instance_loading_mode=args.instance_loading_mode,
+            memory_budget=memory_budget,
+        ):
+            raise RuntimeError(f"loading {label} failed")
+        if memory_budget is not None and memory_budget.message:
+            raise RuntimeError(memory_budget.message)
+        return snapshot
+
+    results = []
+    load_name = f"load.{label}"
+    if args.scene_cache:
+        from bpy_speckle.connector.utils import scene_cache
+
+        def load_and_cache() -> Dict[str, set]:
+            # every run converts the model and writes it to the cache again
+            scene_cache.clear()
+            return load()
+
+        timing = measure(
+            load_and_cache,
+            remove_blender_data_since,
+            server,
+            args.repeat,
+            args.warmup,
+            args.memory,
+        )
+        results.append({"name": f"{load_name}.write", "size": len(objects), **timing})
+        report(results[-1])
+
+        # the timed loads append the model the last run cached
+        load_name = f"load.{label}.cached"
+
+    timing = measure(
+        load,
+        remove_blender_data_since,
+        server,
+        args.repeat,
+        args.warmup,
+        args.memory,
+    )
+    results.append({"name": load_name, "size": len(objects), **timing})
+    report(results[-1])
+
+    if args.skip_publish:
+        return results
+
+    # publish what one more load brought in, each run to an empty project
+    snapshot = load()
+    loaded_objects = [obj for obj in bpy.data.objects if obj not in snapshot["objects"]]
+
+    def publish() -> None:
+        clear_local_cache()
+        publish_project_id = server.add_project(f"{label} publish")
+        context.window_manager.selected_project_id = publish_project_id
+        context.window_manager.selected_model_id = server.add_model(
+            publish_project_id, label
+        )
+        success, message, _ = publish_operation(context, loaded_objects)
+        if not success:
+            raise RuntimeError(message)
+
+    try:
+        timing = measure(
+            publish,
+            lambda _: None,
+            server,
+            args.repeat,
+            args.warmup,
+            args.memory,
+        )
+    finally:
+        remove_blender_data_since(snapshot)
+    results.append({"name": f"publish.{label}", "size": len(loaded_objects), **timing})
+    report(results[-1])
+
+    return results
+
+
+def report(result: Dict[str, Any]) -> None:
+    peak = result.get("peak_memory_bytes")
+    print(
+        f"{result['name']:<28} {result['size']:>9}"
+        f"  median {result['median_seconds'] * 1000:10.2f} ms"
+        f"  {result['requests']:>5} requests"
+        f"  {(result['bytes_received'] + result['bytes_sent']) / 1e6:8.2f} MB"
+        + (f"  peak {peak / 1e6:8.2f} MB" if peak is not None else ""),
+        flush=True,
+    )
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--preset",
+        action="append",
+        help="model_generator preset to benchmark, can be repeated "
+        "(default: small and medium)",
+    )
+    parser.add_argument(
+        "--model",
+        type=Path,
+        action="append",
+        default=[],
+        help="a .db or .json model written by model_generator.py, can be repeated",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per model")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per model")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added to every request"
+    )
+    parser.add_argument(
+        "--bandwidth", type=float, help="server bandwidth in MB/s (default: unlimited)"
+    )
+    parser.add_argument(
+        "--instance-loading-mode",
+        choices=("INSTANCE_PROXIES", "LINKED_DUPLICATES"),
+        default="INSTANCE_PROXIES",
+    )
+    parser.add_argument(
+        "--no-memory",
+        dest="memory",
+        action="store_false",
+        help="skip the traced run that measures peak memory",
+    )
+    parser.add_argument(
+        "--profile-conversions",
+        action="store_true",
+        help="record time, geometry and failures per converted type and object, "
+        "adds some overhead to the timings",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        metavar="MB",
+        help="load in memory budget mode with this budget, a run fails if it's hit",
+    )
+    parser.add_argument(
+        "--scene-cache",
+        action="store_true",
+        help="time loads from the scene cache, it's off otherwise",
+    )
+    parser.add_argument("--skip-publish", action="store_true")
+    parser.add_argument(
+        "--quick", action="store_true", help="one small model, one run, no warmup"
+    )
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown of the median that counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.preset, args.model, args.repeat, args.warmup = ["small"], [], 1, 0
+    elif args.preset is None:
+        args.preset = [] if args.model else ["small", "medium"]
+
+    backend = load_converters()
+
+    import numpy
+    import specklepy
+    from specklepy.core.helpers import speckle_path_provider
+    from specklepy.logging import metrics
+
+    from model_generator import PRESETS
+
+    unknown = [preset for preset in args.preset if preset not in PRESETS]
+    if unknown:
+        parser.error(f"unknown preset {unknown}, pick from {list(PRESETS)}")
+
+    metrics.disable()
+
+    from bpy_speckle.connector.utils import scene_cache
+
+    # every run converts, unless the cache is what's benchmarked
+    scene_cache.set_enabled(args.scene_cache)
+
+    if args.profile_conversions:
+        from bpy_speckle.converter import profiler
+
+        profiler.set_enabled(True)
+
+    environment = {
+        "backend": backend,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": numpy.__version__,
+        "specklepy": getattr(specklepy, "__version__", "unknown"),
+    }
+    settings = {
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "latency": args.latency,
+        "bandwidth": args.bandwidth,
+        "instance_loading_mode": args.instance_loading_mode,
+        "profile_conversions": args.profile_conversions,
+        "memory_budget": args.memory_budget,
+        "scene_cache": args.scene_cache,
+    }
+
+    models = load_models(args.preset, args.model)
+    print(f"end to end benchmarks on {backend}, {args.repeat} runs per model\n")
+
+    results = []
+    # accounts and the object cache live in a throwaway user data folder
+    with tempfile.TemporaryDirectory() as user_data:
+        speckle_path_provider.override_application_data_path(user_data)
+        bandwidth = args.bandwidth * 1e6 if args.bandwidth else None
+        try:
+            with FakeSpeckleServer(args.latency, bandwidth) as server:
+                register_account(server)
+                for label, root_id, objects in models:
+                    results.extend(
+                        benchmark_model(server, label, root_id, objects, args)
+                    )
+        finally:
+            speckle_path_provider.override_application_data_path(None)
+
+    report_data = {"environment": environment, "settings": settings, "results": results}
+    if args.output:
+        args.output.write_text(json.dumps(report_data, indent=2))
+
+    if not args.baseline:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["environment"]["backend"] != backend:
+        print(
+            f"\nwarning: the baseline was measured on {baseline['environment']['backend']}"
+        )
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # Blender passes the script's own arguments after "--"
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
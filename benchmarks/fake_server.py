@@ -0,0 +1,412 @@
+"""
+An in-process stand-in for a Speckle server, for end to end benchmarks
+
+Serves the GraphQL operations the connector sends to load and publish versions
+(active user, server info, project, model and version queries, version create)
+and the object endpoints ServerTransport uses to download and upload objects.
+Every request can be slowed down by a fixed latency and a bandwidth limit, and
+the requests and bytes of each endpoint are counted:
+
+    with FakeSpeckleServer(latency=0.05, bandwidth=10_000_000) as server:
+        project_id = server.add_project()
+        model_id = server.add_model(project_id)
+        server.add_objects(project_id, objects)
+        version_id = server.add_version(project_id, model_id, root_id)
+        ...
+        print(server.stats())
+"""
+
+import gzip
+import itertools
+import json
+import re
+import threading
+import time
+import traceback
+from datetime import datetime, timezone
+from email import policy
+from email.parser import BytesParser
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+SERVER_VERSION = "2.25.0"
+
+# bytes written per throttled chunk of a response
+CHUNK_SIZE = 64 * 1024
+
+USER = {
+    "id": "benchmark-user",
+    "email": "benchmark@example.com",
+    "name": "Benchmark User",
+    "bio": None,
+    "company": None,
+    "avatar": None,
+    "verified": True,
+    "role": "server:user",
+}
+
+OPERATION_NAME = re.compile(r"\b(?:query|mutation)\s+(\w+)")
+
+
+def timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class FakeSpeckleServer:
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        latency is added to every request in seconds, bandwidth limits request and
+        response bodies in bytes per second, None for unlimited
+        """
+        self.latency = latency
+        self.bandwidth = bandwidth
+
+        # project id -> object id -> serialized object
+        self.objects: Dict[str, Dict[str, str]] = {}
+        self.projects: Dict[str, Dict[str, Any]] = {}
+        self.models: Dict[str, Dict[str, Any]] = {}
+        self.versions: Dict[str, Dict[str, Any]] = {}
+
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        # endpoint -> requests, bytes received, bytes sent
+        self._stats: Dict[str, List[int]] = {}
+
+        self._http = ThreadingHTTPServer((host, port), _RequestHandler)
+        self._http.daemon_threads = True
+        self._http.speckle = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._http.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeSpeckleServer":
+        self._thread = threading.Thread(target=self._http.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._http.shutdown()
+        self._http.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FakeSpeckleServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def new_id(self, prefix: str) -> str:
+        with self._lock:
+            return f"{prefix}{next(self._ids):08d}"
+
+    def add_objects(self, project_id: str, objects: Dict[str, str]) -> None:
+        """
+        adds serialized objects by id to the project
+        """
+        with self._lock:
+            self.objects.setdefault(project_id, {}).update(objects)
+
+    def add_project(self, name: str = "Benchmark Project") -> str:
+        project_id = self.new_id("project")
+        now = timestamp()
+        self.projects[project_id] = {
+            "allowPublicComments": False,
+            "createdAt": now,
+            "description": None,
+            "id": project_id,
+            "name": name,
+            "role": "stream:owner",
+            "sourceApps": [],
+            "updatedAt": now,
+            "visibility": "PRIVATE",
+            "workspaceId": None,
+        }
+        return project_id
+
+    def add_model(self, project_id: str, name: str = "Benchmark Model") -> str:
+        model_id = self.new_id("model")
+        now = timestamp()
+        self.models[model_id] = {
+            "id": model_id,
+            "projectId": project_id,
+            "name": name,
+            "displayName": name,
+            "description": None,
+            "previewUrl": None,
+            "createdAt": now,
+            "updatedAt": now,
+            "author": USER,
+        }
+        return model_id
+
+    def add_version(
+        self,
+        project_id: str,
+        model_id: str,
+        object_id: str,
+        message: str = "",
+        source_application: str = "blender",
+    ) -> str:
+        version_id = self.new_id("version")
+        self.versions[version_id] = {
+            "id": version_id,
+            "projectId": project_id,
+            "modelId": model_id,
+            "referencedObject": object_id,
+            "message": message,
+            "sourceApplication": source_application,
+            "createdAt": timestamp(),
+            "previewUrl": f"{self.url}/preview/{project_id}/{version_id}",
+            "authorUser": USER,
+        }
+        return version_id
+
+    def count(self, endpoint: str, received: int, sent: int) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, [0, 0, 0])
+            stats[0] += 1
+            stats[1] += received
+            stats[2] += sent
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        requests, bytes received and bytes sent per endpoint
+        """
+        with self._lock:
+            return {
+                endpoint: {"requests": requests, "received": received, "sent": sent}
+                for endpoint, (requests, received, sent) in sorted(self._stats.items())
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def throttle(self, size: int) -> None:
+        """
+        waits as long as moving size bytes takes at the configured bandwidth
+        """
+        if self.bandwidth:
+            time.sleep(size / self.bandwidth)
+
+    def graphql(self, request: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        answers a GraphQL request, returns the operation name and the response
+        """
+        query = request.get("query", "")
+        variables = request.get("variables") or {}
+        match = OPERATION_NAME.search(query)
+        operation = request.get("operationName") or (match[1] if match else "")
+
+        try:
+            data = self.resolve(operation, query, variables)
+        except KeyError as ex:
+            return operation, {"errors": [{"message": f"{ex.args[0]} not found"}]}
+        if data is None:
+            message = f"{operation or 'anonymous'} is not supported by the fake server"
+            return operation, {"errors": [{"message": message}]}
+        return operation, {"data": data}
+
+    def resolve(
+        self, operation: str, query: str, variables: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        if operation == "User" and "activeUser" in query and "limit" not in variables:
+            return {"data": USER}
+
+        if operation == "Server":
+            return {
+                "serverInfo": {
+                    "name": "Fake Speckle Server",
+                    "company": None,
+                    "description": "in-process server for benchmarks",
+                    "adminContact": None,
+                    "canonicalUrl": self.url,
+                    "version": SERVER_VERSION,
+                    "scopes": [],
+                    "authStrategies": [],
+                    "workspaces": {"workspacesEnabled": False},
+                }
+            }
+
+        if operation == "Project":
+            return {"data": self.project(variables["projectId"])}
+
+        if operation == "ModelGet":
+            self.project(variables["projectId"])
+            return {"data": {"data": self.model(variables["modelId"])}}
+
+        if operation == "VersionGet":
+            self.project(variables["projectId"])
+            return {"data": {"data": self.version(variables["versionId"])}}
+
+        if operation == "Create" and "versionMutations" in query:
+            version_input = variables["input"]
+            self.project(version_input["projectId"])
+            self.model(version_input["modelId"])
+            version_id = self.add_version(
+                version_input["projectId"],
+                version_input["modelId"],
+                version_input["objectId"],
+                version_input.get("message") or "",
+                version_input.get("sourceApplication") or "",
+            )
+            return {"data": {"data": self.version(version_id)}}
+
+        return None
+
+    def project(self, project_id: str) -> Dict[str, Any]:
+        if project_id not in self.projects:
+            raise KeyError(f"project {project_id}")
+        return self.projects[project_id]
+
+    def model(self, model_id: str) -> Dict[str, Any]:
+        if model_id not in self.models:
+            raise KeyError(f"model {model_id}")
+        return {
+            key: value
+            for key, value in self.models[model_id].items()
+            if key != "projectId"
+        }
+
+    def version(self, version_id: str) -> Dict[str, Any]:
+        if version_id not in self.versions:
+            raise KeyError(f"version {version_id}")
+        return {
+            key: value
+            for key, value in self.versions[version_id].items()
+            if key not in ("projectId", "modelId")
+        }
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    # keeps the connections of a requests session open
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def speckle(self) -> FakeSpeckleServer:
+        return self.server.speckle
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.handle_request("GET")
+
+    def do_POST(self) -> None:
+        self.handle_request("POST")
+
+    def handle_request(self, method: str) -> None:
+        time.sleep(self.speckle.latency)
+
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.speckle.throttle(len(body))
+
+        path = urlsplit(self.path).path.rstrip("/").split("/")[1:]
+        try:
+            endpoint, status, content_type, response = self.route(method, path, body)
+        except Exception:
+            # the client reports the status and the start of the body
+            endpoint = f"{method} failed"
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+            content_type = "text/plain"
+            response = traceback.format_exc().encode()
+
+        sent = self.respond(status, content_type, response)
+        self.speckle.count(endpoint, len(body), sent)
+
+    def route(
+        self, method: str, path: List[str], body: bytes
+    ) -> Tuple[str, int, str, bytes]:
+        """
+        returns the endpoint name, status, content type and body of the response
+        """
+        if method == "POST" and path == ["graphql"]:
+            operation, response = self.speckle.graphql(json.loads(body))
+            return (
+                f"graphql {operation}",
+                HTTPStatus.OK,
+                "application/json",
+                json.dumps(response).encode(),
+            )
+
+        # GET /objects/{project}/{object}/single
+        if method == "GET" and len(path) == 4 and path[::3] == ["objects", "single"]:
+            serialized = self.speckle.objects.get(path[1], {}).get(path[2])
+            if serialized is None:
+                return "objects single", HTTPStatus.NOT_FOUND, "text/plain", b""
+            return "objects single", HTTPStatus.OK, "text/plain", serialized.encode()
+
+        # POST /api/getobjects/{project}
+        if method == "POST" and len(path) == 3 and path[:2] == ["api", "getobjects"]:
+            object_ids = json.loads(self.form(body)["objects"])
+            objects = self.speckle.objects.get(path[2], {})
+            lines = "".join(
+                f"{object_id}\t{objects[object_id]}\n"
+                for object_id in object_ids
+                if object_id in objects
+            )
+            return "objects download", HTTPStatus.OK, "text/plain", lines.encode()
+
+        # POST /api/diff/{project}
+        if method == "POST" and len(path) == 3 and path[:2] == ["api", "diff"]:
+            object_ids = json.loads(self.form(body)["objects"])
+            objects = self.speckle.objects.get(path[2], {})
+            found = {object_id: object_id in objects for object_id in object_ids}
+            return (
+                "objects diff",
+                HTTPStatus.OK,
+                "application/json",
+                json.dumps(found).encode(),
+            )
+
+        # POST /objects/{project}
+        if method == "POST" and len(path) == 2 and path[0] == "objects":
+            self.speckle.add_objects(path[1], self.uploaded_objects(body))
+            return "objects upload", HTTPStatus.CREATED, "text/plain", b""
+
+        return f"{method} unknown", HTTPStatus.NOT_FOUND, "text/plain", b""
+
+    def form(self, body: bytes) -> Dict[str, str]:
+        return {key: values[0] for key, values in parse_qs(body.decode()).items()}
+
+    def uploaded_objects(self, body: bytes) -> Dict[str, str]:
+        """
+        reads the gzipped object batches of a multipart upload
+        """
+        header = f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode()
+        message = BytesParser(policy=policy.default).parsebytes(header + body)
+
+        objects = {}
+        for part in message.iter_parts():
+            batch = part.get_payload(decode=True)
+            if part.get_content_type() == "application/gzip":
+                batch = gzip.decompress(batch)
+            for speckle_object in json.loads(batch):
+                objects[speckle_object["id"]] = json.dumps(speckle_object)
+        return objects
+
+    def respond(self, status: int, content_type: str, body: bytes) -> int:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        # written in chunks so throttled downloads stream like a slow connection
+        for start in range(0, len(body), CHUNK_SIZE):
+            chunk = body[start : start + CHUNK_SIZE]
+            self.speckle.throttle(len(chunk))
+            self.wfile.write(chunk)
+        return len(body)
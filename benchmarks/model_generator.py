@@ -0,0 +1,463 @@
+"""
+Generates synthetic Speckle models of a chosen size for offline benchmarks
+
+The model is a tree of nested collections whose leaves hold DataObjects with mesh
+display values, bare meshes, every curve type convert_to_native handles, points
+and instances of nested instance definitions, plus render material proxies.
+The same spec and seed always give the same objects and ids.
+
+    python benchmarks/model_generator.py --preset medium --output model.db
+    python benchmarks/model_generator.py --preset small --output model.json
+
+.db files are written with specklepy's SQLiteTransport, with the root id in a
+.manifest.json next to them, .json files hold the root id and all the objects.
+read_model loads either of them back like load_operation receives a version.
+"""
+
+import argparse
+import json
+import math
+import sys
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from specklepy.core.api import operations
+from specklepy.objects import Base, DataObject
+from specklepy.objects.geometry import (
+    Arc,
+    Circle,
+    Curve,
+    Ellipse,
+    Line,
+    Mesh,
+    Plane,
+    Point,
+    Polycurve,
+    Polyline,
+    Vector,
+)
+from specklepy.objects.models.collections.collection import Collection
+from specklepy.objects.other import RenderMaterial
+from specklepy.objects.proxies import (
+    InstanceDefinitionProxy,
+    InstanceProxy,
+    RenderMaterialProxy,
+)
+from specklepy.transports.memory import MemoryTransport
+from specklepy.transports.sqlite import SQLiteTransport
+
+UNITS = "m"
+
+# leaf collections cycle through these, in this order
+OBJECT_KINDS = (
+    "data_object",
+    "mesh",
+    "line",
+    "polyline",
+    "arc",
+    "circle",
+    "ellipse",
+    "curve",
+    "polycurve",
+    "point",
+)
+
+
+@dataclass
+class ModelSpec:
+    """
+    size of a synthetic model, counts are per parent
+    """
+
+    collection_depth: int = 2
+    collections_per_level: int = 3
+    objects_per_collection: int = 20
+    meshes_per_object: int = 2
+    mesh_vertices: int = 200
+    mesh_faces: int = 300
+    curve_points: int = 50
+    materials: int = 4
+    instance_definitions: int = 2
+    instance_depth: int = 2
+    instances_per_collection: int = 2
+    seed: int = 0
+
+
+PRESETS: Dict[str, ModelSpec] = {
+    "small": ModelSpec(collection_depth=1, objects_per_collection=10),
+    "medium": ModelSpec(),
+    "large": ModelSpec(
+        collection_depth=3,
+        collections_per_level=4,
+        objects_per_collection=40,
+        mesh_vertices=1_000,
+        mesh_faces=1_800,
+        instance_definitions=4,
+        instance_depth=3,
+        instances_per_collection=4,
+    ),
+}
+
+
+def dotnet_object(object_type: type, **members: Any) -> Base:
+    """
+    builds an object with the member names the .NET connectors send, e.g.
+    definitionId instead of definition_id. it is a plain Base until it is read
+    back from a transport, where it becomes an object_type like server data does
+    """
+    speckle_object = Base.of_type(object_type.speckle_type)
+    for name, value in members.items():
+        speckle_object[name] = value
+    return speckle_object
+
+
+class ModelGenerator:
+    def __init__(self, spec: ModelSpec) -> None:
+        self.spec = spec
+        self.rng = np.random.default_rng(spec.seed)
+        self._counts: Dict[str, int] = {}
+        # applicationIds of all meshes, assigned to the materials at the end
+        self._mesh_ids: List[str] = []
+        # root elements holding the objects of the instance definitions
+        self._definition_objects: List[Base] = []
+
+    def application_id(self, kind: str) -> str:
+        count = self._counts.get(kind, 0)
+        self._counts[kind] = count + 1
+        return f"synthetic-{kind}-{count}"
+
+    def generate(self) -> Collection:
+        definitions = self.instance_definitions()
+        top_definitions = [
+            definition for definition in definitions if definition.maxDepth == 0
+        ]
+
+        root = Collection(
+            name="Synthetic Model",
+            elements=self.collections(1, top_definitions),
+            applicationId=self.application_id("collection"),
+        )
+        root.elements.extend(self._definition_objects)
+
+        root["instanceDefinitionProxies"] = definitions
+        root["renderMaterialProxies"] = self.render_material_proxies()
+        return root
+
+    def collections(self, level: int, definitions: List[Base]) -> List[Base]:
+        spec = self.spec
+        collections = []
+        for index in range(spec.collections_per_level):
+            if level < spec.collection_depth:
+                elements = self.collections(level + 1, definitions)
+            else:
+                elements = self.leaf_elements(definitions)
+
+            collections.append(
+                Collection(
+                    name=f"Level {level} Collection {index}",
+                    elements=elements,
+                    applicationId=self.application_id("collection"),
+                )
+            )
+        return collections
+
+    def leaf_elements(self, definitions: List[Base]) -> List[Base]:
+        offset = self.rng.uniform(-100.0, 100.0, 3)
+        elements = [
+            self.element(OBJECT_KINDS[index % len(OBJECT_KINDS)], offset)
+            for index in range(self.spec.objects_per_collection)
+        ]
+
+        for index in range(self.spec.instances_per_collection if definitions else 0):
+            definition = definitions[index % len(definitions)]
+            elements.append(
+                self.instance(definition.applicationId, 0, offset + index * 5.0)
+            )
+        return elements
+
+    def element(self, kind: str, offset: np.ndarray) -> Base:
+        if kind == "data_object":
+            return DataObject(
+                name=f"Data Object {self._counts.get('data_object', 0)}",
+                properties={"category": "Synthetic", "seed": self.spec.seed},
+                displayValue=[
+                    self.mesh(offset) for _ in range(self.spec.meshes_per_object)
+                ],
+                applicationId=self.application_id("data_object"),
+            )
+        if kind == "mesh":
+            return self.mesh(offset)
+        if kind == "point":
+            x, y, z = (offset + self.rng.uniform(-5.0, 5.0, 3)).tolist()
+            return Point(
+                x=x, y=y, z=z, units=UNITS, applicationId=self.application_id(kind)
+            )
+
+        curve = getattr(self, kind)(offset + self.rng.uniform(-5.0, 5.0, 3))
+        curve.applicationId = self.application_id(kind)
+        return curve
+
+    def mesh(self, offset: np.ndarray) -> Mesh:
+        """
+        a wavy strip of triangles with the spec's vertex and face count
+        """
+        vertex_count = max(self.spec.mesh_vertices, 3)
+        face_count = max(self.spec.mesh_faces, 1)
+
+        index = np.arange(vertex_count)
+        vertices = (
+            np.stack([index // 2, index % 2, np.sin(index * 0.1)], axis=1)
+            + offset
+            + self.rng.normal(0.0, 0.01, (vertex_count, 3))
+        )
+
+        first = np.arange(face_count) % (vertex_count - 2)
+        faces = np.stack([np.full(face_count, 3), first, first + 1, first + 2], axis=1)
+
+        application_id = self.application_id("mesh")
+        self._mesh_ids.append(application_id)
+        return Mesh(
+            vertices=vertices.ravel().tolist(),
+            faces=faces.ravel().tolist(),
+            units=UNITS,
+            applicationId=application_id,
+        )
+
+    def plane(self, origin: np.ndarray) -> Plane:
+        x, y, z = origin.tolist()
+        return Plane(
+            origin=Point(x=x, y=y, z=z, units=UNITS),
+            normal=Vector(x=0.0, y=0.0, z=1.0, units=UNITS),
+            xdir=Vector(x=1.0, y=0.0, z=0.0, units=UNITS),
+            ydir=Vector(x=0.0, y=1.0, z=0.0, units=UNITS),
+            units=UNITS,
+        )
+
+    def helix(self, origin: np.ndarray) -> np.ndarray:
+        t = np.linspace(0.0, 4 * math.pi, max(self.spec.curve_points, 2))
+        radius = self.rng.uniform(0.5, 2.0)
+        return np.stack([np.cos(t) * radius, np.sin(t) * radius, t * 0.1], axis=1) + (
+            origin
+        )
+
+    def point(self, coordinates: np.ndarray) -> Point:
+        x, y, z = np.asarray(coordinates).tolist()
+        return Point(x=x, y=y, z=z, units=UNITS)
+
+    def line(self, origin: np.ndarray) -> Line:
+        return Line(
+            start=self.point(origin),
+            end=self.point(origin + self.rng.uniform(-2.0, 2.0, 3)),
+            units=UNITS,
+        )
+
+    def polyline(self, origin: np.ndarray) -> Polyline:
+        return Polyline(value=self.helix(origin).ravel().tolist(), units=UNITS)
+
+    def arc(self, origin: np.ndarray) -> Arc:
+        radius = self.rng.uniform(0.5, 2.0)
+        angles = np.array([0.0, 0.25, 0.5]) * math.pi * self.rng.uniform(1.0, 3.0)
+        points = [
+            self.point(origin + radius * np.array([math.cos(a), math.sin(a), 0.0]))
+            for a in angles
+        ]
+        return Arc(
+            plane=self.plane(origin),
+            startPoint=points[0],
+            midPoint=points[1],
+            endPoint=points[2],
+            units=UNITS,
+        )
+
+    def circle(self, origin: np.ndarray) -> Circle:
+        return Circle(
+            plane=self.plane(origin),
+            center=self.point(origin),
+            radius=self.rng.uniform(0.5, 2.0),
+            units=UNITS,
+        )
+
+    def ellipse(self, origin: np.ndarray) -> Base:
+        return dotnet_object(
+            Ellipse,
+            plane=self.plane(origin),
+            firstRadius=self.rng.uniform(1.0, 2.0),
+            secondRadius=self.rng.uniform(0.3, 1.0),
+            units=UNITS,
+        )
+
+    def curve(self, origin: np.ndarray) -> Curve:
+        points = self.helix(origin)
+        count = len(points)
+        degree = min(3, count - 1)
+        knots = [0.0] * degree + list(range(count - degree + 1))
+        knots += [float(count - degree)] * degree
+        return Curve(
+            degree=degree,
+            periodic=False,
+            rational=False,
+            points=points.ravel().tolist(),
+            weights=[1.0] * count,
+            knots=[float(knot) for knot in knots],
+            closed=False,
+            displayValue=Polyline(value=points.ravel().tolist(), units=UNITS),
+            units=UNITS,
+            bbox=None,
+        )
+
+    def polycurve(self, origin: np.ndarray) -> Polycurve:
+        return Polycurve(
+            segments=[self.line(origin), self.arc(origin), self.polyline(origin)],
+            units=UNITS,
+        )
+
+    def instance(self, definition_id: str, max_depth: int, offset: np.ndarray) -> Base:
+        transform = np.identity(4)
+        transform[:3, 3] = offset
+        return dotnet_object(
+            InstanceProxy,
+            definitionId=definition_id,
+            transform=transform.ravel().tolist(),
+            maxDepth=max_depth,
+            units=UNITS,
+            applicationId=self.application_id("instance"),
+        )
+
+    def instance_definitions(self) -> List[Base]:
+        """
+        chains of instance_depth definitions, each one instancing the next.
+        maxDepth is the nesting level, the top definitions have 0
+        """
+        definitions = []
+        for chain in range(self.spec.instance_definitions):
+            nested_id: Optional[str] = None
+            for depth in reversed(range(self.spec.instance_depth)):
+                definition_id = f"synthetic-definition-{chain}-{depth}"
+                objects = [self.mesh(np.zeros(3))]
+                if nested_id:
+                    objects.append(
+                        self.instance(nested_id, depth + 1, np.array([0.0, 0.0, 1.0]))
+                    )
+                self._definition_objects.extend(objects)
+
+                definitions.append(
+                    dotnet_object(
+                        InstanceDefinitionProxy,
+                        name=f"Definition {chain} Level {depth}",
+                        objects=[obj.applicationId for obj in objects],
+                        maxDepth=depth,
+                        applicationId=definition_id,
+                    )
+                )
+                nested_id = definition_id
+        return definitions
+
+    def render_material_proxies(self) -> List[RenderMaterialProxy]:
+        proxies = []
+        for index in range(self.spec.materials):
+            red, green, blue = (
+                (self.rng.uniform(0.0, 1.0, 3) * 255).astype(int).tolist()
+            )
+            proxies.append(
+                RenderMaterialProxy(
+                    value=RenderMaterial(
+                        name=f"Synthetic Material {index}",
+                        diffuse=(255 << 24) | (red << 16) | (green << 8) | blue,
+                        opacity=1.0 if index % 2 == 0 else 0.5,
+                        metalness=0.0,
+                        roughness=0.5,
+                        emissive=0,
+                    ),
+                    objects=self._mesh_ids[index :: self.spec.materials],
+                    applicationId=self.application_id("material"),
+                )
+            )
+        return proxies
+
+
+def generate_model(spec: ModelSpec) -> Collection:
+    return ModelGenerator(spec).generate()
+
+
+def manifest_path(path: Path) -> Path:
+    return path.with_name(f"{path.stem}.manifest.json")
+
+
+def write_model(
+    root: Base, path: Path, spec: Optional[ModelSpec] = None
+) -> Tuple[str, int]:
+    """
+    writes the model to a .db or .json file, returns the root id and object count
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest: Dict[str, Any] = {"spec": asdict(spec) if spec else None}
+
+    if path.suffix == ".db":
+        path.unlink(missing_ok=True)
+        transport = SQLiteTransport(base_path=str(path.parent), scope=path.stem)
+        root_id = operations.send(root, [transport], use_default_cache=False)
+        object_count = len(transport.get_all_objects())
+        transport.close()
+
+        manifest.update(rootId=root_id, objectCount=object_count)
+        manifest_path(path).write_text(json.dumps(manifest, indent=2))
+        return root_id, object_count
+
+    memory = MemoryTransport()
+    root_id = operations.send(root, [memory], use_default_cache=False)
+    manifest.update(
+        rootId=root_id, objectCount=len(memory.objects), objects=memory.objects
+    )
+    path.write_text(json.dumps(manifest))
+    return root_id, len(memory.objects)
+
+
+def open_model(path: Path) -> Tuple[str, Any]:
+    """
+    returns the root id and a transport holding the objects of a written model
+    """
+    if path.suffix == ".db":
+        manifest = json.loads(manifest_path(path).read_text())
+        return manifest["rootId"], SQLiteTransport(
+            base_path=str(path.parent), scope=path.stem
+        )
+
+    manifest = json.loads(path.read_text())
+    transport = MemoryTransport()
+    transport.objects = manifest["objects"]
+    return manifest["rootId"], transport
+
+
+def read_model(path: Path) -> Base:
+    root_id, transport = open_model(path)
+    return operations.receive(root_id, local_transport=transport)
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--preset", choices=PRESETS, default="medium")
+    parser.add_argument(
+        "--output", type=Path, required=True, help="the .db or .json file to write"
+    )
+    # every spec field can be overridden, e.g. --mesh-faces 5000
+    for spec_field in fields(ModelSpec):
+        parser.add_argument(
+            f"--{spec_field.name.replace('_', '-')}", type=int, default=None
+        )
+    args = parser.parse_args(argv)
+
+    overrides = {
+        spec_field.name: getattr(args, spec_field.name)
+        for spec_field in fields(ModelSpec)
+        if getattr(args, spec_field.name) is not None
+    }
+    spec = ModelSpec(**{**asdict(PRESETS[args.preset]), **overrides})
+
+    root_id, object_count = write_model(generate_model(spec), args.output, spec)
+    print(f"wrote {object_count} objects to {args.output}, root {root_id}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
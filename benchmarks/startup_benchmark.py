@@ -0,0 +1,128 @@
+"""
+Measures how long Blender takes to import and register the Speckle add-on
+
+Run it with a regular python, it starts a fresh background Blender per run:
+
+    python benchmarks/startup_benchmark.py --blender /path/to/blender --runs 5
+
+Each run reports the import and register time and which heavy modules were
+already loaded once registration finished.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULT_PREFIX = "SPECKLE_STARTUP_BENCHMARK "
+
+# modules that should only be imported once an operator needs them
+HEAVY_MODULES = (
+    "specklepy",
+    "gql",
+    "bpy_speckle.converter",
+    "bpy_speckle.connector.operations",
+    "bpy_speckle.connector.utils.account_manager",
+)
+
+
+def run_in_blender() -> None:
+    """
+    imports and registers the add-on inside the running Blender and prints the timings
+    """
+    import importlib
+
+    sys.path.insert(0, str(REPO_ROOT))
+
+    start = time.perf_counter()
+    bpy_speckle = importlib.import_module("bpy_speckle")
+    imported = time.perf_counter()
+    bpy_speckle.register()
+    registered = time.perf_counter()
+
+    result = {
+        "import_seconds": imported - start,
+        "register_seconds": registered - imported,
+        "total_seconds": registered - start,
+        "heavy_modules_loaded": [
+            name
+            for name in HEAVY_MODULES
+            if any(
+                module == name or module.startswith(f"{name}.")
+                for module in sys.modules
+            )
+        ],
+    }
+    bpy_speckle.unregister()
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+def run_once(blender: str) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [
+            blender,
+            "--background",
+            "--factory-startup",
+            "--python",
+            str(Path(__file__).resolve()),
+            "--",
+            "--in-blender",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX) :])
+
+    print(completed.stdout)
+    print(completed.stderr)
+    raise RuntimeError(f"Blender exited with {completed.returncode} without a result")
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {"runs": len(runs)}
+    for key in ("import_seconds", "register_seconds", "total_seconds"):
+        values = [run[key] for run in runs]
+        summary[key] = {
+            "min": min(values),
+            "median": statistics.median(values),
+            "max": max(values),
+        }
+    summary["heavy_modules_loaded"] = sorted(
+        {name for run in runs for name in run["heavy_modules_loaded"]}
+    )
+    return summary
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blender", default="blender", help="Blender executable")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write the summary as JSON")
+    parser.add_argument("--in-blender", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.in_blender:
+        run_in_blender()
+        return
+
+    # the first run may still install dependencies, it isn't measured
+    run_once(args.blender)
+    runs = [run_once(args.blender) for _ in range(args.runs)]
+    summary = summarize(runs)
+
+    print(json.dumps(summary, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps({"summary": summary, "runs": runs}, indent=2))
+
+
+if __name__ == "__main__":
+    # Blender passes the script's own arguments after "--"
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else sys.argv[1:]
+    main(argv)
@@ -38,7 +38,6 @@ from .connector.ui.main_panel import SPECKLE_PT_main_panel
 from .connector.ui.project_selection_dialog import (
     SPECKLE_OT_project_selection_dialog,
     SPECKLE_UL_projects_list,
-    speckle_workspace,
 )
 from .connector.ui.model_selection_dialog import (
     SPECKLE_OT_model_selection_dialog,
@@ -50,6 +49,8 @@ from .connector.ui.version_selection_dialog import (
 )
 from .connector.ui.selection_filter_dialog import SPECKLE_OT_selection_filter_dialog
 from .connector.utils.property_groups import (
+    speckle_account,
+    speckle_workspace,
     speckle_project,
     speckle_model,
     speckle_version,
@@ -81,7 +82,7 @@ from .connector.blender_operators.add_project_by_url import (
 
 from .connector.blender_operators.create_project import SPECKLE_OT_create_project
 from .connector.blender_operators.create_model import SPECKLE_OT_create_model
-from .connector.utils.account_manager import speckle_account
+from .connector.blender_operators.load_more import SPECKLE_OT_load_more
 
 # States
 from .connector.states.speckle_state import (
@@ -168,6 +169,7 @@ classes = (
     SPECKLE_OT_add_project_by_url,
     SPECKLE_OT_create_project,
     SPECKLE_OT_create_model,
+    SPECKLE_OT_load_more,
     speckle_account,
     SPECKLE_UL_workspaces_list,
     SPECKLE_OT_workspace_selection_dialog,
@@ -1,10 +1,5 @@
 import bpy
-from bpy.types import Context, Event, UILayout, WindowManager
-from ..utils.account_manager import (
-    get_model_details_by_wrapper,
-    get_project_from_url,
-    can_load,
-)
+from bpy.types import Context, Event, UILayout
 
 
 class SPECKLE_OT_add_project_by_url(bpy.types.Operator):
@@ -21,6 +16,12 @@ class SPECKLE_OT_add_project_by_url(bpy.types.Operator):
     )
 
     def execute(self, context: Context) -> set[str]:
+        from ..utils.account_manager import (
+            get_model_details_by_wrapper,
+            get_project_from_url,
+            can_load,
+        )
+
         self.report({"INFO"}, f"Adding project from URL: {self.url}")
 
         wm = context.window_manager
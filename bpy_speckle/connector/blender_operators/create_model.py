@@ -1,9 +1,6 @@
 import bpy
 from bpy.types import Context, Event, UILayout
-from specklepy.api.client import SpeckleClient
-from specklepy.api.credentials import get_local_accounts, Account
-from specklepy.core.api.inputs import CreateModelInput
-from typing import List, Tuple, Optional
+from typing import Tuple, Optional
 
 
 class SPECKLE_OT_create_model(bpy.types.Operator):
@@ -19,7 +16,7 @@ class SPECKLE_OT_create_model(bpy.types.Operator):
         if not self.model_name.strip():
             self.report({"ERROR"}, "Model name cannot be empty")
             return {"CANCELLED"}
-        
+
         try:
             model_id, model_name = create_model(
                 wm.selected_account_id, wm.selected_project_id, self.model_name
@@ -52,18 +49,25 @@ def unregister() -> None:
 
 
 def create_model(account_id: str, project_id: str, model_name: str) -> Tuple[str, str]:
-    accounts: List[Account] = get_local_accounts()
-    account: Optional[Account] = next(
-        (acc for acc in accounts if acc.id == account_id), None
-    )
+    from specklepy.api.credentials import Account
+    from specklepy.core.api.inputs import CreateModelInput
+    from ..utils.account_manager import get_account_from_id, get_authenticated_client
+    from ..utils.list_cache import invalidate
+
+    account: Optional[Account] = get_account_from_id(account_id)
 
     if not account:
         raise ValueError(f"Account with ID {account_id} not found")
 
-    client = SpeckleClient(host=account.serverInfo.url)
-    client.authenticate_with_account(account)
+    client = get_authenticated_client(account)
     model = client.model.create(
         input=CreateModelInput(name=model_name, description="", project_id=project_id)
     )
+    # the models lists of the project and the latest versions that came with
+    # them don't know the new model yet
+    invalidate(
+        lambda key: key[0] in ("models", "latest_version")
+        and key[1:3] == (account_id, project_id)
+    )
     # Function is annotated to return Tuple[str, str] but currently returns a list.
     return (model.id, model.name)
@@ -1,12 +1,6 @@
 import bpy
 from bpy.types import Context, Event, UILayout
-
-from specklepy.api.client import SpeckleClient
-from specklepy.api.credentials import get_local_accounts, Account
-from specklepy.core.api.inputs import ProjectCreateInput
-from specklepy.core.api.inputs.project_inputs import WorkspaceProjectCreateInput
-from specklepy.core.api.enums import ProjectVisibility
-from typing import List, Tuple, Optional
+from typing import Tuple, Optional
 
 
 class SPECKLE_OT_create_project(bpy.types.Operator):
@@ -56,14 +50,17 @@ def unregister() -> None:
 def create_project(
     account_id: str, project_name: str, workspace_id: Optional[str]
 ) -> Tuple[str, str]:
+    from specklepy.api.credentials import Account
+    from specklepy.core.api.inputs import ProjectCreateInput
+    from specklepy.core.api.inputs.project_inputs import WorkspaceProjectCreateInput
+    from specklepy.core.api.enums import ProjectVisibility
+    from ..utils.account_manager import get_account_from_id, get_authenticated_client
+    from ..utils.list_cache import invalidate
+
     try:
-        accounts: List[Account] = get_local_accounts()
-        account: Optional[Account] = next(
-            (acc for acc in accounts if acc.id == account_id), None
-        )
+        account: Optional[Account] = get_account_from_id(account_id)
 
-        client = SpeckleClient(host=account.serverInfo.url)
-        client.authenticate_with_account(account)
+        client = get_authenticated_client(account)
         if workspace_id:
             project = client.project.create_in_workspace(
                 input=WorkspaceProjectCreateInput(
@@ -82,6 +79,13 @@ def create_project(
                 )
             )
 
+        # cached project lists and projects screens of this account don't have
+        # the new project yet
+        invalidate(
+            lambda key: key[0] in ("projects", "projects_screen")
+            and key[1] == account_id
+        )
+
         return (project.id, project.name)
     except Exception as e:
         print(f"Failed to create project: {str(e)}")
@@ -1,8 +1,6 @@
 import bpy
 from typing import Set
 from bpy.types import Context, Event
-from ..operations.load_operation import load_operation
-from ..utils.account_manager import get_server_url_by_account_id
 from ..utils.model_card_utils import (
     update_model_card_objects,
     delete_model_card_objects,
@@ -33,16 +31,61 @@ class SPECKLE_OT_load(bpy.types.Operator):
         default="INSTANCE_PROXIES",
     )
 
+    point_loading_mode: bpy.props.EnumProperty(  # type: ignore
+        name="Point Loading",
+        description="Choose how to load points",
+        items=[
+            (
+                "EMPTIES",
+                "Empties",
+                "Load each point as an empty",
+            ),
+            (
+                "MERGED",
+                "Merged Mesh",
+                "Load the points of each collection as one vertex-only mesh",
+            ),
+            (
+                "MERGED_INSTANCER",
+                "Merged Mesh with Instancer",
+                "Load the points of each collection as one vertex-only mesh displayed through a Geometry Nodes instancer",
+            ),
+        ],
+        default="EMPTIES",
+    )
+
+    merge_curves: bpy.props.BoolProperty(  # type: ignore
+        name="Merge Curves",
+        description="Load lines, polylines, arcs and circles of each collection as a single curve object",
+        default=False,
+    )
+
+    memory_budget: bpy.props.BoolProperty(  # type: ignore
+        name="Memory Budget",
+        description="Free Speckle data as soon as it is converted and stop the load before Blender runs out of memory",
+        default=False,
+    )
+
     def draw(self, context: Context) -> None:
         layout = self.layout
         row = layout.row()
         row.label(text="Instance Loading:")
         row.prop(self, "instance_loading_mode", text="")
+        row = layout.row()
+        row.label(text="Point Loading:")
+        row.prop(self, "point_loading_mode", text="")
+        layout.prop(self, "merge_curves")
+        layout.prop(self, "memory_budget")
 
     def invoke(self, context: Context, event: Event) -> Set[str]:
         return context.window_manager.invoke_props_dialog(self)
 
     def execute(self, context: Context) -> Set[str]:
+        from ..operations.load_operation import load_operation
+        from ..utils.account_manager import get_server_url_by_account_id
+        from ..utils.memory_budget import MemoryBudget
+        from ..utils.operation_timings import format_summary, get_last_summary
+
         wm = context.window_manager
         if model_card_exists(
             wm.selected_project_id, wm.selected_model_id, False, context
@@ -63,9 +106,22 @@ class SPECKLE_OT_load(bpy.types.Operator):
         model_card.load_option = wm.selected_version_load_option
         model_card.version_id = wm.selected_version_id
         model_card.instance_loading_mode = self.instance_loading_mode
+        model_card.merge_curves = self.merge_curves
+        model_card.point_loading_mode = self.point_loading_mode
+        model_card.memory_budget = self.memory_budget
 
-        converted_objects = load_operation(context, self.instance_loading_mode)
+        memory_budget = MemoryBudget() if self.memory_budget else None
+        converted_objects = load_operation(
+            context,
+            self.instance_loading_mode,
+            self.merge_curves,
+            self.point_loading_mode,
+            memory_budget,
+        )
         update_model_card_objects(model_card, converted_objects)
+        model_card.timing_summary = format_summary(get_last_summary("load"))
+        if memory_budget is not None and memory_budget.message:
+            self.report({"WARNING"}, memory_budget.message)
 
         # Clear selected model details from Window Manager
         wm.selected_account_id = ""
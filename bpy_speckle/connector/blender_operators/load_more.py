@@ -0,0 +1,35 @@
+import bpy
+from bpy.types import Context
+
+
+class SPECKLE_OT_load_more(bpy.types.Operator):
+    """
+    operator for loading the next page of a selection dialog list
+    """
+
+    bl_idname = "speckle.load_more"
+    bl_label = "Load More"
+    bl_description = "Load more items from the server"
+
+    list_name: bpy.props.EnumProperty(  # type: ignore
+        name="List",
+        items=[
+            ("projects", "Projects", "Load more projects"),
+            ("models", "Models", "Load more models"),
+            ("versions", "Versions", "Load more versions"),
+        ],
+    )
+
+    def execute(self, context: Context) -> set[str]:
+        from ..utils.list_cache import load_more
+
+        load_more(self.list_name)
+        return {"FINISHED"}
+
+
+def register() -> None:
+    bpy.utils.register_class(SPECKLE_OT_load_more)
+
+
+def unregister() -> None:
+    bpy.utils.unregister_class(SPECKLE_OT_load_more)
@@ -1,8 +1,6 @@
 import bpy
 from typing import Set
 from bpy.types import Context
-from ..utils.version_manager import get_latest_version
-from ..operations.load_operation import load_operation
 from ..utils.model_card_utils import (
     delete_model_card_objects,
     update_model_card_objects,
@@ -17,6 +15,11 @@ class SPECKLE_OT_load_model_card(bpy.types.Operator):
     model_card_id: bpy.props.StringProperty(name="Model Card ID", default="")  # type: ignore
 
     def execute(self, context: Context) -> Set[str]:
+        from ..utils.version_manager import get_latest_version
+        from ..operations.load_operation import load_operation
+        from ..utils.memory_budget import MemoryBudget
+        from ..utils.operation_timings import format_summary, get_last_summary
+
         wm = context.window_manager
 
         # Get the model card
@@ -29,9 +32,12 @@ class SPECKLE_OT_load_model_card(bpy.types.Operator):
 
         delete_model_card_objects(model_card, context)
 
+        memory_budget = MemoryBudget() if model_card.memory_budget else None
+
         # set wm
         wm.selected_account_id = model_card.account_id
         wm.selected_project_id = model_card.project_id
+        wm.selected_model_id = model_card.model_id
         wm.selected_model_name = model_card.model_name
 
         # if load option is set to "LATEST"
@@ -45,11 +51,16 @@ class SPECKLE_OT_load_model_card(bpy.types.Operator):
 
             # load latest version
             converted_objects = load_operation(
-                context, model_card.instance_loading_mode
+                context,
+                model_card.instance_loading_mode,
+                model_card.merge_curves,
+                model_card.point_loading_mode,
+                memory_budget,
             )
             # update model card details
             update_model_card_objects(model_card, converted_objects)
             model_card.version_id = latest_version_id
+            model_card.timing_summary = format_summary(get_last_summary("load"))
 
         else:
             # set version id in wm
@@ -57,13 +68,23 @@ class SPECKLE_OT_load_model_card(bpy.types.Operator):
 
             # load version id
             converted_objects = load_operation(
-                context, model_card.instance_loading_mode
+                context,
+                model_card.instance_loading_mode,
+                model_card.merge_curves,
+                model_card.point_loading_mode,
+                memory_budget,
             )
             if not converted_objects:
-                self.report({"ERROR"}, "Load operation failed")
+                self.report(
+                    {"ERROR"},
+                    memory_budget.message
+                    if memory_budget is not None and memory_budget.message
+                    else "Load operation failed",
+                )
                 return {"CANCELLED"}
             # update model card details
             update_model_card_objects(model_card, converted_objects)
+            model_card.timing_summary = format_summary(get_last_summary("load"))
 
         # Clear selected model details from Window Manager
         wm.selected_account_id = ""
@@ -71,6 +92,9 @@ class SPECKLE_OT_load_model_card(bpy.types.Operator):
         wm.selected_version_id = ""
         wm.selected_model_name = ""
 
+        if memory_budget is not None and memory_budget.message:
+            self.report({"WARNING"}, memory_budget.message)
+
         self.report(
             {"INFO"},
             f"{len(converted_objects)} objects loaded from Speckle. Model: {model_card.model_name}, Version: {model_card.version_id}",
@@ -1,7 +1,6 @@
 import bpy
 from typing import Set
 from bpy.types import Context, Event
-from ..operations.publish_operation import publish_operation
 
 
 class SPECKLE_OT_publish_model_card(bpy.types.Operator):
@@ -20,6 +19,9 @@ class SPECKLE_OT_publish_model_card(bpy.types.Operator):
         return context.window_manager.invoke_props_dialog(self)
 
     def execute(self, context: Context) -> Set[str]:
+        from ..operations.publish_operation import publish_operation
+        from ..utils.operation_timings import format_summary, get_last_summary
+
         wm = context.window_manager
 
         # Get the model card
@@ -61,6 +63,7 @@ class SPECKLE_OT_publish_model_card(bpy.types.Operator):
 
         model_card.version_id = version_id
         model_card.is_publish = True
+        model_card.timing_summary = format_summary(get_last_summary("publish"))
 
         # Clear selected model details from Window Manager
         wm.selected_account_id = ""
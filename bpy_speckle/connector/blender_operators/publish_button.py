@@ -3,8 +3,6 @@ from bpy.types import Context
 from bpy.types import Event
 from typing import Set
 
-from ..operations.publish_operation import publish_operation
-from ..utils.account_manager import get_server_url_by_account_id
 from ..utils.model_card_utils import model_card_exists, update_model_card_objects
 
 
@@ -29,6 +27,10 @@ class SPECKLE_OT_publish(bpy.types.Operator):
         return context.window_manager.invoke_props_dialog(self)
 
     def execute(self, context: Context) -> Set[str]:
+        from ..operations.publish_operation import publish_operation
+        from ..utils.account_manager import get_server_url_by_account_id
+        from ..utils.operation_timings import format_summary, get_last_summary
+
         wm = context.window_manager
 
         # check if we have stored objects from selection dialog
@@ -100,6 +102,7 @@ class SPECKLE_OT_publish(bpy.types.Operator):
             model_card.load_option = "SPECIFIC"  # published versions are specific
             model_card.version_id = version_id
             model_card.apply_modifiers = self.apply_modifiers
+            model_card.timing_summary = format_summary(get_last_summary("publish"))
             update_model_card_objects(model_card, objects_to_convert)
 
         # clear selected model details from Window Manager
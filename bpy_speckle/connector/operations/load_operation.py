@@ -1,9 +1,7 @@
 import bpy
 from bpy.types import Context
-from specklepy.core.api.credentials import get_local_accounts
 from specklepy.transports.server import ServerTransport
-from specklepy.core.api import operations
-from specklepy.core.api.client import SpeckleClient
+from specklepy.transports.sqlite import SQLiteTransport
 from specklepy.objects.models.collections.collection import Collection as SCollection
 from specklepy.objects.graph_traversal.default_traversal import (
     create_default_traversal_function,
@@ -11,36 +9,99 @@ from specklepy.objects.graph_traversal.default_traversal import (
 from specklepy.core.api import host_applications
 
 from ..utils.get_ascendants import get_ascendants
+from ..utils.account_manager import get_account_from_id, get_authenticated_client
+from ..utils import scene_cache
+from ..utils.memory_budget import ConvertedReleaser, MemoryBudget
+from ..utils.operation_timings import (
+    OperationTimer,
+    counting_transport,
+    start_operation,
+)
+from ..utils.typed_arrays import TypedArraySerializer
+from ...converter.profiler import format_report, start_profiling, stop_profiling
 from ...converter.utils import find_object_by_id, get_project_workspace_id
 from ...converter.to_native import (
     convert_to_native,
     render_material_proxy_to_native,
     instance_definition_proxy_to_native,
     find_instance_definitions,
+    curves_to_merged_native,
+    points_to_merged_native,
+    MERGED_CURVE_TYPES,
 )
 from specklepy.logging import metrics
 from ... import bl_info
-from typing import Dict, Union
+from specklepy.objects import Base
+from specklepy.objects.geometry import Point
+from typing import Dict, List, Optional, Tuple, Union
 
 
 def load_operation(
-    context: Context, instance_loading_mode: str = "INSTANCE_PROXIES"
+    context: Context,
+    instance_loading_mode: str = "INSTANCE_PROXIES",
+    merge_curves: bool = False,
+    point_loading_mode: str = "EMPTIES",
+    memory_budget: Optional[MemoryBudget] = None,
 ) -> Dict[str, Union[bpy.types.Collection, bpy.types.Object]]:
     """
     load objects from Speckle and maintain hierarchy.
+    with a memory_budget, speckle objects are freed as soon as they are
+    converted and the load stops once the budget is exceeded, keeping what
+    was loaded so far. memory_budget.message then says why it stopped.
+    with merge_curves, lines, polylines, arcs and circles of each collection
+    are loaded as one curve object with a spline per element.
+    with point_loading_mode other than EMPTIES, points of each collection
+    are loaded as one vertex-only mesh.
+    the time spent in each phase is recorded by operation_timings, each
+    conversion by the profiler when it is enabled.
+    with the scene cache enabled, converted versions are kept in it and loading
+    one again appends it from there without downloading or converting anything
     """
+    wm = context.window_manager
+    timer = start_operation(
+        "load",
+        project_id=wm.selected_project_id,
+        version_id=wm.selected_version_id,
+    )
+
+    start_profiling()
+
+    converted_objects = {}
+    try:
+        converted_objects = _load_version(
+            context,
+            timer,
+            instance_loading_mode,
+            merge_curves,
+            point_loading_mode,
+            memory_budget,
+        )
+    finally:
+        conversions = stop_profiling()
+        if conversions:
+            print(format_report(conversions))
+        timer.finish(
+            bool(converted_objects),
+            converted_objects=len(converted_objects),
+            conversions=conversions,
+            memory_budget=memory_budget.message if memory_budget else None,
+        )
+
+    return converted_objects
 
+
+def _load_version(
+    context: Context,
+    timer: OperationTimer,
+    instance_loading_mode: str,
+    merge_curves: bool,
+    point_loading_mode: str,
+    memory_budget: Optional[MemoryBudget],
+) -> Dict[str, Union[bpy.types.Collection, bpy.types.Object]]:
     wm = context.window_manager
 
     # get account
-    account = next(
-        (
-            acc
-            for acc in get_local_accounts()
-            if acc.id == context.window_manager.selected_account_id
-        ),
-        None,
-    )
+    account = get_account_from_id(wm.selected_account_id)
 
     if account is None:
         print("No Speckle account found")
@@ -48,58 +109,106 @@ def load_operation(
 
     print(f"Using account: {account.userInfo.email}")
 
-    # receive the data
-    client = SpeckleClient(host=account.serverInfo.url)
-    client.authenticate_with_account(account)
+    scene_cache_key = None
+    if scene_cache.is_enabled():
+        scene_cache_key = scene_cache.cache_key(
+            account.serverInfo.url,
+            wm.selected_project_id,
+            wm.selected_model_id,
+            wm.selected_version_id,
+            instance_loading_mode=instance_loading_mode,
+            merge_curves=merge_curves,
+            point_loading_mode=point_loading_mode,
+        )
+        with timer.phase("scene_cache") as phase:
+            cached = scene_cache.load_cached_version(context, scene_cache_key)
+            if cached is not None:
+                phase.add(objects=len(cached[0]))
+
+        if cached is not None:
+            cached_objects, version_details = cached
+            with timer.phase("metrics"):
+                _track_receive(account, from_cache=True, **version_details)
+            print(
+                "\nLoad process completed from the scene cache. "
+                f"Imported {len(cached_objects)} objects."
+            )
+            return cached_objects
+
+    with timer.phase("connect"):
+        client = get_authenticated_client(account)
 
-    transport = ServerTransport(stream_id=wm.selected_project_id, client=client)
+        transport = ServerTransport(stream_id=wm.selected_project_id, client=client)
 
-    version = client.version.get(wm.selected_version_id, wm.selected_project_id)
+        version = client.version.get(wm.selected_version_id, wm.selected_project_id)
     obj_id = version.referenced_object
 
-    version_data = operations.receive(obj_id, transport)
+    # receive the data in two steps, so download and deserialization are timed
+    # apart. a version already in the local cache isn't downloaded again
+    local_transport = SQLiteTransport()
+    with timer.phase("download") as phase:
+        root_obj_serialized = local_transport.get_object(obj_id)
+        if root_obj_serialized is None:
+            root_obj_serialized = transport.copy_object_and_children(
+                obj_id, counting_transport(local_transport, phase)
+            )
 
-    metrics.set_host_app("blender")
+    # geometry arrays are left in the local cache and decoded into numpy
+    # buffers when converted
+    with timer.phase("deserialize"):
+        serializer = TypedArraySerializer(read_transport=local_transport)
+        version_data = serializer.read_json(obj_string=root_obj_serialized)
+    # the serializer keeps every deserialized object by id, dropping it lets
+    # converted objects be freed
+    del serializer, root_obj_serialized
+
+    if memory_budget is not None and memory_budget.exceeded("deserialization"):
+        print(memory_budget.message)
+        return {}
 
-    metrics.track(
-        metrics.RECEIVE,
-        account,
-        {
-            "ui": "dui3",
-            "hostAppVersion": ".".join(map(str, bl_info["blender"])),
-            "core_version": ".".join(map(str, bl_info["version"])),
-            "sourceHostApp": host_applications.get_host_app_from_string(
-                version.source_application
-            ).slug,
-            "isMultiplayer": version.author_user.id != account.userInfo.id,
+    with timer.phase("metrics"):
+        # kept with a cached version, so loading it again is tracked alike
+        version_details = {
+            "source_application": version.source_application,
+            "author_id": version.author_user.id,
             "workspace_id": get_project_workspace_id(client, wm.selected_project_id),
-        },
-    )
+        }
+        _track_receive(account, from_cache=False, **version_details)
 
     # Create material mapping first
-    material_mapping = render_material_proxy_to_native(version_data)
-
-    definition_collections, definition_objects = instance_definition_proxy_to_native(
-        version_data, material_mapping, instance_loading_mode=instance_loading_mode
-    )
+    with timer.phase("materials") as phase:
+        material_mapping = render_material_proxy_to_native(version_data)
+        phase.add(objects=len(set(material_mapping.values())))
+
+    with timer.phase("definitions") as phase:
+        definition_collections, definition_objects = (
+            instance_definition_proxy_to_native(
+                version_data,
+                material_mapping,
+                instance_loading_mode=instance_loading_mode,
+            )
+        )
+        phase.add(objects=len(definition_collections))
 
-    definitions_root_collection = None
-    if definition_collections:
-        definitions_root_collection = bpy.data.collections.new("InstanceDefinitions")
+        definitions_root_collection = None
+        if definition_collections:
+            definitions_root_collection = bpy.data.collections.new(
+                "InstanceDefinitions"
+            )
 
-        for collection in definition_collections.values():
-            definitions_root_collection.children.link(collection)
+            for collection in definition_collections.values():
+                definitions_root_collection.children.link(collection)
 
-    definition_object_ids = set()
-    for definition in find_instance_definitions(version_data).values():
-        definition_object_ids.update(definition.objects)
-        for obj_id in definition.objects:
-            found_obj = find_object_by_id(version_data, obj_id)
-            if found_obj:
-                if hasattr(found_obj, "id"):
-                    definition_object_ids.add(found_obj.id)
-                if hasattr(found_obj, "applicationId"):
-                    definition_object_ids.add(found_obj.applicationId)
+        definition_object_ids = set()
+        for definition in find_instance_definitions(version_data).values():
+            definition_object_ids.update(definition.objects)
+            for obj_id in definition.objects:
+                found_obj = find_object_by_id(version_data, obj_id)
+                if found_obj:
+                    if hasattr(found_obj, "id"):
+                        definition_object_ids.add(found_obj.id)
+                    if hasattr(found_obj, "applicationId"):
+                        definition_object_ids.add(found_obj.applicationId)
 
     traversal_function = create_default_traversal_function()
 
@@ -115,104 +224,132 @@ def load_operation(
     created_collections[root_collection_name] = root_collection
 
     collection_hierarchy = {}
-    all_objects = {}
+    object_count = 0
 
     speckle_root_id = None
 
-    for traversal_item in traversal_function.traverse(version_data):
-        speckle_obj = traversal_item.current
-
-        # Skip objects that are part of instance definitions
-        if speckle_obj.id in definition_object_ids or (
-            hasattr(speckle_obj, "applicationId")
-            and speckle_obj.applicationId in definition_object_ids
-        ):
-            continue
+    with timer.phase("traversal") as phase:
+        for traversal_item in traversal_function.traverse(version_data):
+            speckle_obj = traversal_item.current
 
-        all_objects[speckle_obj.id] = speckle_obj
+            # Skip objects that are part of instance definitions
+            if speckle_obj.id in definition_object_ids or (
+                hasattr(speckle_obj, "applicationId")
+                and speckle_obj.applicationId in definition_object_ids
+            ):
+                continue
 
-        # get all ascendants in order (current to root)
-        ascendants = list(get_ascendants(traversal_item))
-        parent_ascendants = ascendants[1:] if len(ascendants) > 1 else []
+            object_count += 1
 
-        if isinstance(speckle_obj, SCollection):
-            if not parent_ascendants and speckle_root_id is None:
-                speckle_root_id = speckle_obj.id
+            # get all ascendants in order (current to root)
+            ascendants = list(get_ascendants(traversal_item))
+            parent_ascendants = ascendants[1:] if len(ascendants) > 1 else []
 
-            collection_name = getattr(
-                speckle_obj, "name", f"Collection_{speckle_obj.id[:8]}"
-            )
+            if isinstance(speckle_obj, SCollection):
+                if not parent_ascendants and speckle_root_id is None:
+                    speckle_root_id = speckle_obj.id
 
-            parent_id = None
-            for parent in parent_ascendants:
-                if isinstance(parent, SCollection) and hasattr(parent, "id"):
-                    parent_id = parent.id
-                    break
-
-            collection_hierarchy[speckle_obj.id] = {
-                "id": speckle_obj.id,
-                "name": collection_name,
-                "parent_id": parent_id,
-                "blender_collection": None,
-                "full_path": [collection_name],
-            }
-
-            if parent_id in collection_hierarchy:
-                collection_hierarchy[speckle_obj.id]["full_path"] = (
-                    collection_hierarchy[parent_id]["full_path"] + [collection_name]
+                collection_name = getattr(
+                    speckle_obj, "name", f"Collection_{speckle_obj.id[:8]}"
                 )
 
-        else:
-            pass
-
-    def get_collection_depth(coll_id):
-        parent_id = collection_hierarchy[coll_id]["parent_id"]
-        if parent_id is None:
-            return 0
-        if parent_id not in collection_hierarchy:
-            return 0
-        return 1 + get_collection_depth(parent_id)
-
-    sorted_collections = sorted(
-        collection_hierarchy.keys(),
-        key=lambda coll_id: (
-            get_collection_depth(coll_id),
-            collection_hierarchy[coll_id]["name"],
-        ),
-    )
+                parent_id = None
+                for parent in parent_ascendants:
+                    if isinstance(parent, SCollection) and hasattr(parent, "id"):
+                        parent_id = parent.id
+                        break
+
+                collection_hierarchy[speckle_obj.id] = {
+                    "id": speckle_obj.id,
+                    "name": collection_name,
+                    "parent_id": parent_id,
+                    "blender_collection": None,
+                    "full_path": [collection_name],
+                }
+
+                if parent_id in collection_hierarchy:
+                    collection_hierarchy[speckle_obj.id]["full_path"] = (
+                        collection_hierarchy[parent_id]["full_path"] + [collection_name]
+                    )
+
+            else:
+                pass
+
+        def get_collection_depth(coll_id):
+            parent_id = collection_hierarchy[coll_id]["parent_id"]
+            if parent_id is None:
+                return 0
+            if parent_id not in collection_hierarchy:
+                return 0
+            return 1 + get_collection_depth(parent_id)
+
+        sorted_collections = sorted(
+            collection_hierarchy.keys(),
+            key=lambda coll_id: (
+                get_collection_depth(coll_id),
+                collection_hierarchy[coll_id]["name"],
+            ),
+        )
+        phase.add(objects=object_count)
 
     if speckle_root_id and speckle_root_id in collection_hierarchy:
         collection_hierarchy[speckle_root_id]["blender_collection"] = root_collection
         converted_objects[speckle_root_id] = root_collection
 
-    # create collections in depth order (skip the root that's already mapped)
-    for coll_id in sorted_collections:
-        if coll_id == speckle_root_id:
-            continue
+    with timer.phase("collections") as phase:
+        # create collections in depth order (skip the root that's already mapped)
+        for coll_id in sorted_collections:
+            if coll_id == speckle_root_id:
+                continue
+
+            coll_info = collection_hierarchy[coll_id]
+            coll_name = coll_info["name"]
+            parent_id = coll_info["parent_id"]
+            full_path = coll_info["full_path"]
+
+            collection_key = tuple(full_path)
+
+            parent_collection = root_collection
+            if parent_id and parent_id in collection_hierarchy:
+                parent_info = collection_hierarchy[parent_id]
+                if parent_info["blender_collection"]:
+                    parent_collection = parent_info["blender_collection"]
+
+            if collection_key in created_collections:
+                print(f"Collection already exists: {coll_name}")
+                blender_collection = created_collections[collection_key]
+            else:
+                blender_collection = bpy.data.collections.new(coll_name)
+                parent_collection.children.link(blender_collection)
+                created_collections[collection_key] = blender_collection
+                phase.add(objects=1)
+
+            coll_info["blender_collection"] = blender_collection
+            converted_objects[coll_id] = blender_collection
+
+    def find_target_collection(traversal_item) -> bpy.types.Collection:
+        ascendants = list(get_ascendants(traversal_item))
 
-        coll_info = collection_hierarchy[coll_id]
-        coll_name = coll_info["name"]
-        parent_id = coll_info["parent_id"]
-        full_path = coll_info["full_path"]
+        for parent in ascendants[1:] if len(ascendants) > 1 else []:
+            if isinstance(parent, SCollection) and hasattr(parent, "id"):
+                parent_id = parent.id
+                if parent_id in collection_hierarchy:
+                    coll_info = collection_hierarchy[parent_id]
+                    if coll_info["blender_collection"]:
+                        return coll_info["blender_collection"]
 
-        collection_key = tuple(full_path)
+        return root_collection
 
-        parent_collection = root_collection
-        if parent_id and parent_id in collection_hierarchy:
-            parent_info = collection_hierarchy[parent_id]
-            if parent_info["blender_collection"]:
-                parent_collection = parent_info["blender_collection"]
+    # collection name -> (collection, simple curves to merge into it)
+    merged_curves: Dict[str, Tuple[bpy.types.Collection, List[Base]]] = {}
+    merged_points: Dict[str, Tuple[bpy.types.Collection, List[Base]]] = {}
 
-        if collection_key in created_collections:
-            print(f"Collection already exists: {coll_name}")
-            blender_collection = created_collections[collection_key]
-        else:
-            blender_collection = bpy.data.collections.new(coll_name)
-            parent_collection.children.link(blender_collection)
-            created_collections[collection_key] = blender_collection
+    # entered once per object, the traversal in between isn't timed
+    conversion_phase = timer.phase("conversion")
+    linking_phase = timer.phase("linking")
 
-        coll_info["blender_collection"] = blender_collection
-        converted_objects[coll_id] = blender_collection
+    # frees converted speckle objects in memory budget mode
+    releaser = ConvertedReleaser() if memory_budget is not None else None
 
     conversion_count = 0
     for traversal_item in traversal_function.traverse(version_data):
@@ -235,43 +372,57 @@ def load_operation(
         if speckle_obj.id in converted_objects:
             continue
 
-        try:
-            target_collection = root_collection
-            ascendants = list(get_ascendants(traversal_item))
+        if merge_curves and isinstance(speckle_obj, MERGED_CURVE_TYPES):
+            target_collection = find_target_collection(traversal_item)
+            _, speckle_curves = merged_curves.setdefault(
+                target_collection.name, (target_collection, [])
+            )
+            speckle_curves.append(speckle_obj)
+            continue
 
-            for parent in ascendants[1:] if len(ascendants) > 1 else []:
-                if isinstance(parent, SCollection) and hasattr(parent, "id"):
-                    parent_id = parent.id
-                    if parent_id in collection_hierarchy:
-                        coll_info = collection_hierarchy[parent_id]
-                        if coll_info["blender_collection"]:
-                            target_collection = coll_info["blender_collection"]
-                            break
-
-            blender_obj = convert_to_native(
-                speckle_obj,
-                material_mapping,
-                definition_collections=definition_collections,
-                root_collection=target_collection,
-                instance_loading_mode=instance_loading_mode,
+        if point_loading_mode != "EMPTIES" and isinstance(speckle_obj, Point):
+            target_collection = find_target_collection(traversal_item)
+            _, speckle_points = merged_points.setdefault(
+                target_collection.name, (target_collection, [])
             )
+            speckle_points.append(speckle_obj)
+            continue
+
+        try:
+            target_collection = find_target_collection(traversal_item)
+
+            with conversion_phase:
+                blender_obj = convert_to_native(
+                    speckle_obj,
+                    material_mapping,
+                    definition_collections=definition_collections,
+                    root_collection=target_collection,
+                    instance_loading_mode=instance_loading_mode,
+                    point_loading_mode=point_loading_mode,
+                )
 
             if blender_obj is None:
                 continue
+            conversion_phase.add(objects=1)
 
             converted_objects[speckle_obj.id] = blender_obj
             if hasattr(speckle_obj, "applicationId"):
                 converted_objects[speckle_obj.applicationId] = blender_obj
 
+            if releaser is not None:
+                releaser.release(traversal_item)
+
             if not isinstance(blender_obj, bpy.types.Collection):
                 try:
-                    already_linked = False
-                    for coll in bpy.data.collections:
-                        if blender_obj.name in coll.objects:
-                            already_linked = True
+                    with linking_phase:
+                        already_linked = False
+                        for coll in bpy.data.collections:
+                            if blender_obj.name in coll.objects:
+                                already_linked = True
 
-                    if not already_linked:
-                        target_collection.objects.link(blender_obj)
+                        if not already_linked:
+                            target_collection.objects.link(blender_obj)
+                            linking_phase.add(objects=1)
 
                 except RuntimeError as e:
                     print(f"Error linking object to collection: {e}")
@@ -285,6 +436,68 @@ def load_operation(
         conversion_count += 1
         if conversion_count % 10 == 0:
             context.window_manager.progress_update(min(conversion_count, 100))
+            if memory_budget is not None and memory_budget.exceeded("conversion"):
+                print(memory_budget.message)
+                break
+
+    with timer.phase("merging") as phase:
+        merged_objects = []
+        for target_collection, speckle_curves in merged_curves.values():
+            if memory_budget is not None and memory_budget.exceeded("merging"):
+                break
+            curve_obj = curves_to_merged_native(
+                speckle_curves,
+                f"{target_collection.name} Curves",
+                f"{target_collection.name} Curves",
+            )
+            merged_objects.append((target_collection, curve_obj))
+
+        for target_collection, speckle_points in merged_points.values():
+            if memory_budget is not None and memory_budget.exceeded("merging"):
+                break
+            point_obj = points_to_merged_native(
+                speckle_points,
+                f"{target_collection.name} Points",
+                f"{target_collection.name} Points",
+                point_loading_mode == "MERGED_INSTANCER",
+            )
+            merged_objects.append((target_collection, point_obj))
+
+        for target_collection, merged_obj in merged_objects:
+            if merged_obj is None:
+                continue
+
+            target_collection.objects.link(merged_obj)
+            phase.add(objects=len(merged_obj["speckle_element_ids"]))
+
+            # every source element resolves to the merged object
+            for speckle_id, application_id in zip(
+                merged_obj["speckle_element_ids"],
+                merged_obj["speckle_element_application_ids"],
+            ):
+                converted_objects[speckle_id] = merged_obj
+                if application_id:
+                    converted_objects[application_id] = merged_obj
+
+    # a load stopped by the memory budget is incomplete and isn't cached
+    if scene_cache_key is not None and not (
+        memory_budget is not None and memory_budget.message
+    ):
+        with timer.phase("scene_cache_write") as phase:
+            cached_path = scene_cache.store_version(
+                scene_cache_key,
+                root_collection,
+                definitions_root_collection,
+                converted_objects,
+                project_id=wm.selected_project_id,
+                model_id=wm.selected_model_id,
+                version_id=wm.selected_version_id,
+                version=version_details,
+            )
+            if cached_path is not None:
+                phase.add(
+                    objects=len(converted_objects), bytes=cached_path.stat().st_size
+                )
 
     context.window_manager.progress_end()
 
@@ -295,3 +508,29 @@ def load_operation(
     print(f"\nLoad process completed. Imported {len(converted_objects)} objects.")
 
     return converted_objects
+
+
+def _track_receive(
+    account,
+    from_cache: bool,
+    source_application: Optional[str],
+    author_id: Optional[str],
+    workspace_id: Optional[str],
+) -> None:
+    metrics.set_host_app("blender")
+
+    metrics.track(
+        metrics.RECEIVE,
+        account,
+        {
+            "ui": "dui3",
+            "hostAppVersion": ".".join(map(str, bl_info["blender"])),
+            "core_version": ".".join(map(str, bl_info["version"])),
+            "sourceHostApp": host_applications.get_host_app_from_string(
+                source_application
+            ).slug,
+            "isMultiplayer": author_id != account.userInfo.id,
+            "workspace_id": workspace_id,
+            "from_cache": from_cache,
+        },
+    )
@@ -5,17 +5,23 @@ from typing import List, Optional, Dict, Tuple
 from specklepy.objects import Base
 from specklepy.objects.models.collections.collection import Collection
 from specklepy.core.api import operations
-from specklepy.core.api.client import SpeckleClient
 from specklepy.transports.server import ServerTransport
 from specklepy.core.api.inputs.version_inputs import CreateVersionInput
-from specklepy.core.api.credentials import get_local_accounts
 from specklepy.objects.models.units import Units
 
 from ...converter.to_speckle import convert_to_speckle
 from ...converter.to_speckle.material_to_speckle import (
     add_render_material_proxies_to_base,
 )
+from ...converter.profiler import format_report, start_profiling, stop_profiling
 from ...converter.utils import get_project_workspace_id
+from ..utils.account_manager import get_account_from_id, get_authenticated_client
+from ..utils.operation_timings import (
+    OperationTimer,
+    counting_transport,
+    current_timer,
+    start_operation,
+)
 from specklepy.logging import metrics
 from ... import bl_info
 
@@ -28,23 +34,57 @@ def publish_operation(
 ) -> Tuple[bool, str, Optional[str]]:
     """
     publish objects to speckle
+    the time spent in each phase is recorded by operation_timings, each
+    conversion by the profiler when it is enabled
     """
     wm = context.window_manager
+    timer = start_operation(
+        "publish",
+        project_id=wm.selected_project_id,
+        model_id=wm.selected_model_id,
+    )
+
+    start_profiling()
 
+    result = (False, "", None)
     try:
-        # get account and authenticate
-        account = next(
-            (acc for acc in get_local_accounts() if acc.id == wm.selected_account_id),
-            None,
+        result = _publish_objects(
+            context, timer, objects_to_convert, version_message, apply_modifiers
         )
+    finally:
+        conversions = stop_profiling()
+        if conversions:
+            print(format_report(conversions))
+        timer.finish(
+            result[0],
+            version_id=result[2],
+            selected_objects=len(objects_to_convert),
+            conversions=conversions,
+        )
+
+    return result
+
+
+def _publish_objects(
+    context: Context,
+    timer: OperationTimer,
+    objects_to_convert: List,
+    version_message: str,
+    apply_modifiers: bool,
+) -> Tuple[bool, str, Optional[str]]:
+    wm = context.window_manager
+
+    try:
+        with timer.phase("connect"):
+            # get account and authenticate
+            account = get_account_from_id(wm.selected_account_id)
 
-        if account is None:
-            return False, "No Speckle account found", None
+            if account is None:
+                return False, "No Speckle account found", None
 
-        client = SpeckleClient(host=account.serverInfo.url)
-        client.authenticate_with_account(account)
+            client = get_authenticated_client(account)
 
-        transport = ServerTransport(stream_id=wm.selected_project_id, client=client)
+            transport = ServerTransport(stream_id=wm.selected_project_id, client=client)
 
         # build collection hierarchy and convert objects
         root_collection = build_collection_hierarchy(context, objects_to_convert, apply_modifiers)
@@ -53,9 +93,14 @@ def publish_operation(
             return False, "No objects could be converted to Speckle format", None
 
         # add material proxies
-        add_render_material_proxies_to_base(root_collection, objects_to_convert)
+        with timer.phase("materials"):
+            add_render_material_proxies_to_base(root_collection, objects_to_convert)
 
-        obj_id = operations.send(root_collection, [transport])
+        # serializing and uploading overlap, so they are timed together
+        with timer.phase("send") as phase:
+            obj_id = operations.send(
+                root_collection, [counting_transport(transport, phase)]
+            )
 
         version_input = CreateVersionInput(
             objectId=obj_id,
@@ -65,23 +110,25 @@ def publish_operation(
             sourceApplication="blender",
         )
 
-        version = client.version.create(version_input)
+        with timer.phase("version"):
+            version = client.version.create(version_input)
         version_id = version.id
 
         # track metrics
-        metrics.set_host_app("blender")
-        metrics.track(
-            metrics.SEND,
-            account,
-            {
-                "ui": "dui3",
-                "hostAppVersion": ".".join(map(str, bl_info["blender"])),
-                "core_version": ".".join(map(str, bl_info["version"])),
-                "workspace_id": get_project_workspace_id(
-                    client, wm.selected_project_id
-                ),
-            },
-        )
+        with timer.phase("metrics"):
+            metrics.set_host_app("blender")
+            metrics.track(
+                metrics.SEND,
+                account,
+                {
+                    "ui": "dui3",
+                    "hostAppVersion": ".".join(map(str, bl_info["blender"])),
+                    "core_version": ".".join(map(str, bl_info["version"])),
+                    "workspace_id": get_project_workspace_id(
+                        client, wm.selected_project_id
+                    ),
+                },
+            )
 
         # count total objects for success message
         total_objects = count_objects_in_collection(root_collection)
@@ -109,7 +156,12 @@ def build_collection_hierarchy(
     file_name = bpy.path.basename(bpy.data.filepath)
     collection_name = file_name if file_name else "Untitled.blend"
 
-    collection_data = analyze_collection_structure(objects_to_convert)
+    with current_timer().phase("collections"):
+        # one pass over bpy.data, reused by every step below
+        collection_index = build_collection_index()
+        collection_data = analyze_collection_structure(
+            objects_to_convert, collection_index
+        )
 
     if not collection_data["objects"] and not collection_data["collections"]:
         return None
@@ -135,9 +187,7 @@ def build_collection_hierarchy(
     for blender_coll in collection_data["collections"]:
         speckle_coll = collection_mapping[blender_coll]
 
-        parent_coll = find_parent_collection(
-            blender_coll, collection_data["collections"]
-        )
+        parent_coll = find_parent_collection(blender_coll, collection_index)
 
         if parent_coll and parent_coll in collection_mapping:
             parent_speckle_coll = collection_mapping[parent_coll]
@@ -155,7 +205,7 @@ def build_collection_hierarchy(
         placed = False
 
         target_collection = find_target_collection_for_object(
-            blender_obj, collection_data["collections"]
+            blender_obj, collection_index
         )
 
         if target_collection and target_collection in collection_mapping:
@@ -169,42 +219,77 @@ def build_collection_hierarchy(
     return root_collection
 
 
-def analyze_collection_structure(objects: List) -> Dict:
+def build_collection_index() -> Dict:
+    """
+    build parent, depth and object membership maps for all collections in one pass
+    """
+    scene_roots = set()
+    for scene in bpy.data.scenes:
+        for child in scene.collection.children:
+            scene_roots.add(child)
+
+    # maps collection to its first parent, in bpy.data.collections order
+    parents = {}
+    # maps object to every collection that directly contains it
+    object_collections = {}
+
+    for collection in bpy.data.collections:
+        for child in collection.children:
+            if child not in parents:
+                parents[child] = collection
+        for obj in collection.objects:
+            object_collections.setdefault(obj, []).append(collection)
+
+    # resolve depths by walking up each chain once and memoizing along the way
+    depths = {}
+    for collection in bpy.data.collections:
+        chain = []
+        current = collection
+        while current not in depths:
+            if current in scene_roots or current not in parents:
+                depths[current] = 0
+                break
+            chain.append(current)
+            current = parents[current]
+
+        depth = depths[current]
+        for coll in reversed(chain):
+            depth += 1
+            depths[coll] = depth
+
+    # deepest collection for each object
+    object_targets = {}
+    for obj, obj_collections in object_collections.items():
+        object_targets[obj] = max(obj_collections, key=lambda c: depths[c])
+
+    return {
+        "parents": parents,
+        "depths": depths,
+        "object_collections": object_collections,
+        "object_targets": object_targets,
+    }
+
+
+def analyze_collection_structure(objects: List, collection_index: Dict) -> Dict:
     """
     analyze the collection structure of the given objects
     """
     collections_set = set()
     objects_collections = {}
 
-    direct_collections = set()
     for obj in objects:
-        obj_collections = []
-        for collection in bpy.data.collections:
-            if obj.name in collection.objects:
-                direct_collections.add(collection)
-                obj_collections.append(collection)
+        obj_collections = collection_index["object_collections"].get(obj, [])
         objects_collections[obj] = obj_collections
 
-    # find all ancestor collections
-    def find_all_ancestors(collection):
-        """recursively find all ancestor collections"""
-        ancestors = set()
-
-        for potential_parent in bpy.data.collections:
-            if collection.name in potential_parent.children:
-                ancestors.add(potential_parent)
-                # Recursively find ancestors of the parent
-                ancestors.update(find_all_ancestors(potential_parent))
-
-        return ancestors
-
-    for collection in direct_collections:
-        collections_set.add(collection)
-        ancestors = find_all_ancestors(collection)
-        collections_set.update(ancestors)
+        for collection in obj_collections:
+            # walk up the ancestors, stopping at the first already visited one
+            current = collection
+            while current is not None and current not in collections_set:
+                collections_set.add(current)
+                current = collection_index["parents"].get(current)
 
     collections_list = list(collections_set)
-    collections_list.sort(key=lambda c: get_collection_depth(c))
+    collections_list.sort(key=lambda c: get_collection_depth(c, collection_index))
 
     return {
         "collections": collections_list,
@@ -213,51 +298,29 @@ def analyze_collection_structure(objects: List) -> Dict:
     }
 
 
-def get_collection_depth(collection: BlenderCollection) -> int:
+def get_collection_depth(collection: BlenderCollection, collection_index: Dict) -> int:
     """
     get the depth of a collection in the hierarchy
     """
-    depth = 0
-    for scene in bpy.data.scenes:
-        if collection.name in scene.collection.children:
-            return depth
-
-    for parent_coll in bpy.data.collections:
-        if collection.name in parent_coll.children:
-            return get_collection_depth(parent_coll) + 1
-
-    return depth
+    return collection_index["depths"].get(collection, 0)
 
 
 def find_parent_collection(
-    collection: BlenderCollection, all_collections: List[BlenderCollection]
+    collection: BlenderCollection, collection_index: Dict
 ) -> Optional[BlenderCollection]:
     """
     find the parent collection
     """
-    for potential_parent in all_collections:
-        if collection.name in potential_parent.children:
-            return potential_parent
-    return None
+    return collection_index["parents"].get(collection)
 
 
 def find_target_collection_for_object(
-    obj, collections: List[BlenderCollection]
+    obj, collection_index: Dict
 ) -> Optional[BlenderCollection]:
     """
     find the deepest collection that contains this object
     """
-    target_collection = None
-    max_depth = -1
-
-    for collection in collections:
-        if obj.name in collection.objects:
-            depth = get_collection_depth(collection)
-            if depth > max_depth:
-                max_depth = depth
-                target_collection = collection
-
-    return target_collection
+    return collection_index["object_targets"].get(obj)
 
 
 def convert_selected_objects(
@@ -271,13 +334,18 @@ def convert_selected_objects(
     scale_factor = scene.unit_settings.scale_length
 
     speckle_objects = []
-    for obj in objects_to_convert:
-        if not obj or obj.type not in ["MESH", "CURVE", "EMPTY"]:
-            speckle_objects.append(None)
-            continue
-
-        speckle_obj = convert_to_speckle(obj, scale_factor, units.value, apply_modifiers)
-        speckle_objects.append(speckle_obj)
+    with current_timer().phase("conversion") as phase:
+        for obj in objects_to_convert:
+            if not obj or obj.type not in ["MESH", "CURVE", "EMPTY"]:
+                speckle_objects.append(None)
+                continue
+
+            speckle_obj = convert_to_speckle(
+                obj, scale_factor, units.value, apply_modifiers
+            )
+            speckle_objects.append(speckle_obj)
+            if speckle_obj is not None:
+                phase.add(objects=1)
 
     return speckle_objects
 
@@ -1,16 +1,6 @@
 import bpy
 from bpy.types import Context, Event
-from typing import List, Tuple
-from ..utils.account_manager import (
-    get_account_enum_items,
-    speckle_account,
-    speckle_workspace,
-    get_workspaces,
-    get_active_workspace,
-    get_account_from_id,
-)
-from ..utils.project_manager import get_projects_for_account
-from ..ui.project_selection_dialog import speckle_project
+from ..utils.property_groups import speckle_account
 
 
 class SPECKLE_UL_accounts_list(bpy.types.UIList):
@@ -50,6 +40,8 @@ class SPECKLE_OT_account_selection_dialog(bpy.types.Operator):
     account_index: bpy.props.IntProperty(default=0)  # type: ignore
 
     def invoke(self, context: Context, event: Event) -> set[str]:
+        from ..utils.account_manager import get_account_enum_items
+
         wm = context.window_manager
         # Clear existing accounts
         wm.speckle_accounts.clear()
@@ -100,6 +92,9 @@ class SPECKLE_OT_account_selection_dialog(bpy.types.Operator):
             )
 
     def execute(self, context: Context) -> set[str]:
+        from ..utils.account_manager import get_account_from_id
+        from ..utils.list_cache import refresh_projects_screen
+
         wm = context.window_manager
         # update the selected account id
         account = get_account_from_id(wm.speckle_accounts[self.account_index].id)
@@ -108,36 +103,8 @@ class SPECKLE_OT_account_selection_dialog(bpy.types.Operator):
             {"INFO"},
             f"Selected account: {account.userInfo.name} - {account.userInfo.email} - {account.serverInfo.url}",
         )
-        update_workspaces_list(context)
-        update_projects_list(context)
+        # workspaces, active workspace and projects come in one request
+        refresh_projects_screen(context)
         # redraw the area
         context.area.tag_redraw()
         return {"FINISHED"}
-
-
-def update_workspaces_list(context: Context) -> None:
-    wm = context.window_manager
-    wm.speckle_workspaces.clear()
-    workspaces = get_workspaces(wm.selected_account_id)
-    for id, name in workspaces:
-        workspace: speckle_workspace = wm.speckle_workspaces.add()
-        workspace.id = id
-        workspace.name = name
-    wm.selected_workspace.id = get_active_workspace(wm.selected_account_id)["id"]
-    print("Updated Workspaces List!")
-
-
-def update_projects_list(context: Context) -> None:
-    wm = context.window_manager
-    wm.speckle_projects.clear()
-    projects: List[Tuple[str, str, str, str, bool]] = get_projects_for_account(
-        wm.selected_account_id, workspace_id=wm.selected_workspace.id
-    )
-    for name, role, updated, id, can_receive in projects:
-        project: speckle_project = wm.speckle_projects.add()
-        project.name = name
-        project.role = role
-        project.updated = updated
-        project.id = id
-        project.can_receive = can_receive
-    print("Updated Projects List!")
@@ -171,3 +171,9 @@ class SPECKLE_PT_main_panel(bpy.types.Panel):
                 row_1.operator(
                     "speckle.model_card_settings", text="", icon="COLLAPSEMENU"
                 ).model_card_id = model_card.get_model_card_id()
+
+                # timings of the last load or publish
+                if model_card.timing_summary:
+                    row_3: UILayout = box.row()
+                    row_3.scale_y = 0.8
+                    row_3.label(text=model_card.timing_summary, icon="TIME")
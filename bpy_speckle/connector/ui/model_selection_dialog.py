@@ -1,8 +1,5 @@
 import bpy
 from bpy.types import UILayout, Context, PropertyGroup, Event
-from ..utils.model_manager import get_models_for_project
-from ..utils.version_manager import get_latest_version
-from ..utils.property_groups import speckle_model
 
 
 class SPECKLE_UL_models_list(bpy.types.UIList):
@@ -44,20 +41,11 @@ class SPECKLE_OT_model_selection_dialog(bpy.types.Operator):
     bl_description = "Select a model to load"
 
     def update_models_list(self, context: Context) -> None:
-        wm = context.window_manager
-
-        wm.speckle_models.clear()
+        from ..utils.list_cache import debounce, refresh_models_list
 
+        # the search is sent once typing pauses
         search = self.search_query if self.search_query.strip() else None
-        models = get_models_for_project(
-            wm.selected_account_id, wm.selected_project_id, search=search
-        )
-
-        for name, id, updated in models:
-            model = wm.speckle_models.add()
-            model.name = name
-            model.updated = updated
-            model.id = id
+        debounce("models_search", lambda: refresh_models_list(bpy.context, search))
 
         return None
 
@@ -66,19 +54,43 @@ class SPECKLE_OT_model_selection_dialog(bpy.types.Operator):
         description="Search a model",
         default="",
         update=update_models_list,
+        options={"TEXTEDIT_UPDATE"},
     )
 
-    model_index: bpy.props.IntProperty(name="Model Index", default=0)  # type: ignore
+    def update_model_index(self, context: Context) -> None:
+        from ..utils.list_cache import select_index
+
+        select_index(
+            self, "model_index", "model_id", context.window_manager.speckle_models
+        )
+
+    model_index: bpy.props.IntProperty(  # type: ignore
+        name="Model Index", default=0, update=update_model_index
+    )
+
+    # the list is swapped while the dialog is open, the model is selected by id
+    model_id: bpy.props.StringProperty(  # type: ignore
+        name="Model ID", default="", options={"HIDDEN"}
+    )
 
     def execute(self, context: Context) -> set[str]:
-        wm = context.window_manager
-        if 0 <= self.model_index < len(wm.speckle_models):
-            selected_model = wm.speckle_models[self.model_index]
+        from ..utils.list_cache import (
+            find_item,
+            get_latest_version_cached,
+            prefetch_versions,
+        )
 
+        wm = context.window_manager
+        selected_model = find_item(wm.speckle_models, self.model_id)
+        if selected_model is not None:
             wm.selected_model_id = selected_model.id
             wm.selected_model_name = selected_model.name
+            prefetch_versions(
+                wm.selected_account_id, wm.selected_project_id, wm.selected_model_id
+            )
 
-            latest_version = get_latest_version(
+            # usually came with the models list already
+            latest_version = get_latest_version_cached(
                 account_id=wm.selected_account_id,
                 project_id=wm.selected_project_id,
                 model_id=wm.selected_model_id,
@@ -93,13 +105,19 @@ class SPECKLE_OT_model_selection_dialog(bpy.types.Operator):
         return {"FINISHED"}
 
     def invoke(self, context: Context, event: Event) -> set[str]:
-        self.update_models_list(context)
+        from ..utils.list_cache import refresh_models_list
+
+        search = self.search_query if self.search_query.strip() else None
+        refresh_models_list(context, search)
 
         return context.window_manager.invoke_props_dialog(self)
 
     def draw(self, context: Context) -> None:
+        from ..utils.list_cache import has_more, sync_selection
+
         layout: UILayout = self.layout
         wm = context.window_manager
+        sync_selection(self, "model_index", "model_id", wm.speckle_models)
         layout.label(text=f"Project: {wm.selected_project_name}")
 
         row = layout.row(align=True)
@@ -115,5 +133,9 @@ class SPECKLE_OT_model_selection_dialog(bpy.types.Operator):
             self,
             "model_index",
         )
+        if has_more("models"):
+            layout.operator(
+                "speckle.load_more", icon="DOWNARROW_HLT"
+            ).list_name = "models"
 
         layout.separator()
@@ -1,18 +1,5 @@
 import bpy
 from bpy.types import UILayout, Context, PropertyGroup, Event
-from typing import List, Tuple
-from ..utils.account_manager import (
-    get_account_enum_items,
-    speckle_account,
-    get_workspaces,
-    speckle_workspace,
-    can_create_project_in_workspace,
-    get_active_workspace,
-    get_default_account_id,
-    get_account_from_id,
-)
-from ..utils.project_manager import get_projects_for_account
-from ..utils.property_groups import speckle_project
 
 
 class SPECKLE_UL_projects_list(bpy.types.UIList):
@@ -62,28 +49,15 @@ class SPECKLE_OT_project_selection_dialog(bpy.types.Operator):
         """
         updates the list of projects based on the selected account and search query
         """
-        wm = context.window_manager
-
-
-        wm.can_create_project_in_workspace = can_create_project_in_workspace(
-            wm.selected_account_id, wm.selected_workspace.id
-        )
-        wm.speckle_projects.clear()
+        from ..utils.list_cache import debounce, refresh_projects_list
 
         # get projects for the selected account, using search if provided
+        # the search is sent once typing pauses
         search = self.search_query if self.search_query.strip() else None
-        projects: List[Tuple[str, str, str, str, bool]] = get_projects_for_account(
-            wm.selected_account_id, search=search, workspace_id=wm.selected_workspace.id
+        debounce(
+            "projects_search",
+            lambda: refresh_projects_list(bpy.context, search),
         )
-
-        for name, role, updated, id, can_receive in projects:
-            project: speckle_project = wm.speckle_projects.add()
-            project.name = name
-            project.role = role
-            project.updated = updated
-            project.id = id
-            project.can_receive = can_receive
-        print("Updated Projects List!")
         return None
 
     search_query: bpy.props.StringProperty(  # type: ignore
@@ -91,15 +65,31 @@ class SPECKLE_OT_project_selection_dialog(bpy.types.Operator):
         description="Search a project or paste a URL to add a project",
         default="",
         update=update_projects_list,
+        options={"TEXTEDIT_UPDATE"},
     )
 
-    project_index: bpy.props.IntProperty(name="Project Index", default=0)  # type: ignore
+    def update_project_index(self, context: Context) -> None:
+        from ..utils.list_cache import select_index
+
+        select_index(
+            self, "project_index", "project_id", context.window_manager.speckle_projects
+        )
+
+    project_index: bpy.props.IntProperty(  # type: ignore
+        name="Project Index", default=0, update=update_project_index
+    )
+
+    # the list is swapped while the dialog is open, the project is selected by id
+    project_id: bpy.props.StringProperty(  # type: ignore
+        name="Project ID", default="", options={"HIDDEN"}
+    )
 
     def execute(self, context: Context) -> set[str]:
-        wm = context.window_manager
-        if 0 <= self.project_index < len(wm.speckle_projects):
-            selected_project = wm.speckle_projects[self.project_index]
+        from ..utils.list_cache import find_item, prefetch_models
 
+        wm = context.window_manager
+        selected_project = find_item(wm.speckle_projects, self.project_id)
+        if selected_project is not None:
             # verify the user has permission to receive from this project
             if not selected_project.can_receive:
                 self.report(
@@ -110,6 +100,7 @@ class SPECKLE_OT_project_selection_dialog(bpy.types.Operator):
 
             wm.selected_project_id = selected_project.id
             wm.selected_project_name = selected_project.name
+            prefetch_models(wm.selected_account_id, wm.selected_project_id)
 
             print(f"Selected project: {selected_project.name} ({selected_project.id})")
 
@@ -117,35 +108,27 @@ class SPECKLE_OT_project_selection_dialog(bpy.types.Operator):
         return {"FINISHED"}
 
     def invoke(self, context: Context, event: Event) -> set[str]:
-        wm = context.window_manager
+        from ..utils.account_manager import get_default_account_id
+        from ..utils.list_cache import refresh_projects_screen
 
-        # Clear existing projects
-        wm.speckle_projects.clear()
+        wm = context.window_manager
 
         if wm.selected_account_id == "":
             wm.selected_account_id = get_default_account_id()
 
-        wm.selected_workspace.id = get_active_workspace(wm.selected_account_id)["id"]
-        wm.selected_workspace.name = get_active_workspace(wm.selected_account_id)["name"]
-
-        # Fetch projects from server
-        projects: List[Tuple[str, str, str, str, bool]] = get_projects_for_account(
-            wm.selected_account_id, wm.selected_workspace.id
-        )
-
-        for name, role, updated, id, can_receive in projects:
-            project: speckle_project = wm.speckle_projects.add()
-            project.name = name
-            project.role = role
-            project.updated = updated
-            project.id = id
-            project.can_receive = can_receive
+        # show the cached active workspace and its projects right away, fresh ones
+        # replace them when they arrive
+        refresh_projects_screen(context)
 
         return context.window_manager.invoke_props_dialog(self)
 
     def draw(self, context: Context) -> None:
+        from ..utils.account_manager import get_account_from_id
+        from ..utils.list_cache import has_more, sync_selection
+
         layout: UILayout = self.layout
         wm = context.window_manager
+        sync_selection(self, "project_index", "project_id", wm.speckle_projects)
 
         # Account selection
         row = layout.row()
@@ -191,4 +174,8 @@ class SPECKLE_OT_project_selection_dialog(bpy.types.Operator):
                 self,
                 "project_index",
             )
+            if has_more("projects"):
+                layout.operator(
+                    "speckle.load_more", icon="DOWNARROW_HLT"
+                ).list_name = "projects"
             layout.separator()
@@ -1,6 +1,5 @@
 import bpy
 from bpy.types import UILayout, Context, PropertyGroup, Event
-from ..utils.version_manager import get_versions_for_model, get_latest_version
 
 
 class SPECKLE_UL_versions_list(bpy.types.UIList):
@@ -37,7 +36,21 @@ class SPECKLE_OT_version_selection_dialog(bpy.types.Operator):
     bl_label = "Select Version"
     bl_description = "Select a model version to load. Default is the latest version. You can also select a specific version."
 
-    version_index: bpy.props.IntProperty(name="Model Index", default=0)  # type: ignore
+    def update_version_index(self, context: Context) -> None:
+        from ..utils.list_cache import select_index
+
+        select_index(
+            self, "version_index", "version_id", context.window_manager.speckle_versions
+        )
+
+    version_index: bpy.props.IntProperty(  # type: ignore
+        name="Model Index", default=0, update=update_version_index
+    )
+
+    # the list is swapped while the dialog is open, the version is selected by id
+    version_id: bpy.props.StringProperty(  # type: ignore
+        name="Version ID", default="", options={"HIDDEN"}
+    )
 
     load_option: bpy.props.EnumProperty(  # type: ignore
         name="Load Option",
@@ -60,24 +73,16 @@ class SPECKLE_OT_version_selection_dialog(bpy.types.Operator):
     )  # type: ignore
 
     def update_versions_list(self, context: Context) -> None:
-        wm = context.window_manager
-        wm.speckle_versions.clear()
-
-        versions = get_versions_for_model(
-            account_id=wm.selected_account_id,
-            project_id=wm.selected_project_id,
-            model_id=wm.selected_model_id,
-        )
+        from ..utils.list_cache import refresh_versions_list
 
-        for id, message, updated in versions:
-            version = wm.speckle_versions.add()
-            version.id = id
-            version.message = message
-            version.updated = updated
+        refresh_versions_list(context)
 
         return None
 
     def execute(self, context: Context) -> set[str]:
+        from ..utils.list_cache import find_item
+        from ..utils.version_manager import get_latest_version
+
         wm = context.window_manager
 
         version_id_to_store = ""
@@ -97,11 +102,11 @@ class SPECKLE_OT_version_selection_dialog(bpy.types.Operator):
                 return {"CANCELLED"}
 
         elif self.load_option == "SPECIFIC":
-            if 0 <= self.version_index < len(wm.speckle_versions):
-                selected_version = wm.speckle_versions[self.version_index]
+            selected_version = find_item(wm.speckle_versions, self.version_id)
+            if selected_version is not None:
                 version_id_to_store = selected_version.id
             else:
-                print(f"Invalid version index {self.version_index}")
+                print(f"Version {self.version_id} isn't in the list")
                 return {"CANCELLED"}
         wm.selected_version_id = version_id_to_store
 
@@ -151,8 +156,11 @@ class SPECKLE_OT_version_selection_dialog(bpy.types.Operator):
         return context.window_manager.invoke_props_dialog(self)
 
     def draw(self, context: Context) -> None:
+        from ..utils.list_cache import has_more, sync_selection
+
         layout: UILayout = self.layout
         wm = context.window_manager
+        sync_selection(self, "version_index", "version_id", wm.speckle_versions)
         project_name = wm.selected_project_name
         model_name = wm.selected_model_name
         if self.model_card_id != "":
@@ -181,5 +189,9 @@ class SPECKLE_OT_version_selection_dialog(bpy.types.Operator):
                 self,
                 "version_index",
             )
+            if has_more("versions"):
+                layout.operator(
+                    "speckle.load_more", icon="DOWNARROW_HLT"
+                ).list_name = "versions"
 
         layout.separator()
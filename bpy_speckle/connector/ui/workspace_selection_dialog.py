@@ -1,9 +1,5 @@
 import bpy
 from bpy.types import Context, UILayout, Event, PropertyGroup
-from typing import List, Tuple
-from ..utils.account_manager import get_workspaces, speckle_workspace
-from ..utils.project_manager import get_projects_for_account
-from ..utils.account_manager import can_create_project_in_workspace
 
 
 class SPECKLE_UL_workspaces_list(bpy.types.UIList):
@@ -39,25 +35,40 @@ class SPECKLE_OT_workspace_selection_dialog(bpy.types.Operator):
     bl_label = "Select Workspace"
     bl_description = "Select a workspace to load projects from"
 
-    workspace_index: bpy.props.IntProperty(name="Workspace Index", default=0)  # type: ignore
+    def update_workspace_index(self, context: Context) -> None:
+        from ..utils.list_cache import select_index
+
+        select_index(
+            self,
+            "workspace_index",
+            "workspace_id",
+            context.window_manager.speckle_workspaces,
+        )
+
+    workspace_index: bpy.props.IntProperty(  # type: ignore
+        name="Workspace Index", default=0, update=update_workspace_index
+    )
+
+    # the list is swapped while the dialog is open, the workspace is selected by id
+    workspace_id: bpy.props.StringProperty(  # type: ignore
+        name="Workspace ID", default="", options={"HIDDEN"}
+    )
 
     def invoke(self, context: Context, event: Event) -> set[str]:
-        wm = context.window_manager
-        wm.speckle_workspaces.clear()
-        workspaces: List[Tuple[str, str]] = get_workspaces(wm.selected_account_id)
-        current_workspace_index = 0
-        for i, (id, name) in enumerate(workspaces):
-            workspace: speckle_workspace = wm.speckle_workspaces.add()
-            workspace.id = id
-            workspace.name = name
-            if id == wm.selected_workspace.id:
-                current_workspace_index = i
-        self.workspace_index = current_workspace_index
+        from ..utils.list_cache import refresh_workspaces_list
+
+        # show the cached workspaces right away, fresh ones replace them when
+        # they arrive. the selected workspace starts out highlighted
+        refresh_workspaces_list(context)
+        self.workspace_id = context.window_manager.selected_workspace.id
         return context.window_manager.invoke_props_dialog(self)
 
     def draw(self, context: Context) -> None:
+        from ..utils.list_cache import sync_selection
+
         layout: UILayout = self.layout
         wm = context.window_manager
+        sync_selection(self, "workspace_index", "workspace_id", wm.speckle_workspaces)
         layout.label(text=f"Selected Workspace: {wm.selected_workspace.name}")
         layout.template_list(
             "SPECKLE_UL_workspaces_list",
@@ -69,9 +80,11 @@ class SPECKLE_OT_workspace_selection_dialog(bpy.types.Operator):
         )
 
     def execute(self, context: Context) -> set[str]:
+        from ..utils.list_cache import find_item
+
         wm = context.window_manager
-        if 0 <= self.workspace_index < len(wm.speckle_workspaces):
-            selected_workspace = wm.speckle_workspaces[self.workspace_index]
+        selected_workspace = find_item(wm.speckle_workspaces, self.workspace_id)
+        if selected_workspace is not None:
             wm.selected_workspace.id = selected_workspace.id
             wm.selected_workspace.name = selected_workspace.name
             update_projects_list(context)
@@ -81,27 +94,12 @@ class SPECKLE_OT_workspace_selection_dialog(bpy.types.Operator):
 
 def update_projects_list(context):
     """Update projects list when workspace changes"""
+    from ..utils.list_cache import refresh_projects_list
 
     wm = context.window_manager
-    wm.speckle_projects.clear()
 
-    # get projects for the selected account and workspace
-    projects = get_projects_for_account(
-        wm.selected_account_id, wm.selected_workspace.id
-    )
-
-    for name, role, updated, id, can_receive in projects:
-        project = wm.speckle_projects.add()
-        project.name = name
-        project.role = role
-        project.updated = updated
-        project.id = id
-        project.can_receive = can_receive
-
-    # Update can_create_project_in_workspace flag
-    wm.can_create_project_in_workspace = can_create_project_in_workspace(
-        wm.selected_account_id, wm.selected_workspace.id
-    )
+    # get projects and can_create_project_in_workspace for the selected workspace
+    refresh_projects_list(context)
     print(f"Workspace changed to: {wm.selected_workspace.id}")
     print("Projects list updated")
 
@@ -1,31 +1,112 @@
-import bpy
+import os
+import threading
+from pathlib import Path
 from specklepy.core.api.credentials import get_local_accounts
 from typing import List, Tuple, Optional, Dict
 from specklepy.core.api.credentials import Account
 from specklepy.core.api.client import SpeckleClient
 from specklepy.core.api.wrapper import StreamWrapper
+from specklepy.core.helpers import speckle_path_provider
+from specklepy.transports.sqlite import SQLiteTransport
 
 from .misc import strip_non_ascii
+from .property_groups import speckle_account, speckle_workspace  # noqa: F401
+from ...converter.utils import get_server_capabilities
 
 
-class speckle_account(bpy.types.PropertyGroup):
-    id: bpy.props.StringProperty()  # type: ignore
-    user_name: bpy.props.StringProperty()  # type: ignore
-    server_url: bpy.props.StringProperty()  # type: ignore
-    user_email: bpy.props.StringProperty()  # type: ignore
+# local accounts by id, re-read only when the account store changes on disk
+_account_registry: Dict[str, Account] = {}
+_account_registry_stamp: Optional[Tuple[Optional[int], ...]] = None
 
 
-class speckle_workspace(bpy.types.PropertyGroup):
+def _account_store_stamp() -> Optional[Tuple[Optional[int], ...]]:
     """
-    PropertyGroup for storing workspace information
+    modification times of the account database and the json accounts folder,
+    None if the store location can't be resolved
     """
+    try:
+        base_path = Path(SQLiteTransport.get_base_path("Speckle"))
+        paths = [
+            base_path / "Accounts.db",
+            base_path / "Accounts.db-wal",
+            speckle_path_provider.accounts_folder_path(),
+        ]
+    except Exception:
+        return None
+
+    stamp = []
+    for path in paths:
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+def get_accounts() -> List[Account]:
+    """
+    returns the local accounts, reading the account store only when it has changed
+    """
+    return list(_refresh_account_registry().values())
+
+
+def _refresh_account_registry() -> Dict[str, Account]:
+    global _account_registry, _account_registry_stamp
+
+    stamp = _account_store_stamp()
+    if stamp is None or stamp != _account_registry_stamp:
+        # filled aside and swapped in, worker threads looking up accounts
+        # meanwhile keep seeing the previous registry instead of an empty one
+        registry: Dict[str, Account] = {}
+        for acc in get_local_accounts():
+            registry.setdefault(acc.id, acc)
+        _account_registry = registry
+        _account_registry_stamp = stamp
+
+    return _account_registry
+
+
+def invalidate_account_registry() -> None:
+    """
+    forces the next account lookup to re-read the account store
+    """
+    global _account_registry_stamp
+    _account_registry_stamp = None
+
+
+# authenticated clients by (account id, server url, thread), with the token they use
+# a gql transport serves one request at a time, so threads don't share clients
+_client_pool: Dict[Tuple[str, str, int], Tuple[str, SpeckleClient]] = {}
+_client_pool_lock = threading.Lock()
+
 
-    id: bpy.props.StringProperty(name="ID")  # type: ignore
-    name: bpy.props.StringProperty()  # type: ignore
+def get_authenticated_client(account: Account) -> SpeckleClient:
+    """
+    returns a pooled client authenticated with the account,
+    a new one is set up if the account's token has changed
+    """
+    key = (account.id, account.serverInfo.url, threading.get_ident())
+
+    with _client_pool_lock:
+        pooled = _client_pool.get(key)
+    if pooled and pooled[0] == account.token:
+        return pooled[1]
+
+    # authenticating goes to the server, other threads shouldn't wait for it
+    client = SpeckleClient(host=account.serverInfo.url)
+    client.authenticate_with_account(account)
+
+    with _client_pool_lock:
+        pooled = _client_pool.get(key)
+        if pooled and pooled[0] == account.token:
+            return pooled[1]
+        _client_pool[key] = (account.token, client)
+
+    return client
 
 
 def get_account_enum_items() -> List[Tuple[str, str, str, str]]:
-    accounts: List[Account] = get_local_accounts()
+    accounts: List[Account] = get_accounts()
     if not accounts:
         print("No accounts found!")
         return [("NO_ACCOUNTS", "No accounts found!", "", "")]
@@ -47,14 +128,13 @@ def get_workspaces(account_id: str) -> List[Tuple[str, str]]:
     """
     retrieves the workspaces for a given account ID
     """
-    account = next((acc for acc in get_local_accounts() if acc.id == account_id), None)
+    account = get_account_from_id(account_id)
     if not account:
         print("No accounts found > No workspaces!")
         return [("", "")]
 
-    client = SpeckleClient(host=account.serverInfo.url)
-    client.authenticate_with_account(account)
-    workspaces_enabled = client.server.get().workspaces.workspaces_enabled
+    client = get_authenticated_client(account)
+    workspaces_enabled = get_server_capabilities(client)["workspaces_enabled"]
 
     if workspaces_enabled:
         workspaces = client.active_user.get_workspaces().items
@@ -83,19 +163,16 @@ def get_default_account_id() -> Optional[str]:
     """
     retrieves the ID of the default Speckle account
     """
-    return next(
-        (acc.id for acc in get_local_accounts() if acc.isDefault), "NO_ACCOUNTS"
-    )
+    return next((acc.id for acc in get_accounts() if acc.isDefault), "NO_ACCOUNTS")
 
 
 def get_server_url_by_account_id(account_id: str) -> Optional[str]:
     """
     retrieves the server URL for a given account ID
     """
-    accounts: List[Account] = get_local_accounts()
-    for acc in accounts:
-        if acc.id == account_id:
-            return acc.serverInfo.url
+    account = get_account_from_id(account_id)
+    if account:
+        return account.serverInfo.url
     return None
 
 
@@ -103,12 +180,11 @@ def get_active_workspace(account_id: str) -> Optional[Dict[str, str]]:
     """
     retrieves the ID of the default workspace for a given account ID
     """
-    account = next((acc for acc in get_local_accounts() if acc.id == account_id), None)
+    account = get_account_from_id(account_id)
     if account is None:
         print(f"No account found for ID: {account_id}, returning default workspace.")
         return {"id": "personal", "name": "Personal Projects"}
-    client = SpeckleClient(host=account.serverInfo.url)
-    client.authenticate_with_account(account)
+    client = get_authenticated_client(account)
     active_workspace = client.active_user.get_active_workspace()
     if active_workspace:
         return {"id": active_workspace.id, "name": active_workspace.name}
@@ -116,7 +192,7 @@ def get_active_workspace(account_id: str) -> Optional[Dict[str, str]]:
 
 
 def get_account_from_id(account_id: str) -> Optional[Account]:
-    return next((acc for acc in get_local_accounts() if acc.id == account_id), None)
+    return _refresh_account_registry().get(account_id)
 
 
 def reorder_tuple(tuple_list, target_id):
@@ -250,8 +326,7 @@ def can_create_project_in_workspace(account_id: str, workspace_id: str) -> bool:
     if not account:
         print(f"No account found for ID: {account_id}")
         return False
-    client = SpeckleClient(host=account.serverInfo.url)
-    client.authenticate_with_account(account)
+    client = get_authenticated_client(account)
 
     # wrap the workspace request in try/except and return False on any exception to keep the UI responsive.
 
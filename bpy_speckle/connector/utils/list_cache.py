@@ -0,0 +1,538 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import bpy
+from bpy.types import Context, WindowManager
+
+from .account_manager import (
+    can_create_project_in_workspace,
+    get_active_workspace,
+    get_workspaces,
+)
+from .project_manager import get_projects_page
+from .screen_queries import fetch_models_screen, fetch_projects_screen
+from .version_manager import get_latest_version, get_versions_page
+
+# cached lists younger than this are shown without being fetched again
+REVALIDATE_AFTER = 5.0
+
+# seconds typing has to pause before a search is sent
+SEARCH_DEBOUNCE = 0.4
+
+# seconds a latest version that came with the models list is trusted
+LATEST_VERSION_TTL = 60.0
+
+# seconds between two checks for finished background fetches
+RESULT_POLL_INTERVAL = 0.05
+
+# key -> (fetch time, value)
+_entries: Dict[Hashable, Tuple[float, Any]] = {}
+# key -> callbacks waiting for the running fetch of that key
+_pending: Dict[Hashable, List[Callable[[Any], None]]] = {}
+# list name -> key of the latest request, older responses are not applied
+_latest: Dict[str, Hashable] = {}
+# debounce name -> token of the latest call
+_debounced: Dict[str, object] = {}
+_lock = threading.Lock()
+
+# (key, finished future) put by the workers, stored and applied on the main
+# thread by _apply_results, workers never touch bpy
+_results: "queue.Queue[Tuple[Hashable, Future]]" = queue.Queue()
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="speckle-fetch")
+
+
+def get_cached(key: Hashable) -> Optional[Any]:
+    """
+    returns the cached value for key, however old it is
+    """
+    with _lock:
+        entry = _entries.get(key)
+    return entry[1] if entry else None
+
+
+def fetch_in_background(
+    key: Hashable,
+    fetch: Callable[[], Any],
+    on_done: Optional[Callable[[Any], None]] = None,
+) -> None:
+    """
+    runs fetch on a worker thread unless key was fetched moments ago or is
+    already being fetched. on_done gets the new value on Blender's main thread
+    """
+    with _lock:
+        entry = _entries.get(key)
+        if entry and time.monotonic() - entry[0] < REVALIDATE_AFTER:
+            return
+
+        callbacks = _pending.get(key)
+        if callbacks is not None:
+            if on_done:
+                callbacks.append(on_done)
+            return
+
+        _pending[key] = [on_done] if on_done else []
+
+    future = _executor.submit(fetch)
+    future.add_done_callback(lambda f: _results.put((key, f)))
+
+    if not bpy.app.timers.is_registered(_apply_results):
+        bpy.app.timers.register(_apply_results, first_interval=RESULT_POLL_INTERVAL)
+
+
+def _apply_results() -> Optional[float]:
+    """
+    timer on the main thread that stores finished fetches and runs their
+    callbacks, it unregisters itself once no fetch is running
+    """
+    applied = False
+    while True:
+        try:
+            key, future = _results.get_nowait()
+        except queue.Empty:
+            break
+        applied = _store(key, future) or applied
+
+    if applied:
+        _redraw()
+
+    with _lock:
+        running = bool(_pending)
+    return RESULT_POLL_INTERVAL if running else None
+
+
+def _store(key: Hashable, future: Future) -> bool:
+    try:
+        value = future.result()
+    except Exception as e:
+        print(f"Background fetch of {key} failed: {str(e)}")
+        value = None
+
+    with _lock:
+        callbacks = _pending.pop(key, [])
+        if value is not None:
+            _entries[key] = (time.monotonic(), value)
+
+    if value is None or not callbacks:
+        return False
+
+    for callback in callbacks:
+        try:
+            callback(value)
+        except Exception as e:
+            # the timer would stop applying results for good otherwise
+            print(f"Failed to apply the fetched {key}: {str(e)}")
+    return True
+
+
+def get_or_fetch(
+    list_name: str,
+    key: Hashable,
+    fetch: Callable[[], Any],
+    on_done: Callable[[Any], None],
+) -> Optional[Any]:
+    """
+    stale-while-revalidate: returns the cached value for key right away and
+    refreshes it in the background. on_done only runs if key is still the
+    latest request for list_name when the fresh value arrives
+    """
+    with _lock:
+        _latest[list_name] = key
+
+    def apply_if_latest(value: Any) -> None:
+        if _latest.get(list_name) == key:
+            on_done(value)
+
+    fetch_in_background(key, fetch, apply_if_latest)
+    return get_cached(key)
+
+
+def invalidate(predicate: Callable[[Hashable], bool]) -> None:
+    """
+    drops the cached values whose key matches predicate, together with their pages
+    """
+    with _lock:
+        for key in list(_entries):
+            # further pages are cached under (list key, cursor)
+            list_key = (
+                key[0] if isinstance(key, tuple) and isinstance(key[0], tuple) else key
+            )
+            if predicate(list_key):
+                del _entries[key]
+
+
+def debounce(
+    name: str, callback: Callable[[], None], delay: float = SEARCH_DEBOUNCE
+) -> None:
+    """
+    runs callback on the main thread after delay, unless debounce is called
+    again with the same name before that
+    """
+    token = object()
+    _debounced[name] = token
+
+    def run() -> None:
+        if _debounced.get(name) is token:
+            del _debounced[name]
+            callback()
+
+    bpy.app.timers.register(run, first_interval=delay)
+
+
+def _redraw() -> None:
+    window_manager = bpy.context.window_manager
+    if window_manager is None:
+        return
+    for window in window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
+
+
+def find_item(items, item_id: str) -> Optional[Any]:
+    """
+    returns the item of a shown list with item_id, None if it isn't in the list
+    """
+    if not item_id:
+        return None
+    return next((item for item in items if item.id == item_id), None)
+
+
+def sync_selection(operator, index_name: str, id_name: str, items) -> None:
+    """
+    keeps a dialog's highlighted row on the selected item when its list is swapped.
+    the item is remembered by id, the row index only follows it. with nothing
+    selected yet the highlighted row is taken, if the selected item is gone no
+    row is highlighted
+    """
+    selected_id = getattr(operator, id_name)
+    index = getattr(operator, index_name)
+    if not selected_id:
+        if 0 <= index < len(items):
+            setattr(operator, id_name, items[index].id)
+        return
+
+    position = next((i for i, item in enumerate(items) if item.id == selected_id), -1)
+    if position != index:
+        setattr(operator, index_name, position)
+
+
+def select_index(operator, index_name: str, id_name: str, items) -> None:
+    """
+    remembers the id of the row a dialog's list was clicked on
+    """
+    index = getattr(operator, index_name)
+    if 0 <= index < len(items):
+        setattr(operator, id_name, items[index].id)
+
+
+def _fill_workspaces(wm: WindowManager, workspaces) -> None:
+    wm.speckle_workspaces.clear()
+    for id, name in workspaces:
+        workspace = wm.speckle_workspaces.add()
+        workspace.id = id
+        workspace.name = name
+
+
+def _fill_projects(wm: WindowManager, projects) -> None:
+    wm.speckle_projects.clear()
+    for name, role, updated, id, can_receive in projects:
+        project = wm.speckle_projects.add()
+        project.name = name
+        project.role = role
+        project.updated = updated
+        project.id = id
+        project.can_receive = can_receive
+
+
+def _fill_models(wm: WindowManager, models) -> None:
+    wm.speckle_models.clear()
+    for name, id, updated in models:
+        model = wm.speckle_models.add()
+        model.name = name
+        model.updated = updated
+        model.id = id
+
+
+def _fill_versions(wm: WindowManager, versions) -> None:
+    wm.speckle_versions.clear()
+    for id, message, updated in versions:
+        version = wm.speckle_versions.add()
+        version.id = id
+        version.message = message
+        version.updated = updated
+
+
+def get_latest_version_cached(
+    account_id: str, project_id: str, model_id: str
+) -> Tuple[str, str, str]:
+    """
+    returns the model's latest version, reusing the one fetched with the models list
+    """
+    with _lock:
+        entry = _entries.get(("latest_version", account_id, project_id, model_id))
+    if entry and time.monotonic() - entry[0] < LATEST_VERSION_TTL:
+        return entry[1]
+    return get_latest_version(account_id, project_id, model_id)
+
+
+def _get_models_page(
+    account_id: str, project_id: str, search: Optional[str], cursor: Optional[str]
+) -> Optional[Tuple[List[Tuple[str, str, str]], Optional[str]]]:
+    screen = fetch_models_screen(account_id, project_id, search, cursor)
+    if screen is None:
+        return None
+
+    models, next_cursor, latest_versions = screen
+    now = time.monotonic()
+    with _lock:
+        for model_id, version in latest_versions.items():
+            key = ("latest_version", account_id, project_id, model_id)
+            _entries[key] = (now, version)
+    return models, next_cursor
+
+
+# list name -> (page fetch taking the key's values and a cursor, list fill)
+# keys of these lists are (list name, *page fetch arguments) and their
+# cached values are (items of all loaded pages, cursor of the next page).
+# a page fetch returns None when it failed, the cached list is kept then
+_paged_lists: Dict[
+    str, Tuple[Callable[..., Optional[Tuple[list, Optional[str]]]], Callable]
+] = {
+    "projects": (get_projects_page, _fill_projects),
+    "models": (_get_models_page, _fill_models),
+    "versions": (get_versions_page, _fill_versions),
+}
+
+
+def _refresh_paged_list(context: Context, key: Tuple) -> None:
+    list_name = key[0]
+    fetch_page, fill = _paged_lists[list_name]
+
+    page = get_or_fetch(
+        list_name,
+        key,
+        lambda: fetch_page(*key[1:], None),
+        lambda page: fill(bpy.context.window_manager, page[0]),
+    )
+    fill(context.window_manager, page[0] if page else [])
+
+
+def _prefetch_paged_list(key: Tuple) -> None:
+    fetch_page, _ = _paged_lists[key[0]]
+    fetch_in_background(key, lambda: fetch_page(*key[1:], None))
+
+
+def has_more(list_name: str) -> bool:
+    """
+    whether the list shown for list_name has pages that aren't loaded yet
+    """
+    key = _latest.get(list_name)
+    page = get_cached(key) if key is not None else None
+    return bool(page and page[1])
+
+
+def load_more(list_name: str) -> None:
+    """
+    fetches the next page of the list shown for list_name and appends it
+    """
+    key = _latest.get(list_name)
+    page = get_cached(key) if key is not None else None
+    if not page or not page[1]:
+        return
+
+    fetch_page, fill = _paged_lists[list_name]
+    cursor = page[1]
+
+    def append(next_page: Tuple[list, Optional[str]]) -> None:
+        with _lock:
+            entry = _entries.get(key)
+            # the list was fetched again or this page was appended already
+            if entry is None or entry[1][1] != cursor:
+                return
+            items = entry[1][0] + next_page[0]
+            _entries[key] = (entry[0], (items, next_page[1]))
+
+        if _latest.get(list_name) == key:
+            fill(bpy.context.window_manager, items)
+
+    # pages are cached under the list key and their cursor
+    page_key = (key, cursor)
+    cached_page = get_cached(page_key)
+    if cached_page is not None:
+        append(cached_page)
+        _redraw()
+    else:
+        fetch_in_background(page_key, lambda: fetch_page(*key[1:], cursor), append)
+
+
+def _fetch_projects_screen(account_id: str) -> Optional[Dict[str, Any]]:
+    screen = fetch_projects_screen(account_id)
+    if screen is None:
+        screen = _fetch_projects_screen_separately(account_id)
+    if screen is None:
+        return None
+
+    # the screen answers the lookups the dialogs would otherwise send one by one
+    workspace_id = screen["active_workspace"]["id"]
+    now = time.monotonic()
+    with _lock:
+        _entries[("workspaces", account_id)] = (now, screen["workspaces"])
+        _entries[("can_create_project", account_id, workspace_id)] = (
+            now,
+            screen["can_create_project"],
+        )
+        _entries[("projects", account_id, workspace_id, None)] = (
+            now,
+            screen["projects"],
+        )
+    return screen
+
+
+def _fetch_projects_screen_separately(account_id: str) -> Optional[Dict[str, Any]]:
+    """
+    the projects screen from the requests it replaced, for servers that fail
+    both screen queries
+    """
+    print("Fetching the projects screen list by list")
+    active_workspace = get_active_workspace(account_id)
+    projects = get_projects_page(account_id, active_workspace["id"])
+    if projects is None:
+        return None
+
+    return {
+        "workspaces": get_workspaces(account_id),
+        "active_workspace": active_workspace,
+        "can_create_project": can_create_project_in_workspace(
+            account_id, active_workspace["id"]
+        ),
+        "projects": projects,
+    }
+
+
+def _apply_projects_screen(
+    wm: WindowManager, account_id: str, screen: Dict[str, Any]
+) -> Hashable:
+    workspace = screen["active_workspace"]
+    wm.selected_workspace.id = workspace["id"]
+    wm.selected_workspace.name = workspace["name"]
+    wm.can_create_project_in_workspace = screen["can_create_project"]
+    _fill_workspaces(wm, screen["workspaces"])
+    _fill_projects(wm, screen["projects"][0])
+
+    projects_key = ("projects", account_id, workspace["id"], None)
+    with _lock:
+        _latest["projects"] = projects_key
+    return projects_key
+
+
+def refresh_projects_screen(context: Context) -> None:
+    """
+    shows the cached workspaces and projects of the selected account and fetches
+    all of them again in a single request
+    """
+    wm = context.window_manager
+    account_id = wm.selected_account_id
+    shown_key = None
+
+    def apply(screen: Dict[str, Any]) -> None:
+        nonlocal shown_key
+        wm = bpy.context.window_manager
+        # a search or workspace change made since then shows its own list
+        if wm.selected_account_id != account_id or _latest.get("projects") != shown_key:
+            return
+        shown_key = _apply_projects_screen(wm, account_id, screen)
+
+    with _lock:
+        _latest.pop("projects", None)
+
+    screen = get_or_fetch(
+        "projects_screen",
+        ("projects_screen", account_id),
+        lambda: _fetch_projects_screen(account_id),
+        apply,
+    )
+    if screen:
+        shown_key = _apply_projects_screen(wm, account_id, screen)
+    else:
+        wm.speckle_projects.clear()
+
+
+def refresh_workspaces_list(context: Context) -> None:
+    """
+    shows the cached workspaces of the selected account and fetches them again
+    """
+    wm = context.window_manager
+    account_id = wm.selected_account_id
+
+    workspaces = get_or_fetch(
+        "workspaces",
+        ("workspaces", account_id),
+        lambda: get_workspaces(account_id),
+        lambda workspaces: _fill_workspaces(bpy.context.window_manager, workspaces),
+    )
+    _fill_workspaces(wm, workspaces or [])
+
+
+def refresh_projects_list(context: Context, search: Optional[str] = None) -> None:
+    """
+    shows the cached projects of the selected workspace and fetches them again
+    """
+    wm = context.window_manager
+    account_id = wm.selected_account_id
+    workspace_id = wm.selected_workspace.id
+
+    _refresh_paged_list(context, ("projects", account_id, workspace_id, search))
+
+    def set_can_create(can_create: bool) -> None:
+        bpy.context.window_manager.can_create_project_in_workspace = can_create
+
+    can_create = get_or_fetch(
+        "can_create_project",
+        ("can_create_project", account_id, workspace_id),
+        lambda: can_create_project_in_workspace(account_id, workspace_id),
+        set_can_create,
+    )
+    wm.can_create_project_in_workspace = bool(can_create)
+
+
+def refresh_models_list(context: Context, search: Optional[str] = None) -> None:
+    """
+    shows the cached models of the selected project and fetches them again
+    """
+    wm = context.window_manager
+    _refresh_paged_list(
+        context, ("models", wm.selected_account_id, wm.selected_project_id, search)
+    )
+
+
+def refresh_versions_list(context: Context) -> None:
+    """
+    shows the cached versions of the selected model and fetches them again
+    """
+    wm = context.window_manager
+    _refresh_paged_list(
+        context,
+        (
+            "versions",
+            wm.selected_account_id,
+            wm.selected_project_id,
+            wm.selected_model_id,
+        ),
+    )
+
+
+def prefetch_models(account_id: str, project_id: str) -> None:
+    """
+    warms the cache with the models the next dialog is going to show
+    """
+    _prefetch_paged_list(("models", account_id, project_id, None))
+
+
+def prefetch_versions(account_id: str, project_id: str, model_id: str) -> None:
+    """
+    warms the cache with the versions the next dialog is going to show
+    """
+    _prefetch_paged_list(("versions", account_id, project_id, model_id))
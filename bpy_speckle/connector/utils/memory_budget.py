@@ -0,0 +1,228 @@
+import os
+import sys
+from typing import Dict, Optional, Tuple
+
+from specklepy.objects.graph_traversal.traversal import TraversalContext
+
+# budget in megabytes for loads in memory budget mode, by default a share of
+# the physical memory, e.g. SPECKLE_BLENDER_MEMORY_BUDGET_MB=12000
+BUDGET_ENV_VAR = "SPECKLE_BLENDER_MEMORY_BUDGET_MB"
+
+# share of the physical memory a load may use when no budget is set
+DEFAULT_BUDGET_SHARE = 0.8
+
+# memory left to the rest of the system, a load stops below it
+DEFAULT_RESERVE = 512 * 1024 * 1024
+
+DISPLAY_VALUE_PROPERTY_ALIASES = [
+    "displayValue",
+    "displayvalue",
+    "@displayValue",
+    "display_value",
+]
+
+
+def _windows_memory_status():
+    import ctypes
+    from ctypes import wintypes
+
+    class MEMORYSTATUSEX(ctypes.Structure):
+        _fields_ = [
+            ("dwLength", wintypes.DWORD),
+            ("dwMemoryLoad", wintypes.DWORD),
+            ("ullTotalPhys", ctypes.c_ulonglong),
+            ("ullAvailPhys", ctypes.c_ulonglong),
+            ("ullTotalPageFile", ctypes.c_ulonglong),
+            ("ullAvailPageFile", ctypes.c_ulonglong),
+            ("ullTotalVirtual", ctypes.c_ulonglong),
+            ("ullAvailVirtual", ctypes.c_ulonglong),
+            ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+        ]
+
+    status = MEMORYSTATUSEX()
+    status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+    ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status))
+    return status
+
+
+def _windows_process_rss() -> int:
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+    ctypes.windll.psapi.GetProcessMemoryInfo(
+        ctypes.windll.kernel32.GetCurrentProcess(),
+        ctypes.byref(counters),
+        counters.cb,
+    )
+    return counters.WorkingSetSize
+
+
+def process_rss() -> Optional[int]:
+    """
+    resident memory of blender in bytes, None where it can't be read.
+    on macOS this is the peak so far, which only makes a budget stricter
+    """
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        if sys.platform == "win32":
+            return _windows_process_rss()
+
+        import resource
+
+        # bytes on macOS, kilobytes elsewhere
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (OSError, ValueError, AttributeError, ImportError):
+        return None
+
+
+def total_memory() -> Optional[int]:
+    """
+    physical memory of the machine in bytes
+    """
+    try:
+        if sys.platform == "win32":
+            return _windows_memory_status().ullTotalPhys
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def available_memory() -> Optional[int]:
+    """
+    memory the system can still hand out in bytes, None where it can't be read
+    """
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/meminfo") as meminfo:
+                for line in meminfo:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) * 1024
+            return None
+        if sys.platform == "win32":
+            return _windows_memory_status().ullAvailPhys
+        return None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def default_budget() -> Optional[int]:
+    """
+    budget from SPECKLE_BLENDER_MEMORY_BUDGET_MB, or a share of the physical memory
+    """
+    budget_mb = os.environ.get(BUDGET_ENV_VAR)
+    if budget_mb:
+        try:
+            return int(float(budget_mb) * 1024 * 1024)
+        except ValueError:
+            print(f"Ignoring invalid {BUDGET_ENV_VAR}: {budget_mb}")
+
+    total = total_memory()
+    return int(total * DEFAULT_BUDGET_SHARE) if total else None
+
+
+class MemoryBudget:
+    """
+    limit a load checks its memory against, once exceeded it stays exceeded
+    and message says where and why
+    """
+
+    def __init__(
+        self, limit: Optional[int] = None, reserve: int = DEFAULT_RESERVE
+    ) -> None:
+        self.limit = limit if limit is not None else default_budget()
+        self.reserve = reserve
+        self.peak_rss = 0
+        self.message = ""
+
+    def exceeded(self, stage: str) -> bool:
+        """
+        True when blender uses more than the limit, or the system is about to
+        run out of memory
+        """
+        if self.message:
+            return True
+
+        rss = process_rss()
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss, rss)
+            if self.limit is not None and rss > self.limit:
+                self.message = (
+                    f"Load stopped during {stage}: Blender uses "
+                    f"{rss / 2**30:.1f} GB, over the memory budget of "
+                    f"{self.limit / 2**30:.1f} GB"
+                )
+                return True
+
+        available = available_memory()
+        if available is not None and available < self.reserve:
+            self.message = (
+                f"Load stopped during {stage}: only {available / 2**20:.0f} MB "
+                "of memory left"
+            )
+            return True
+
+        return False
+
+
+class ConvertedReleaser:
+    """
+    lets the speckle object of a traversal item be freed once its blender object
+    exists: drops its display values and the reference its parent holds.
+    nothing shared is modified, objects referenced elsewhere stay alive
+    """
+
+    def __init__(self) -> None:
+        # id(list) -> (list, id(item) -> index), finding an item stays O(1)
+        # in collections with many elements
+        self._positions: Dict[int, Tuple[list, Dict[int, int]]] = {}
+
+    def release(self, traversal_item: TraversalContext) -> None:
+        speckle_obj = traversal_item.current
+        for alias in DISPLAY_VALUE_PROPERTY_ALIASES:
+            if getattr(speckle_obj, alias, None):
+                _clear_member(speckle_obj, alias, [])
+
+        parent = traversal_item.parent
+        member_name = traversal_item.member_name
+        if parent is None or member_name is None:
+            return
+
+        member = getattr(parent.current, member_name, None)
+        if member is speckle_obj:
+            _clear_member(parent.current, member_name, None)
+        elif isinstance(member, list):
+            cached = self._positions.get(id(member))
+            if cached is None:
+                positions = {id(item): index for index, item in enumerate(member)}
+                # the list is kept with its positions so its id isn't reused
+                cached = self._positions[id(member)] = (member, positions)
+            index = cached[1].pop(id(speckle_obj), None)
+            if index is not None and member[index] is speckle_obj:
+                member[index] = None
+
+
+def _clear_member(speckle_obj, member_name: str, empty) -> None:
+    try:
+        setattr(speckle_obj, member_name, empty)
+    except Exception:
+        # typed members refuse values of another type, the object stays as is
+        pass
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 import re
+from typing import Optional
 
 def format_relative_time(timestamp) -> str:
     """
@@ -48,4 +49,19 @@ def format_role(role: str) -> str:
 
 def strip_non_ascii(text):
     # Keep English letters, digits, spaces and basic punctuation
-    return re.sub(r'[^a-zA-Z0-9\s.,!?]', '', text)
\ No newline at end of file
+    return re.sub(r'[^a-zA-Z0-9\s.,!?]', '', text)
+
+def next_page_cursor(collection, page_size: int) -> Optional[str]:
+    """
+    returns the cursor of the page after a fetched collection, None if it was the last page.
+    takes the client's collections as well as the dicts of raw query responses
+    """
+    if isinstance(collection, dict):
+        items, cursor = collection["items"], collection.get("cursor")
+    else:
+        items, cursor = collection.items, collection.cursor
+
+    # the server keeps returning a cursor after the last page
+    if len(items) < page_size:
+        return None
+    return cursor
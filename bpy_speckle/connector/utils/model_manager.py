@@ -1,46 +1,67 @@
-from specklepy.core.api.client import SpeckleClient
-from specklepy.core.api.credentials import get_local_accounts, Account
+from specklepy.core.api.credentials import Account
 from specklepy.core.api.inputs.project_inputs import ProjectModelsFilter
 from specklepy.core.api.models.current import Model
 from typing import List, Tuple, Optional
-from .misc import format_relative_time, strip_non_ascii
+from .misc import format_relative_time, next_page_cursor, strip_non_ascii
+from .account_manager import get_account_from_id, get_authenticated_client
+
+# number of models fetched per request, further pages are loaded on demand
+PAGE_SIZE = 25
 
 
 def get_models_for_project(
     account_id: str, project_id: str, search: Optional[str] = None
 ) -> List[Tuple[str, str, str]]:
     """
-    fetches models for a given project from the Speckle server
+    fetches the first page of models for a given project from the Speckle server
+    """
+    page = get_models_page(account_id, project_id, search)
+    return page[0] if page else []
+
+
+def get_models_page(
+    account_id: str,
+    project_id: str,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> Optional[Tuple[List[Tuple[str, str, str]], Optional[str]]]:
+    """
+    fetches the page of models after cursor
+    returns the models and the cursor of the next page, None if this was the last one.
+    returns None if the page couldn't be fetched, so a cached list isn't replaced
     """
     try:
         if not account_id or not project_id:
             print(
                 f"Error: Invalid inputs - account_id: {account_id}, project_id: {project_id}"
             )
-            return []
+            return None
 
         # Get the account info
-        account: Optional[Account] = next(
-            (acc for acc in get_local_accounts() if acc.id == account_id), None
-        )
+        account: Optional[Account] = get_account_from_id(account_id)
         if not account:
             print(f"Error: Could not find account with ID: {account_id}")
-            return []
+            return None
 
-        client = SpeckleClient(host=account.serverInfo.url)
-        client.authenticate_with_account(account)
+        client = get_authenticated_client(account)
 
-        try:
-            client.project.get(project_id)
-        except Exception as e:
-            print(f"Error: Project with ID {project_id} not found: {str(e)}")
-            return []
+        # the first page already made sure the project exists
+        if cursor is None:
+            try:
+                client.project.get(project_id)
+            except Exception as e:
+                print(f"Error: Project with ID {project_id} not found: {str(e)}")
+                return None
 
         filter = ProjectModelsFilter(search=search) if search else None
 
-        models: List[Model] = client.model.get_models(
-            project_id=project_id, models_limit=10, models_filter=filter
-        ).items
+        models = client.model.get_models(
+            project_id=project_id,
+            models_limit=PAGE_SIZE,
+            models_cursor=cursor,
+            models_filter=filter,
+        )
+        items: List[Model] = models.items
 
         return [
             (
@@ -48,9 +69,9 @@ def get_models_for_project(
                 model.id,
                 format_relative_time(model.updated_at),
             )
-            for model in models
-        ]
+            for model in items
+        ], next_page_cursor(models, PAGE_SIZE)
 
     except Exception as e:
         print(f"Error fetching models: {str(e)}")
-        return []
+        return None
@@ -0,0 +1,410 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from specklepy.transports.abstract_transport import AbstractTransport
+
+from .memory_budget import process_rss
+
+# set to 0 to turn the timings off, e.g. SPECKLE_BLENDER_TIMINGS=0
+TIMINGS_ENV_VAR = "SPECKLE_BLENDER_TIMINGS"
+
+# set to 1 to also trace python allocations per phase, slows operations down
+TRACEMALLOC_ENV_VAR = "SPECKLE_BLENDER_TRACEMALLOC"
+
+# timing logs kept in the log directory, older ones are deleted
+MAX_LOG_FILES = 100
+
+# seconds between two samples of the resident memory
+MEMORY_SAMPLE_INTERVAL = 0.05
+
+_enabled = os.environ.get(TIMINGS_ENV_VAR, "1") != "0"
+_trace_memory = os.environ.get(TRACEMALLOC_ENV_VAR, "0") == "1"
+_log_directory: Optional[Path] = None
+
+# operation -> summary of its latest run
+_last_summaries: Dict[str, Dict[str, Any]] = {}
+
+
+class PhaseTiming:
+    """
+    wall time, calls, object count, bytes and peak memory of one phase, a phase
+    entered several times accumulates
+    """
+
+    __slots__ = (
+        "name",
+        "seconds",
+        "calls",
+        "objects",
+        "bytes",
+        "rss_peak",
+        "traced_peak",
+        "_timer",
+        "_start",
+    )
+
+    def __init__(self, name: str, timer: "OperationTimer") -> None:
+        self.name = name
+        self.seconds = 0.0
+        self.calls = 0
+        self.objects = 0
+        self.bytes = 0
+        self.rss_peak = 0
+        self.traced_peak = 0
+        self._timer = timer
+        self._start = 0.0
+
+    def __enter__(self) -> "PhaseTiming":
+        self._timer._enter_phase(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        now = time.perf_counter()
+        self.seconds += now - self._start
+        self.calls += 1
+        self._timer._exit_phase(self, now)
+
+    def add(self, objects: int = 0, bytes: int = 0) -> None:
+        self.objects += objects
+        self.bytes += bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "seconds": self.seconds,
+            "calls": self.calls,
+            "objects": self.objects,
+            "bytes": self.bytes,
+            # None when the phase was too short to be sampled
+            "rss_peak": self.rss_peak or None,
+            "traced_peak": self.traced_peak or None,
+        }
+
+
+class _NullPhase:
+    """
+    stands in for a phase while the timings are off
+    """
+
+    def __enter__(self) -> "_NullPhase":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+    def add(self, objects: int = 0, bytes: int = 0) -> None:
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class OperationTimer:
+    """
+    records the phases of one load or publish. the resident memory is sampled
+    by a background thread and at phase boundaries, and attributed to the
+    innermost running phase. with SPECKLE_BLENDER_TRACEMALLOC=1 the exact peak of
+    python allocations is recorded per phase as well
+    """
+
+    def __init__(self, operation: str, details: Dict[str, Any]) -> None:
+        self.operation = operation
+        self.details = details
+        self.started_at = datetime.now(timezone.utc)
+        self.phases: Dict[str, PhaseTiming] = {}
+        self._start = time.perf_counter()
+
+        self.rss_start = process_rss()
+        self.rss_peak = self.rss_start or 0
+        self.traced_peak = 0
+        # phases entered and not exited yet, the innermost last
+        self._active: List[PhaseTiming] = []
+        self._last_sample = self._start
+
+        # an allocation trace someone else started isn't reset or stopped
+        self._tracing = _trace_memory and not tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.start()
+
+        self._stop_sampling = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        if self.rss_start is not None:
+            self._sampler = threading.Thread(
+                target=self._sample_memory_until_finished,
+                name="speckle-memory-sampler",
+                daemon=True,
+            )
+            self._sampler.start()
+
+    def phase(self, name: str) -> PhaseTiming:
+        """
+        context manager timing a phase, entering the same phase again adds to it
+        """
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = PhaseTiming(name, self)
+        return phase
+
+    def _sample_memory(self) -> None:
+        rss = process_rss()
+        if rss is None:
+            return
+        self.rss_peak = max(self.rss_peak, rss)
+        try:
+            phase = self._active[-1]
+        except IndexError:
+            return
+        phase.rss_peak = max(phase.rss_peak, rss)
+
+    def _sample_memory_until_finished(self) -> None:
+        while not self._stop_sampling.wait(MEMORY_SAMPLE_INTERVAL):
+            self._sample_memory()
+
+    def _record_traced_peak(self) -> None:
+        # the peak since the last reset belongs to every running phase
+        peak = tracemalloc.get_traced_memory()[1]
+        self.traced_peak = max(self.traced_peak, peak)
+        for phase in self._active:
+            phase.traced_peak = max(phase.traced_peak, peak)
+
+    def _enter_phase(self, phase: PhaseTiming) -> None:
+        if self._tracing:
+            self._record_traced_peak()
+            tracemalloc.reset_peak()
+        self._active.append(phase)
+
+    def _exit_phase(self, phase: PhaseTiming, now: float) -> None:
+        if self._tracing:
+            self._record_traced_peak()
+        # the background thread may not get to run during long blender calls
+        if now - self._last_sample >= MEMORY_SAMPLE_INTERVAL:
+            self._last_sample = now
+            self._sample_memory()
+        if self._active and self._active[-1] is phase:
+            self._active.pop()
+
+    def finish(self, success: bool = True, **details: Any) -> Dict[str, Any]:
+        """
+        ends the operation, stores and logs its summary
+        """
+        global _current
+
+        seconds = time.perf_counter() - self._start
+        if self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join(timeout=1.0)
+            self._sample_memory()
+        if self._tracing:
+            self._record_traced_peak()
+            tracemalloc.stop()
+
+        phases = [phase.to_dict() for phase in self.phases.values()]
+        summary = {
+            "operation": self.operation,
+            "started_at": self.started_at.isoformat(),
+            "success": success,
+            "seconds": seconds,
+            # time spent outside of any phase
+            "unaccounted_seconds": max(
+                seconds - sum(phase["seconds"] for phase in phases), 0.0
+            ),
+            "rss_start": self.rss_start,
+            "rss_end": process_rss(),
+            "rss_peak": self.rss_peak or None,
+            "traced_peak": self.traced_peak or None,
+            "phases": phases,
+            **self.details,
+            **details,
+        }
+
+        _last_summaries[self.operation] = summary
+        if _current is self:
+            _current = _NULL_TIMER
+        write_log(summary)
+        return summary
+
+
+class _NullTimer:
+    """
+    stands in for the timer while the timings are off
+    """
+
+    operation = ""
+
+    def phase(self, name: str) -> _NullPhase:
+        return _NULL_PHASE
+
+    def finish(self, success: bool = True, **details: Any) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+# timer of the running operation, helpers add their phases to it
+_current = _NULL_TIMER
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+def set_memory_tracing(enabled: bool) -> None:
+    """
+    traces python allocations per phase from the next operation on
+    """
+    global _trace_memory
+    _trace_memory = enabled
+
+
+def start_operation(operation: str, **details: Any) -> OperationTimer:
+    """
+    starts timing a "load" or "publish", details end up in the summary
+    """
+    global _current
+
+    _current = OperationTimer(operation, details) if _enabled else _NULL_TIMER
+    return _current
+
+
+def current_timer() -> OperationTimer:
+    """
+    the timer of the running operation, a no-op timer outside of one
+    """
+    return _current
+
+
+def get_last_summary(operation: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    the summary of the latest operation, or of the latest one of the given kind
+    """
+    if operation is not None:
+        return _last_summaries.get(operation)
+    if not _last_summaries:
+        return None
+    return max(_last_summaries.values(), key=lambda summary: summary["started_at"])
+
+
+def format_summary(summary: Optional[Dict[str, Any]], limit: int = 3) -> str:
+    """
+    one line with the total time and the slowest phases, for the model card
+    """
+    if not summary:
+        return ""
+
+    slowest = sorted(summary["phases"], key=lambda phase: -phase["seconds"])[:limit]
+    parts = [_format_seconds(summary["seconds"])]
+    parts.extend(
+        f"{phase['name']} {_format_seconds(phase['seconds'])}" for phase in slowest
+    )
+    return " · ".join(parts)
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1.0:
+        return f"{seconds * 1000:.0f}ms"
+    return f"{seconds:.1f}s"
+
+
+def log_directory() -> Path:
+    """
+    where the timing logs go, next to the other Speckle connector logs by default
+    """
+    if _log_directory is not None:
+        return _log_directory
+
+    from specklepy.core.helpers import speckle_path_provider
+
+    return speckle_path_provider.user_speckle_folder_path() / "Logs" / "Blender"
+
+
+def set_log_directory(path: Optional[Path]) -> None:
+    global _log_directory
+    _log_directory = Path(path) if path is not None else None
+
+
+def write_log(summary: Dict[str, Any]) -> Optional[Path]:
+    """
+    writes the summary as JSON and prunes the oldest logs
+    """
+    try:
+        directory = log_directory()
+        directory.mkdir(parents=True, exist_ok=True)
+
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        path = directory / (
+            f"timings-{stamp}-{summary['operation']}-{uuid.uuid4().hex[:8]}.json"
+        )
+        path.write_text(json.dumps(summary, indent=2, default=str))
+
+        logs: List[Path] = sorted(directory.glob("timings-*.json"))
+        for old_log in logs[:-MAX_LOG_FILES]:
+            old_log.unlink(missing_ok=True)
+        return path
+    except OSError as e:
+        print(f"Failed to write the timing log: {str(e)}")
+        return None
+
+
+class ByteCountingTransport(AbstractTransport):
+    """
+    passes everything through to a transport, counting the objects and bytes
+    saved to it into a phase
+    """
+
+    def __init__(self, transport: AbstractTransport, phase: PhaseTiming) -> None:
+        self._transport = transport
+        self._phase = phase
+
+    @property
+    def name(self) -> str:
+        return self._transport.name
+
+    def begin_write(self) -> None:
+        self._transport.begin_write()
+
+    def end_write(self) -> None:
+        self._transport.end_write()
+
+    def save_object(self, id: str, serialized_object: str) -> None:
+        self._phase.add(objects=1, bytes=len(serialized_object))
+        self._transport.save_object(id, serialized_object)
+
+    def save_object_from_transport(
+        self, id: str, source_transport: AbstractTransport
+    ) -> None:
+        self.save_object(id, source_transport.get_object(id))
+
+    def get_object(self, id: str) -> Optional[str]:
+        return self._transport.get_object(id)
+
+    def has_objects(self, id_list: List[str]) -> Dict[str, bool]:
+        return self._transport.has_objects(id_list)
+
+    def copy_object_and_children(
+        self, id: str, target_transport: AbstractTransport
+    ) -> str:
+        return self._transport.copy_object_and_children(id, target_transport)
+
+
+def counting_transport(
+    transport: AbstractTransport, phase: PhaseTiming
+) -> AbstractTransport:
+    """
+    wraps the transport to count into phase, only while the timings are on
+    """
+    if isinstance(phase, _NullPhase):
+        return transport
+    return ByteCountingTransport(transport, phase)
@@ -1,37 +1,62 @@
+import json
+import time
+from gql import gql
 from specklepy.core.api.client import SpeckleClient
-from specklepy.core.api.credentials import get_local_accounts
-from specklepy.core.api.resources.current.workspace_resource import WorkspaceResource
 from specklepy.core.api.inputs.project_inputs import WorksaceProjectsFilter
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from specklepy.core.api.credentials import Account
-from .misc import format_relative_time, format_role, strip_non_ascii
+from .misc import (
+    format_relative_time,
+    format_role,
+    next_page_cursor,
+    strip_non_ascii,
+)
+from .account_manager import get_account_from_id, get_authenticated_client
+
+# number of projects fetched per request, further pages are loaded on demand
+PAGE_SIZE = 25
+
+# seconds a project's load permission is reused before it is checked again
+PERMISSION_CACHE_TTL = 300.0
+
+# (account id, project id) -> (check time, can load)
+_load_permissions: Dict[Tuple[str, str], Tuple[float, bool]] = {}
 
 
 def get_projects_for_account(
     account_id: str, workspace_id: str = None, search: Optional[str] = None
 ) -> List[Tuple[str, str, str, str, bool]]:
     """
-    fetches projects for a given account from the Speckle server
+    fetches the first page of projects for a given account from the Speckle server
+    """
+    page = get_projects_page(account_id, workspace_id, search)
+    return page[0] if page else []
+
+
+def get_projects_page(
+    account_id: str,
+    workspace_id: str = None,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> Optional[Tuple[List[Tuple[str, str, str, str, bool]], Optional[str]]]:
+    """
+    fetches the page of projects after cursor
+    returns the projects and the cursor of the next page, None if this was the last one.
+    returns None if the page couldn't be fetched, so a cached list isn't replaced
     """
     try:
-        accounts: List[Account] = get_local_accounts()
-        account: Optional[Account] = next(
-            (acc for acc in accounts if acc.id == account_id), None
-        )
+        account: Optional[Account] = get_account_from_id(account_id)
         if not account:
-            return []
+            return None
 
-        client = SpeckleClient(host=account.serverInfo.url)
-        client.authenticate_with_account(account)
+        client = get_authenticated_client(account)
 
         if workspace_id == "personal":
-            return _get_personal_projects_with_permissions(client, account, search)
-
-        try:
-            workspace_resource = WorkspaceResource(
-                account, client.url, client.httpclient, client.server.version()
+            return _get_personal_projects_with_permissions(
+                client, account, search, cursor
             )
 
+        try:
             # create filter with search parameter
             filter = (
                 WorksaceProjectsFilter(search=search, with_project_role_only=False)
@@ -39,43 +64,21 @@ def get_projects_for_account(
                 else None
             )
 
-            projects_with_permissions = (
-                workspace_resource.get_projects_with_permissions(
-                    workspace_id=workspace_id, limit=10, filter=filter
-                )
+            projects_with_permissions = client.workspace.get_projects_with_permissions(
+                workspace_id=workspace_id, limit=PAGE_SIZE, cursor=cursor, filter=filter
             )
 
-            result = []
-            for project in projects_with_permissions.items:
-                can_load_permission = False
-
-                if hasattr(project, "permissions") and project.permissions:
-                    can_load_permission = (
-                        hasattr(project.permissions, "can_load")
-                        and project.permissions.can_load
-                        and project.permissions.can_load.authorized
-                    )
-
-                result.append(
-                    (
-                        strip_non_ascii(project.name),
-                        format_role(getattr(project, "role", ""))
-                        if hasattr(project, "role") and project.role
-                        else "",
-                        format_relative_time(project.updated_at),
-                        project.id,
-                        can_load_permission,
-                    )
-                )
-
-            return result
+            return [
+                project_item(project, _can_load_from_permissions(project))
+                for project in projects_with_permissions.items
+            ], next_page_cursor(projects_with_permissions, PAGE_SIZE)
 
         except Exception as workspace_error:
             print(
                 f"WorkspaceResource failed, falling back to old method: {workspace_error}"
             )
             return _get_projects_with_individual_permissions(
-                client, account, workspace_id, search
+                client, account, workspace_id, search, cursor
             )
 
     except Exception as e:
@@ -84,17 +87,19 @@ def get_projects_for_account(
         error_msg = f"Error: {str(e)}\n"
         error_msg += f"Traceback:\n{''.join(traceback.format_tb(e.__traceback__))}"
         print(error_msg)
-        return []
+        return None
 
 
 def _get_personal_projects_with_permissions(
-    client: SpeckleClient, account: Account, search: Optional[str] = None
-) -> List[Tuple[str, str, str, str, bool]]:
+    client: SpeckleClient,
+    account: Account,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Tuple[str, str, str, str, bool]], Optional[str]]:
     """
-    helper function to get personal projects with permissions using the old method
+    helper function to get personal projects with permissions
     """
     from specklepy.core.api.inputs.user_inputs import UserProjectsFilter
-    from .account_manager import can_load
 
     filter = UserProjectsFilter(
         search=search,
@@ -103,25 +108,7 @@ def _get_personal_projects_with_permissions(
         include_implicit_access=True,
     )
 
-    projects = client.active_user.get_projects(limit=10, filter=filter).items
-
-    result = []
-    for project in projects:
-        can_load_permission, _ = can_load(client, project)
-
-        result.append(
-            (
-                strip_non_ascii(project.name),
-                format_role(getattr(project, "role", ""))
-                if hasattr(project, "role") and project.role
-                else "",
-                format_relative_time(project.updated_at),
-                project.id,
-                can_load_permission,
-            )
-        )
-
-    return result
+    return _get_user_projects_with_permissions(client, account, filter, cursor)
 
 
 def _get_projects_with_individual_permissions(
@@ -129,12 +116,12 @@ def _get_projects_with_individual_permissions(
     account: Account,
     workspace_id: str,
     search: Optional[str] = None,
-) -> List[Tuple[str, str, str, str, bool]]:
+    cursor: Optional[str] = None,
+) -> Tuple[List[Tuple[str, str, str, str, bool]], Optional[str]]:
     """
-    Fallback helper function to get projects with permissions using individual API calls
+    Fallback helper function to get workspace projects through the active user
     """
     from specklepy.core.api.inputs.user_inputs import UserProjectsFilter
-    from .account_manager import can_load
 
     filter = UserProjectsFilter(
         search=search,
@@ -143,22 +130,104 @@ def _get_projects_with_individual_permissions(
         include_implicit_access=True,
     )
 
-    projects = client.active_user.get_projects(limit=10, filter=filter).items
+    return _get_user_projects_with_permissions(client, account, filter, cursor)
 
-    result = []
-    for project in projects:
-        can_load_permission, _ = can_load(client, project)
-
-        result.append(
-            (
-                strip_non_ascii(project.name),
-                format_role(getattr(project, "role", ""))
-                if hasattr(project, "role") and project.role
-                else "",
-                format_relative_time(project.updated_at),
-                project.id,
-                can_load_permission,
-            )
+
+def _get_user_projects_with_permissions(
+    client: SpeckleClient, account: Account, filter, cursor: Optional[str] = None
+) -> Tuple[List[Tuple[str, str, str, str, bool]], Optional[str]]:
+    """
+    gets the active user's projects with their permissions in the same query,
+    servers without that query get one batched permission query instead
+    """
+    try:
+        projects = client.active_user.get_projects_with_permissions(
+            limit=PAGE_SIZE, cursor=cursor, filter=filter
         )
+        return [
+            project_item(project, _can_load_from_permissions(project))
+            for project in projects.items
+        ], next_page_cursor(projects, PAGE_SIZE)
+    except Exception as e:
+        print(f"Projects with permissions query failed: {str(e)}")
+
+    projects = client.active_user.get_projects(
+        limit=PAGE_SIZE, cursor=cursor, filter=filter
+    )
+    load_permissions = _get_load_permissions(client, account, projects.items)
+
+    return [
+        project_item(project, load_permissions[project.id])
+        for project in projects.items
+    ], next_page_cursor(projects, PAGE_SIZE)
+
+
+def _get_load_permissions(
+    client: SpeckleClient, account: Account, projects
+) -> Dict[str, bool]:
+    """
+    checks the load permission of several projects, projects that aren't cached
+    are checked together in a single aliased query
+    """
+    now = time.monotonic()
+    load_permissions: Dict[str, bool] = {}
+    unchecked: List[str] = []
+
+    for project in projects:
+        cached = _load_permissions.get((account.id, project.id))
+        if cached and now - cached[0] < PERMISSION_CACHE_TTL:
+            load_permissions[project.id] = cached[1]
+        else:
+            unchecked.append(project.id)
+
+    if not unchecked:
+        return load_permissions
+
+    query = " ".join(
+        f"p{i}: project(id: {json.dumps(project_id)}) "
+        "{ permissions { canLoad { authorized } } }"
+        for i, project_id in enumerate(unchecked)
+    )
 
-    return result
+    try:
+        response = client.httpclient.execute(gql(f"query {{ {query} }}"))
+    except Exception as e:
+        print(f"Failed to check permissions: {str(e)}")
+        response = None
+
+    for i, project_id in enumerate(unchecked):
+        if response is None:
+            load_permissions[project_id] = False
+            continue
+
+        permissions = (response.get(f"p{i}") or {}).get("permissions") or {}
+        authorized = bool((permissions.get("canLoad") or {}).get("authorized"))
+        load_permissions[project_id] = authorized
+        _load_permissions[(account.id, project_id)] = (now, authorized)
+
+    return load_permissions
+
+
+def _can_load_from_permissions(project) -> bool:
+    return bool(
+        hasattr(project, "permissions")
+        and project.permissions
+        and hasattr(project.permissions, "can_load")
+        and project.permissions.can_load
+        and project.permissions.can_load.authorized
+    )
+
+
+def project_item(project, can_load_permission: bool) -> Tuple[str, str, str, str, bool]:
+    """
+    the row a project list shows for a project
+    """
+    return (
+        strip_non_ascii(project.name),
+        format_role(getattr(project, "role", ""))
+        if hasattr(project, "role") and project.role
+        else "",
+        format_relative_time(project.updated_at),
+        project.id,
+        can_load_permission,
+    )
@@ -2,6 +2,22 @@ import bpy
 from typing import Dict, Any
 
 
+class speckle_account(bpy.types.PropertyGroup):
+    id: bpy.props.StringProperty()  # type: ignore
+    user_name: bpy.props.StringProperty()  # type: ignore
+    server_url: bpy.props.StringProperty()  # type: ignore
+    user_email: bpy.props.StringProperty()  # type: ignore
+
+
+class speckle_workspace(bpy.types.PropertyGroup):
+    """
+    PropertyGroup for storing workspace information
+    """
+
+    id: bpy.props.StringProperty(name="ID")  # type: ignore
+    name: bpy.props.StringProperty()  # type: ignore
+
+
 class speckle_project(bpy.types.PropertyGroup):
     """
     PropertyGroup for storing project information
@@ -97,11 +113,31 @@ class speckle_model_card(bpy.types.PropertyGroup):
         description="Mode of loading instances",
         default="INSTANCE_PROXIES",
     )  # type: ignore
+    merge_curves: bpy.props.BoolProperty(
+        name="Merge Curves",
+        description="Load simple curves of each collection as a single curve object",
+        default=False,
+    )  # type: ignore
+    point_loading_mode: bpy.props.StringProperty(
+        name="Point Loading Mode",
+        description="Mode of loading points",
+        default="EMPTIES",
+    )  # type: ignore
+    memory_budget: bpy.props.BoolProperty(
+        name="Memory Budget",
+        description="Free Speckle data early and stop loads before running out of memory",
+        default=False,
+    )  # type: ignore
     apply_modifiers: bpy.props.BoolProperty(
         name="Apply Modifiers",
         description="Apply modifiers to the objects",
         default=True,
     )  # type: ignore
+    timing_summary: bpy.props.StringProperty(
+        name="Timing Summary",
+        description="Total time and slowest phases of the last load or publish",
+        default="",
+    )  # type: ignore
 
     def get_model_card_id(self) -> str:
         if not self.project_id or not self.model_id:
@@ -0,0 +1,275 @@
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import bpy
+from bpy.types import Context
+
+from ... import bl_info
+from ...converter.utils import MATERIAL_HASH_PROPERTY, build_material_index
+
+# set to 1 to keep converted versions and append them when they're loaded again,
+# e.g. SPECKLE_BLENDER_SCENE_CACHE=1. off by default, versions are written and
+# evicted on the main thread once they're loaded
+SCENE_CACHE_ENV_VAR = "SPECKLE_BLENDER_SCENE_CACHE"
+
+# size limit of the cache in megabytes, e.g. SPECKLE_BLENDER_SCENE_CACHE_MB=4096
+SIZE_LIMIT_ENV_VAR = "SPECKLE_BLENDER_SCENE_CACHE_MB"
+
+DEFAULT_SIZE_LIMIT = 2 * 1024 * 1024 * 1024
+
+# bump when converted versions change, cached ones are converted again
+CACHE_FORMAT = 2
+
+_enabled = os.environ.get(SCENE_CACHE_ENV_VAR, "0") == "1"
+_cache_directory: Optional[Path] = None
+_size_limit: Optional[int] = None
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+def cache_directory() -> Path:
+    """
+    where converted versions are kept, next to the other Speckle data by default
+    """
+    if _cache_directory is not None:
+        return _cache_directory
+
+    from specklepy.core.helpers import speckle_path_provider
+
+    return speckle_path_provider.user_speckle_folder_path() / "Blender" / "SceneCache"
+
+
+def set_cache_directory(path: Optional[Path]) -> None:
+    global _cache_directory
+    _cache_directory = Path(path) if path is not None else None
+
+
+def size_limit() -> int:
+    """
+    bytes the cache may take, from SPECKLE_BLENDER_SCENE_CACHE_MB or the default
+    """
+    if _size_limit is not None:
+        return _size_limit
+
+    limit_mb = os.environ.get(SIZE_LIMIT_ENV_VAR)
+    if limit_mb:
+        try:
+            return int(float(limit_mb) * 1024 * 1024)
+        except ValueError:
+            print(f"Ignoring invalid {SIZE_LIMIT_ENV_VAR}: {limit_mb}")
+    return DEFAULT_SIZE_LIMIT
+
+
+def set_size_limit(limit: Optional[int]) -> None:
+    global _size_limit
+    _size_limit = limit
+
+
+def cache_key(
+    server_url: str, project_id: str, model_id: str, version_id: str, **options: Any
+) -> str:
+    """
+    names the cached conversion of a version. ids are only unique on their server,
+    and the loading options, the connector and the Blender version change what a
+    conversion gives, so they're all hashed in
+    """
+    options_hash = hashlib.md5(
+        json.dumps(
+            [
+                CACHE_FORMAT,
+                server_url.rstrip("/"),
+                bl_info["version"],
+                bpy.app.version[:2],
+                options,
+            ],
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()[:8]
+    ids = (
+        re.sub(r"[^\w-]", "_", part or "")
+        for part in (project_id, model_id, version_id)
+    )
+    return "_".join((*ids, options_hash))
+
+
+def _entry_paths(key: str) -> Tuple[Path, Path]:
+    directory = cache_directory()
+    return directory / f"{key}.blend", directory / f"{key}.json"
+
+
+def load_cached_version(
+    context: Context, key: str
+) -> Optional[
+    Tuple[Dict[str, Union[bpy.types.Collection, bpy.types.Object]], Dict[str, Any]]
+]:
+    """
+    appends a cached version to the scene, returns what load_operation would
+    for it with the version details it was stored with, or None when the
+    version isn't cached
+    """
+    blend_path, manifest_path = _entry_paths(key)
+    if not blend_path.exists() or not manifest_path.exists():
+        return None
+
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError) as e:
+        print(f"Ignoring the unreadable scene cache entry {key}: {str(e)}")
+        return None
+    if manifest.get("format") != CACHE_FORMAT:
+        return None
+
+    material_index = build_material_index()
+    existing_materials = {material.name for material in bpy.data.materials}
+
+    try:
+        with bpy.data.libraries.load(str(blend_path), link=False) as (_, data_to):
+            data_to.collections = list(manifest["collections"])
+            data_to.objects = list(manifest["objects"])
+    except (OSError, RuntimeError) as e:
+        print(f"Failed to load {key} from the scene cache: {str(e)}")
+        return None
+
+    appended = {
+        "collections": list(data_to.collections),
+        "objects": list(data_to.objects),
+    }
+    root_collection = appended["collections"][manifest["root_collection"]]
+    if root_collection is None:
+        print(f"Scene cache entry {key} has no root collection")
+        return None
+
+    # appended materials built from the same render material as one already in
+    # the file are replaced by it, like a conversion would reuse it
+    for material in list(bpy.data.materials):
+        if material.name in existing_materials:
+            continue
+        existing = material_index.get(material.get(MATERIAL_HASH_PROPERTY))
+        if existing is not None:
+            material.user_remap(existing)
+            bpy.data.materials.remove(material)
+
+    context.scene.collection.children.link(root_collection)
+
+    # marks the entry as the most recently used one
+    os.utime(blend_path)
+
+    converted = {
+        speckle_id: appended[kind][position]
+        for speckle_id, (kind, position) in manifest["converted"].items()
+        if appended[kind][position] is not None
+    }
+    return converted, manifest.get("version", {})
+
+
+def store_version(
+    key: str,
+    root_collection: bpy.types.Collection,
+    definitions_collection: Optional[bpy.types.Collection],
+    converted_objects: Dict[str, Union[bpy.types.Collection, bpy.types.Object]],
+    **details: Any,
+) -> Optional[Path]:
+    """
+    writes a converted version into the cache, then evicts the least recently
+    used versions over the size limit
+    """
+    collections: List[str] = []
+    objects: List[str] = []
+    # (kind, name) -> position in the appended lists
+    positions: Dict[Tuple[str, str], int] = {}
+
+    def position(datablock: Union[bpy.types.Collection, bpy.types.Object]) -> list:
+        if isinstance(datablock, bpy.types.Collection):
+            kind, names = "collections", collections
+        else:
+            kind, names = "objects", objects
+        index = positions.get((kind, datablock.name))
+        if index is None:
+            names.append(datablock.name)
+            index = positions[(kind, datablock.name)] = len(names) - 1
+        return [kind, index]
+
+    position(root_collection)
+    datablocks = {root_collection}
+    if definitions_collection is not None:
+        position(definitions_collection)
+        datablocks.add(definitions_collection)
+
+    converted = {}
+    for speckle_id, datablock in converted_objects.items():
+        converted[speckle_id] = position(datablock)
+        datablocks.add(datablock)
+
+    manifest = {
+        "format": CACHE_FORMAT,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "root_collection": 0,
+        "collections": collections,
+        "objects": objects,
+        "converted": converted,
+        **details,
+    }
+
+    blend_path, manifest_path = _entry_paths(key)
+    try:
+        blend_path.parent.mkdir(parents=True, exist_ok=True)
+        # an entry is complete once its manifest is written
+        manifest_path.unlink(missing_ok=True)
+        bpy.data.libraries.write(str(blend_path), datablocks)
+        manifest_path.write_text(json.dumps(manifest))
+    except (OSError, RuntimeError) as e:
+        print(f"Failed to write {key} to the scene cache: {str(e)}")
+        return None
+
+    evict()
+    return blend_path if blend_path.exists() else None
+
+
+def evict(limit: Optional[int] = None) -> int:
+    """
+    deletes the least recently used versions until the cache fits the limit,
+    returns the number of bytes freed
+    """
+    limit = size_limit() if limit is None else limit
+    try:
+        entries = []
+        for blend_path in cache_directory().glob("*.blend"):
+            manifest_path = blend_path.with_suffix(".json")
+            size = blend_path.stat().st_size
+            if manifest_path.exists():
+                size += manifest_path.stat().st_size
+            entries.append((blend_path.stat().st_mtime, size, blend_path))
+    except OSError:
+        return 0
+
+    total = sum(size for _, size, _ in entries)
+    freed = 0
+    for _, size, blend_path in sorted(entries):
+        if total - freed <= limit:
+            break
+        try:
+            blend_path.with_suffix(".json").unlink(missing_ok=True)
+            blend_path.unlink(missing_ok=True)
+            freed += size
+        except OSError as e:
+            print(f"Failed to evict {blend_path.name} from the scene cache: {str(e)}")
+    return freed
+
+
+def clear() -> int:
+    """
+    deletes every cached version, returns the number of bytes freed
+    """
+    return evict(limit=0)
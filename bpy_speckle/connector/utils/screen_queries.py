@@ -0,0 +1,304 @@
+from gql import gql
+from specklepy.core.api.credentials import Account
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+from .misc import format_relative_time, next_page_cursor, strip_non_ascii
+from .account_manager import get_account_from_id, get_authenticated_client
+from .project_manager import project_item
+
+# number of projects and models fetched per request, same as the list pages
+PAGE_SIZE = 25
+
+_PROJECT_FIELDS = """
+fragment ScreenProject on Project {
+  id
+  name
+  role
+  updatedAt
+  permissions {
+    canLoad {
+      authorized
+    }
+  }
+}
+"""
+
+# everything the project selection dialog shows, in one request
+PROJECTS_SCREEN_QUERY = (
+    """
+query ProjectsScreen(
+  $limit: Int!,
+  $workspaceFilter: WorkspaceProjectsFilter,
+  $personalFilter: UserProjectsFilter
+) {
+  serverInfo {
+    workspaces {
+      workspacesEnabled
+    }
+  }
+  activeUser {
+    workspaces(limit: 25) {
+      items {
+        id
+        name
+        creationState {
+          completed
+        }
+      }
+    }
+    activeWorkspace {
+      id
+      name
+      permissions {
+        canCreateProject {
+          authorized
+        }
+      }
+      projects(limit: $limit, filter: $workspaceFilter) {
+        cursor
+        items {
+          ...ScreenProject
+        }
+      }
+    }
+    permissions {
+      canCreatePersonalProject {
+        authorized
+      }
+    }
+    projects(limit: $limit, filter: $personalFilter) {
+      cursor
+      items {
+        ...ScreenProject
+      }
+    }
+  }
+}
+"""
+    + _PROJECT_FIELDS
+)
+
+# the same for servers without workspaces
+LEGACY_PROJECTS_SCREEN_QUERY = (
+    """
+query LegacyProjectsScreen($limit: Int!, $personalFilter: UserProjectsFilter) {
+  activeUser {
+    permissions {
+      canCreatePersonalProject {
+        authorized
+      }
+    }
+    projects(limit: $limit, filter: $personalFilter) {
+      cursor
+      items {
+        ...ScreenProject
+      }
+    }
+  }
+}
+"""
+    + _PROJECT_FIELDS
+)
+
+# a page of models together with the latest version of each of them
+MODELS_SCREEN_QUERY = """
+query ModelsScreen(
+  $projectId: String!,
+  $limit: Int!,
+  $cursor: String,
+  $filter: ProjectModelsFilter
+) {
+  project(id: $projectId) {
+    models(limit: $limit, cursor: $cursor, filter: $filter) {
+      cursor
+      items {
+        id
+        name
+        updatedAt
+        versions(limit: 1) {
+          items {
+            id
+            message
+            createdAt
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def fetch_projects_screen(
+    account_id: str, search: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    fetches the workspaces, the active workspace, whether a project can be created
+    in it and the first page of its projects in a single request
+    returns None if the request failed
+    """
+    account: Optional[Account] = get_account_from_id(account_id)
+    if not account:
+        return None
+
+    client = get_authenticated_client(account)
+    personal_filter = {
+        "search": search,
+        "workspaceId": None,
+        "personalOnly": True,
+        "includeImplicitAccess": True,
+    }
+
+    try:
+        response = client.httpclient.execute(
+            gql(PROJECTS_SCREEN_QUERY),
+            variable_values={
+                "limit": PAGE_SIZE,
+                "workspaceFilter": {"search": search, "withProjectRoleOnly": False}
+                if search
+                else None,
+                "personalFilter": personal_filter,
+            },
+        )
+    except Exception as e:
+        print(f"Projects screen query failed, retrying without workspaces: {str(e)}")
+        response = None
+
+    if response is None:
+        try:
+            response = client.httpclient.execute(
+                gql(LEGACY_PROJECTS_SCREEN_QUERY),
+                variable_values={"limit": PAGE_SIZE, "personalFilter": personal_filter},
+            )
+        except Exception as e:
+            print(f"Failed to fetch projects screen: {str(e)}")
+            return None
+
+    return _decode_projects_screen(response)
+
+
+def fetch_models_screen(
+    account_id: str,
+    project_id: str,
+    search: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> Optional[
+    Tuple[List[Tuple[str, str, str]], Optional[str], Dict[str, Tuple[str, str, str]]]
+]:
+    """
+    fetches the page of models after cursor with the latest version of each model
+    returns the models, the cursor of the next page and the latest versions by model id,
+    or None if the request failed
+    """
+    try:
+        account: Optional[Account] = get_account_from_id(account_id)
+        if not account or not project_id:
+            return None
+
+        client = get_authenticated_client(account)
+        response = client.httpclient.execute(
+            gql(MODELS_SCREEN_QUERY),
+            variable_values={
+                "projectId": project_id,
+                "limit": PAGE_SIZE,
+                "cursor": cursor,
+                "filter": {"search": search} if search else None,
+            },
+        )
+    except Exception as e:
+        print(f"Error fetching models: {str(e)}")
+        return None
+
+    project = response.get("project")
+    if not project:
+        print(f"Error: Project with ID {project_id} not found")
+        return None
+
+    models: List[Tuple[str, str, str]] = []
+    latest_versions: Dict[str, Tuple[str, str, str]] = {}
+    for model in project["models"]["items"]:
+        models.append(
+            (
+                strip_non_ascii(model["name"]),
+                model["id"],
+                format_relative_time(model["updatedAt"]),
+            )
+        )
+        versions = (model.get("versions") or {}).get("items") or []
+        if versions:
+            latest_versions[model["id"]] = _version_item(versions[0])
+
+    return models, next_page_cursor(project["models"], PAGE_SIZE), latest_versions
+
+
+def _decode_projects_screen(response: Dict[str, Any]) -> Dict[str, Any]:
+    active_user = response["activeUser"]
+    server_workspaces = (response.get("serverInfo") or {}).get("workspaces") or {}
+    workspaces_enabled = bool(server_workspaces.get("workspacesEnabled"))
+    active_workspace = (
+        active_user.get("activeWorkspace") if workspaces_enabled else None
+    )
+
+    can_create_personal = _authorized(
+        (active_user.get("permissions") or {}).get("canCreatePersonalProject")
+    )
+
+    if active_workspace:
+        workspace_id = active_workspace["id"]
+        workspace_name = active_workspace["name"]
+        can_create_project = _authorized(
+            (active_workspace.get("permissions") or {}).get("canCreateProject")
+        )
+        projects = active_workspace["projects"]
+    else:
+        workspace_id = "personal"
+        workspace_name = "Personal Projects"
+        can_create_project = can_create_personal
+        projects = active_user["projects"]
+
+    workspaces: List[Tuple[str, str]] = []
+    if workspaces_enabled:
+        for workspace in (active_user.get("workspaces") or {}).get("items") or []:
+            creation_state = workspace.get("creationState")
+            if creation_state is None or creation_state.get("completed"):
+                workspaces.append((workspace["id"], strip_non_ascii(workspace["name"])))
+        # the active workspace goes first, same as get_workspaces
+        workspaces.sort(key=lambda workspace: workspace[0] != workspace_id)
+        workspaces.append(("personal", "Personal Projects (Legacy)"))
+    else:
+        workspaces.append(("personal", "Personal Projects"))
+
+    return {
+        "workspaces": workspaces,
+        "active_workspace": {"id": workspace_id, "name": workspace_name},
+        "can_create_project": can_create_project,
+        "projects": (
+            [_project_item(project) for project in projects["items"]],
+            next_page_cursor(projects, PAGE_SIZE),
+        ),
+    }
+
+
+def _project_item(project: Dict[str, Any]) -> Tuple[str, str, str, str, bool]:
+    # shaped like the client's Project, so the row is built the same way
+    return project_item(
+        SimpleNamespace(
+            name=project["name"],
+            role=project.get("role"),
+            updated_at=project["updatedAt"],
+            id=project["id"],
+        ),
+        _authorized((project.get("permissions") or {}).get("canLoad")),
+    )
+
+
+def _version_item(version: Dict[str, Any]) -> Tuple[str, str, str]:
+    return (
+        version["id"],
+        version["message"] if version.get("message") is not None else "No message",
+        format_relative_time(version["createdAt"]),
+    )
+
+
+def _authorized(permission: Optional[Dict[str, Any]]) -> bool:
+    return bool(permission and permission.get("authorized"))
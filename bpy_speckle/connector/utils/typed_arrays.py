@@ -0,0 +1,214 @@
+import json
+import warnings
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from specklepy.objects import Base
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+from specklepy.transports.abstract_transport import AbstractTransport
+
+# numeric members decoded into numpy buffers on receive, by speckle_type
+TYPED_ARRAY_MEMBERS: Dict[str, Dict[str, type]] = {
+    "Objects.Geometry.Mesh": {
+        "vertices": np.float64,
+        "faces": np.int32,
+        "colors": np.int64,
+        "textureCoordinates": np.float64,
+        "vertexNormals": np.float64,
+    },
+    "Objects.Geometry.Curve": {
+        "points": np.float64,
+        "weights": np.float64,
+        "knots": np.float64,
+    },
+    "Objects.Geometry.Polyline": {"value": np.float64},
+    "Objects.Geometry.Pointcloud": {
+        "points": np.float64,
+        "colors": np.int64,
+        "sizes": np.float64,
+    },
+}
+
+# speckle_type -> its typed members, None for types without any
+_members_by_speckle_type: Dict[str, Optional[Dict[str, type]]] = {}
+
+
+class TypedArray:
+    """
+    numeric array of a received object, decoded into a numpy buffer the first
+    time a converter touches it. stands in for the list of python numbers
+    specklepy would build, chunked arrays stay in the local cache until then
+    """
+
+    __slots__ = ("dtype", "_transport", "_chunk_ids", "_values", "_array")
+
+    def __init__(
+        self,
+        dtype: type,
+        transport: Optional[AbstractTransport] = None,
+        chunk_ids: Optional[List[str]] = None,
+        values: Optional[List[Any]] = None,
+    ) -> None:
+        self.dtype = dtype
+        self._transport = transport
+        self._chunk_ids = chunk_ids
+        self._values = values
+        self._array: Optional[np.ndarray] = None
+
+    @property
+    def array(self) -> np.ndarray:
+        if self._array is None:
+            self._array = self._decode()
+            # the buffer is all that's needed from now on
+            self._transport = self._chunk_ids = self._values = None
+        return self._array
+
+    def _decode(self) -> np.ndarray:
+        if self._values is not None:
+            return np.asarray(self._values, dtype=self.dtype)
+        if not self._chunk_ids:
+            return np.empty(0, dtype=self.dtype)
+
+        chunks = []
+        for chunk_id in self._chunk_ids:
+            chunk = self._transport.get_object(chunk_id)
+            if chunk is None:
+                raise ValueError(f"Data chunk {chunk_id} is missing from the cache")
+            chunks.append(decode_data_chunk(chunk, self.dtype))
+        return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._array is not None
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        if dtype is None:
+            return self.array
+        return self.array.astype(dtype, copy=False)
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __bool__(self) -> bool:
+        # answered without decoding, the traversal asks every member
+        if self._array is not None:
+            return len(self._array) > 0
+        return bool(self._chunk_ids or self._values)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.array[index]
+
+    def __iter__(self):
+        return iter(self.array.tolist())
+
+    def tolist(self) -> List[Any]:
+        return self.array.tolist()
+
+    def __repr__(self) -> str:
+        if self._array is None:
+            chunks = len(self._chunk_ids) if self._chunk_ids else 0
+            return f"TypedArray({np.dtype(self.dtype).name}, {chunks} chunks)"
+        return f"TypedArray({np.dtype(self.dtype).name}, {len(self._array)} values)"
+
+
+def decode_data_chunk(chunk: str, dtype: type) -> np.ndarray:
+    """
+    parses the data of a serialized DataChunk straight into a numpy array,
+    without a python object per number
+    """
+    start = chunk.find('"data":')
+    if start < 0:
+        raise ValueError("Object is not a data chunk")
+    start = chunk.index("[", start) + 1
+    end = chunk.index("]", start)
+    data = chunk[start:end]
+    if not data.strip():
+        return np.empty(0, dtype=dtype)
+
+    with warnings.catch_warnings():
+        # numpy < 2 only warns about text it can't parse
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(data, dtype=dtype, sep=",")
+            if len(values) == data.count(",") + 1:
+                return values
+        except (ValueError, DeprecationWarning):
+            pass
+
+    # e.g. integers written as floats, json handles everything
+    return np.asarray(json.loads(f"[{data}]"), dtype=dtype)
+
+
+def typed_members(speckle_type: Optional[str]) -> Optional[Dict[str, type]]:
+    """
+    the typed array members of a speckle_type, inherited ones included
+    """
+    if not speckle_type:
+        return None
+    try:
+        return _members_by_speckle_type[speckle_type]
+    except KeyError:
+        pass
+
+    members = None
+    for name in speckle_type.split(":"):
+        if name in TYPED_ARRAY_MEMBERS:
+            members = TYPED_ARRAY_MEMBERS[name]
+    _members_by_speckle_type[speckle_type] = members
+    return members
+
+
+class TypedArraySerializer(BaseObjectSerializer):
+    """
+    deserializer that receives the numeric arrays of geometry as TypedArrays,
+    everything else is recomposed like specklepy does
+    """
+
+    def recompose_base(self, obj: dict) -> Base:
+        if isinstance(obj, dict) and obj.get("speckle_type") == "reference":
+            obj = self.get_child(obj=obj)
+
+        members = (
+            typed_members(obj.get("speckle_type")) if isinstance(obj, dict) else None
+        )
+        if not members:
+            return super().recompose_base(obj=obj)
+
+        # an object met before is returned as is, its arrays were decoded then
+        if obj.get("id") in self.deserialized:
+            return self.deserialized[obj["id"]]
+
+        # the parsed dict stays untouched, the arrays are left out of a copy
+        obj = dict(obj)
+        arrays = {}
+        for name, dtype in members.items():
+            typed_array = self._typed_array(obj.get(name), dtype)
+            if typed_array is not None:
+                arrays[name] = typed_array
+                obj.pop(name)
+
+        base = super().recompose_base(obj=obj)
+        for name, typed_array in arrays.items():
+            if isinstance(base.__dict__.get(name), TypedArray):
+                continue
+            # set directly, the type check of List members wants a list
+            base.__dict__[name] = typed_array
+        return base
+
+    def _typed_array(self, value: Any, dtype: type) -> Optional[TypedArray]:
+        if not isinstance(value, list) or not value:
+            return None
+
+        first = value[0]
+        if isinstance(first, dict):
+            # chunked, every item references a data chunk in the local cache
+            chunk_ids = [
+                item.get("referencedId") for item in value if isinstance(item, dict)
+            ]
+            if len(chunk_ids) != len(value) or None in chunk_ids:
+                return None
+            return TypedArray(dtype, self.read_transport, chunk_ids=chunk_ids)
+
+        if isinstance(first, (int, float)) and not isinstance(first, bool):
+            return TypedArray(dtype, values=value)
+        return None
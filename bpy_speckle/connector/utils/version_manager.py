@@ -1,16 +1,32 @@
 from specklepy.core.api.client import SpeckleClient
-from specklepy.core.api.credentials import get_local_accounts, Account
+from specklepy.core.api.credentials import Account
 from typing import List, Tuple, Optional
-from .misc import format_relative_time
+from .misc import format_relative_time, next_page_cursor
+from .account_manager import get_account_from_id, get_authenticated_client
 from specklepy.core.api.inputs.model_inputs import ModelVersionsFilter
 from specklepy.core.api.models.current import Version
 
+# number of versions fetched per request, further pages are loaded on demand
+PAGE_SIZE = 25
+
 
 def get_versions_for_model(
     account_id: str, project_id: str, model_id: str
 ) -> List[Tuple[str, str, str]]:
     """
-    fetches versions for a given model from the Speckle server
+    fetches the first page of versions for a given model from the Speckle server
+    """
+    page = get_versions_page(account_id, project_id, model_id)
+    return page[0] if page else []
+
+
+def get_versions_page(
+    account_id: str, project_id: str, model_id: str, cursor: Optional[str] = None
+) -> Optional[Tuple[List[Tuple[str, str, str]], Optional[str]]]:
+    """
+    fetches the page of versions after cursor
+    returns the versions and the cursor of the next page, None if this was the last one.
+    returns None if the page couldn't be fetched, so a cached list isn't replaced
     """
     try:
         # Validate inputs
@@ -18,26 +34,25 @@ def get_versions_for_model(
             print(
                 f"Error: Invalid inputs - account_id: {account_id}, project_id: {project_id}, model_id: {model_id}"
             )
-            return []
+            return None
 
         # Get the account info
-        account: Optional[Account] = next(
-            (acc for acc in get_local_accounts() if acc.id == account_id), None
-        )
+        account: Optional[Account] = get_account_from_id(account_id)
         if not account:
             print(f"Error: Could not find account with ID: {account_id}")
-            return []
+            return None
 
-        # Initialize the client
-        client: SpeckleClient = SpeckleClient(host=account.serverInfo.url)
-        # Authenticate
-        client.authenticate_with_account(account)
+        client: SpeckleClient = get_authenticated_client(account)
 
         filter: ModelVersionsFilter = ModelVersionsFilter(priorityIds=[])
 
         # Get versions
-        versions: List[Version] = client.version.get_versions(
-            project_id=project_id, model_id=model_id, limit=10, filter=filter
+        versions = client.version.get_versions(
+            project_id=project_id,
+            model_id=model_id,
+            limit=PAGE_SIZE,
+            cursor=cursor,
+            filter=filter,
         )
         versions_list: List[Tuple[str, str, str]] = []
         for version in versions.items:
@@ -51,11 +66,11 @@ def get_versions_for_model(
                         format_relative_time(version.created_at),
                     )
                 )
-        return versions_list
+        return versions_list, next_page_cursor(versions, PAGE_SIZE)
 
     except Exception as e:
         print(f"Error fetching versions: {str(e)}")
-        return []
+        return None
 
 
 def get_latest_version(
@@ -70,17 +85,12 @@ def get_latest_version(
             return ("", "", "")
 
         # Get the account info
-        account: Optional[Account] = next(
-            (acc for acc in get_local_accounts() if acc.id == account_id), None
-        )
+        account: Optional[Account] = get_account_from_id(account_id)
         if not account:
             print(f"Error: Could not find account with ID: {account_id}")
             return ("", "", "")
 
-        # Initialize the client
-        client: SpeckleClient = SpeckleClient(host=account.serverInfo.url)
-        # Authenticate
-        client.authenticate_with_account(account)
+        client: SpeckleClient = get_authenticated_client(account)
 
         # Get versions (limit to 1 since we only need the latest)
         versions: List[Version] = client.version.get_versions(
@@ -0,0 +1,38 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+def face_corners(faces: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    splits speckle faces, each a vertex count followed by its vertex indices,
+    into the vertex count of every face and the vertex index of every corner
+    """
+    faces = np.asarray(faces, dtype=np.int64)
+    if not len(faces):
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    # meshes of only triangles or only quads need no walk through the faces
+    size = int(faces[0])
+    if size > 0 and len(faces) % (size + 1) == 0:
+        table = faces.reshape(-1, size + 1)
+        if (table[:, 0] == size).all():
+            return table[:, 0].copy(), table[:, 1:].ravel()
+
+    headers = []
+    loop_totals = []
+    face_list = faces.tolist()
+    i = 0
+    while i < len(face_list):
+        vertex_count = face_list[i]
+        if vertex_count < 0 or i + vertex_count >= len(face_list):
+            raise ValueError(f"Invalid face at index {i} of the mesh faces")
+        headers.append(i)
+        loop_totals.append(vertex_count)
+        i += vertex_count + 1
+
+    is_corner = np.ones(len(faces), dtype=bool)
+    is_corner[headers] = False
+    loop_totals = np.asarray(loop_totals, dtype=np.int64)
+    # faces without vertices have no corners and would only be invalid polygons
+    return loop_totals[loop_totals > 0], faces[is_corner]
@@ -0,0 +1,248 @@
+import functools
+import heapq
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# set to 1 to profile every conversion, e.g. SPECKLE_BLENDER_PROFILE_CONVERSIONS=1
+PROFILE_ENV_VAR = "SPECKLE_BLENDER_PROFILE_CONVERSIONS"
+
+# slowest individual objects kept in a report
+DEFAULT_TOP_N = 20
+
+_enabled = os.environ.get(PROFILE_ENV_VAR, "0") == "1"
+
+# profiler of the running load or publish, None while not profiling
+_active: Optional["ConversionProfiler"] = None
+
+# report of the latest profiled load or publish
+_last_report: Optional[Dict[str, Any]] = None
+
+
+class ConversionProfiler:
+    """
+    aggregates conversion time, geometry size and failures per type and keeps
+    the slowest individual objects
+    """
+
+    def __init__(self, top_n: int = DEFAULT_TOP_N) -> None:
+        self.top_n = top_n
+        # (direction, type) -> aggregated stats
+        self.types: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # min-heap of (seconds, order, entry), the fastest is dropped first
+        self._slowest: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._order = 0
+        # time spent in nested conversions, subtracted from their parent
+        self._nested: List[float] = []
+
+    def record(
+        self,
+        direction: str,
+        type_name: str,
+        object_id: str,
+        name: str,
+        seconds: float,
+        vertices: int,
+        faces: int,
+        status: str,
+    ) -> None:
+        stats = self.types.get((direction, type_name))
+        if stats is None:
+            stats = self.types[(direction, type_name)] = {
+                "direction": direction,
+                "type": type_name,
+                "count": 0,
+                "seconds": 0.0,
+                "max_seconds": 0.0,
+                "vertices": 0,
+                "faces": 0,
+                "empty": 0,
+                "failed": 0,
+            }
+        stats["count"] += 1
+        stats["seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+        stats["vertices"] += vertices
+        stats["faces"] += faces
+        if status != "ok":
+            stats[status] += 1
+
+        if len(self._slowest) >= self.top_n and seconds <= self._slowest[0][0]:
+            return
+        self._order += 1
+        entry = {
+            "direction": direction,
+            "type": type_name,
+            "id": object_id,
+            "name": name,
+            "seconds": seconds,
+            "vertices": vertices,
+            "faces": faces,
+            "status": status,
+        }
+        if len(self._slowest) < self.top_n:
+            heapq.heappush(self._slowest, (seconds, self._order, entry))
+        else:
+            heapq.heapreplace(self._slowest, (seconds, self._order, entry))
+
+    def report(self) -> Dict[str, Any]:
+        """
+        per type stats sorted by total time, and the slowest objects
+        """
+        return {
+            "types": sorted(self.types.values(), key=lambda stats: -stats["seconds"]),
+            "slowest": [
+                entry for _, _, entry in sorted(self._slowest, key=lambda s: -s[0])
+            ],
+        }
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+def start_profiling(top_n: int = DEFAULT_TOP_N) -> Optional[ConversionProfiler]:
+    """
+    starts profiling conversions, does nothing while profiling is off
+    """
+    global _active
+
+    _active = ConversionProfiler(top_n) if _enabled else None
+    return _active
+
+
+def stop_profiling() -> Optional[Dict[str, Any]]:
+    """
+    stops profiling and returns the report, None if nothing was profiled
+    """
+    global _active, _last_report
+
+    profiler, _active = _active, None
+    if profiler is None:
+        return None
+    _last_report = profiler.report()
+    return _last_report
+
+
+def get_last_report() -> Optional[Dict[str, Any]]:
+    return _last_report
+
+
+def format_report(report: Optional[Dict[str, Any]], limit: int = 5) -> str:
+    """
+    a few lines with the most expensive types and objects, for the console
+    """
+    if not report:
+        return ""
+
+    lines = ["Slowest types:"]
+    for stats in report["types"][:limit]:
+        lines.append(
+            f"  {stats['type']}: {stats['count']} in {stats['seconds']:.3f}s, "
+            f"{stats['vertices']} vertices, {stats['faces']} faces, "
+            f"{stats['failed']} failed, {stats['empty']} empty"
+        )
+    lines.append("Slowest objects:")
+    for entry in report["slowest"][:limit]:
+        lines.append(
+            f"  {entry['type']} {entry['id']} ({entry['name']}): "
+            f"{entry['seconds']:.3f}s, {entry['vertices']} vertices, "
+            f"{entry['faces']} faces"
+        )
+    return "\n".join(lines)
+
+
+def _geometry_counts(blender_object: Any) -> Tuple[int, int]:
+    """
+    vertex and face count of a blender object, control points for curves
+    """
+    data = getattr(blender_object, "data", None)
+    if data is None:
+        return 0, 0
+
+    object_type = getattr(blender_object, "type", None)
+    if object_type == "MESH":
+        return len(data.vertices), len(data.polygons)
+    if object_type == "CURVE":
+        return (
+            sum(
+                len(spline.points) + len(spline.bezier_points)
+                for spline in data.splines
+            ),
+            0,
+        )
+    return 0, 0
+
+
+def _speckle_source(speckle_object: Any, result: Any) -> Tuple[str, str, str, Any]:
+    return (
+        speckle_object.speckle_type,
+        speckle_object.id,
+        getattr(speckle_object, "name", None) or "",
+        result,
+    )
+
+
+def _blender_source(blender_object: Any, result: Any) -> Tuple[str, str, str, Any]:
+    return (
+        blender_object.type,
+        getattr(result, "applicationId", None) or blender_object.name,
+        blender_object.name,
+        blender_object,
+    )
+
+
+def profiled(direction: str) -> Callable[[Callable], Callable]:
+    """
+    decorates convert_to_native ("to_native") or convert_to_speckle
+    ("to_speckle"), a single check when no profiler is running
+    """
+    describe = _speckle_source if direction == "to_native" else _blender_source
+
+    def decorator(convert: Callable) -> Callable:
+        @functools.wraps(convert)
+        def wrapper(source: Any, *args: Any, **kwargs: Any) -> Any:
+            profiler = _active
+            if profiler is None:
+                return convert(source, *args, **kwargs)
+
+            result = None
+            status = "failed"
+            profiler._nested.append(0.0)
+            start = time.perf_counter()
+            try:
+                result = convert(source, *args, **kwargs)
+                status = "ok" if result is not None else "empty"
+                return result
+            finally:
+                seconds = time.perf_counter() - start
+                nested_seconds = profiler._nested.pop()
+                if profiler._nested:
+                    profiler._nested[-1] += seconds
+
+                try:
+                    type_name, object_id, name, geometry = describe(source, result)
+                    vertices, faces = _geometry_counts(geometry)
+                except Exception:
+                    # bookkeeping must never break a conversion
+                    type_name, object_id, name = type(source).__name__, "", ""
+                    vertices = faces = 0
+                profiler.record(
+                    direction,
+                    type_name,
+                    object_id,
+                    name,
+                    seconds - nested_seconds,
+                    vertices,
+                    faces,
+                    status,
+                )
+
+        return wrapper
+
+    return decorator
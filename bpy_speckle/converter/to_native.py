@@ -1,4 +1,5 @@
-from typing import Any, Iterable, List, Optional, Tuple, Dict
+import logging
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Dict
 from specklepy.objects import Base
 from specklepy.objects import DataObject
 from specklepy.objects.geometry import (
@@ -11,6 +12,7 @@ from specklepy.objects.geometry import (
     Curve,
     Polycurve,
     Point,
+    PointCloud,
 )
 from specklepy.objects.proxies import InstanceProxy
 from specklepy.objects.models.units import (
@@ -20,7 +22,19 @@ from specklepy.objects.models.units import (
 import bpy
 from bpy.types import Object
 import mathutils
-from ..converter.utils import create_material_from_proxy, find_object_by_id
+import numpy as np
+from ..converter.mesh_faces import face_corners
+from ..converter.profiler import profiled
+from ..converter.utils import (
+    build_material_index,
+    create_material_from_proxy,
+    find_object_by_id,
+    to_rgba_array,
+    unpack_chunks,
+)
+
+# per-object and per-point diagnostics, silent unless debug logging is enabled
+logger = logging.getLogger(__name__)
 
 # Display value property aliases to check for
 DISPLAY_VALUE_PROPERTY_ALIASES = [
@@ -36,6 +50,12 @@ ELEMENTS_PROPERTY_ALIASES = [
     "@elements",
 ]
 
+# simple curve types that can be packed into a single merged curve object on load
+MERGED_CURVE_TYPES = (Line, Polyline, Arc, Circle)
+
+# geometry nodes group shared by all merged point objects loaded with an instancer
+POINT_INSTANCER_NAME = "Speckle Point Instancer"
+
 
 def get_scale_factor(speckle_object: Base, fallback: float = 1.0) -> float:
     """
@@ -80,12 +100,14 @@ def generate_unique_name(speckle_object: Base) -> Tuple[str, str]:
     return object_name, datablock_name
 
 
+@profiled("to_native")
 def convert_to_native(
     speckle_object: Base,
     material_mapping: Optional[Dict[str, bpy.types.Material]] = None,
     definition_collections: Optional[Dict[str, bpy.types.Collection]] = None,
     root_collection: Optional[bpy.types.Collection] = None,
     instance_loading_mode: str = "INSTANCE_PROXIES",
+    point_loading_mode: str = "EMPTIES",
 ) -> Optional[Object]:
     """
     converts a speckle object to blender object with material support
@@ -156,10 +178,19 @@ def convert_to_native(
         converted_object = point_to_native(
             speckle_object, object_name, data_block_name, scale
         )
+    elif is_pointcloud(speckle_object):
+        converted_object = pointcloud_to_native(
+            speckle_object, object_name, data_block_name, scale
+        )
     else:
         # Fallback to display value if direct conversion not supported
         mesh, children = display_value_to_native(
-            speckle_object, object_name, data_block_name, scale, material_mapping
+            speckle_object,
+            object_name,
+            data_block_name,
+            scale,
+            material_mapping,
+            point_loading_mode,
         )
         if mesh:
             # Create a mesh object with the object_name (simple name) and mesh data
@@ -197,6 +228,7 @@ def display_value_to_native(
     data_block_name: str,
     scale: float,
     material_mapping: Optional[Dict[str, bpy.types.Material]] = None,
+    point_loading_mode: str = "EMPTIES",
 ) -> Tuple[Optional[bpy.types.Mesh], List[Object]]:
     """
     fallback conversion mechanism using displayValue if present
@@ -215,6 +247,7 @@ def display_value_to_native(
         DISPLAY_VALUE_PROPERTY_ALIASES,
         True,
         material_mapping,
+        point_loading_mode,
     )
 
     # If the parent had an applicationId and we created a mesh, apply the material
@@ -271,6 +304,7 @@ def _members_to_native(
     members: Iterable[str],
     combineMeshes: bool,
     material_mapping: Optional[Dict[str, bpy.types.Material]] = None,
+    point_loading_mode: str = "EMPTIES",
 ) -> Tuple[Optional[bpy.types.Mesh], List[Object]]:
     """
     converts a given speckle_object by converting specified members
@@ -318,9 +352,27 @@ def _members_to_native(
     # Check if the original object is a DataObject
     is_data_object = isinstance(speckle_object, DataObject)
 
+    if point_loading_mode != "EMPTIES":
+        points = [item for item in others if isinstance(item, Point)]
+        if len(points) > 1:
+            others = [item for item in others if not isinstance(item, Point)]
+            point_obj = points_to_merged_native(
+                points,
+                object_name,
+                f"{data_block_name}.points",
+                point_loading_mode == "MERGED_INSTANCER",
+            )
+            if point_obj:
+                children.append(point_obj)
+
     for item in others:
         try:
-            blender_object = convert_to_native(item, material_mapping, instance_loading_mode="INSTANCE_PROXIES")
+            blender_object = convert_to_native(
+                item,
+                material_mapping,
+                instance_loading_mode="INSTANCE_PROXIES",
+                point_loading_mode=point_loading_mode,
+            )
             if blender_object:
                 # If the parent is a DataObject, override the name of the converted child
                 if is_data_object:
@@ -339,34 +391,96 @@ def line_to_native(
     """
     converts a speckle line to a blender curve
     """
+    return splines_to_native(
+        speckle_line, object_name, data_block_name, scale, line_to_spline
+    )
+
+
+def line_to_spline(
+    speckle_line: Line, curve: bpy.types.Curve, scale: float = 1.0
+) -> bpy.types.Spline:
+    """
+    adds a speckle line to a blender curve as a poly spline
+    """
     if not speckle_line.start or not speckle_line.end:
         raise ValueError("Line is missing start or end point")
 
-    curve = bpy.data.curves.new(data_block_name, type="CURVE")
-    curve.dimensions = "3D"
-
     spline = curve.splines.new("POLY")
-    spline.points.add(1)
 
-    spline.points[0].co = (
-        float(speckle_line.start.x) * scale,
-        float(speckle_line.start.y) * scale,
-        float(speckle_line.start.z) * scale,
-        1.0,
+    write_spline_points(
+        spline,
+        [
+            float(speckle_line.start.x),
+            float(speckle_line.start.y),
+            float(speckle_line.start.z),
+            float(speckle_line.end.x),
+            float(speckle_line.end.y),
+            float(speckle_line.end.z),
+        ],
+        2,
+        scale,
     )
 
-    spline.points[1].co = (
-        float(speckle_line.end.x) * scale,
-        float(speckle_line.end.y) * scale,
-        float(speckle_line.end.z) * scale,
-        1.0,
-    )
+    return spline
+
+
+def splines_to_native(
+    speckle_object: Base,
+    object_name: str,
+    data_block_name: str,
+    scale: float,
+    to_spline: Callable[[Base, bpy.types.Curve, float], Any],
+) -> Object:
+    """
+    creates a 3D curve data-block, lets to_spline write the speckle object's
+    spline(s) into it and wraps it in an object
+    """
+    curve = bpy.data.curves.new(data_block_name, type="CURVE")
+    curve.dimensions = "3D"
+
+    try:
+        to_spline(speckle_object, curve, scale)
+    except Exception:
+        bpy.data.curves.remove(curve)
+        raise
 
     curve_obj = bpy.data.objects.new(object_name, curve)
 
     return curve_obj
 
 
+def write_spline_points(
+    spline: bpy.types.Spline,
+    coordinates: Sequence[float],
+    point_count: int,
+    scale: float = 1.0,
+    weights: Optional[Sequence[float]] = None,
+) -> None:
+    """
+    writes flat xyz coordinates (and optional weights) into a POLY or NURBS spline
+    in one foreach_set call
+    """
+    if point_count < 1:
+        return
+
+    # Note: Blender curve points are 4D (x, y, z, w) where w is weight
+    co = np.ones((point_count, 4), dtype=np.float32)
+    co[:, :3] = (
+        np.asarray(coordinates[: point_count * 3], dtype=np.float64).reshape(-1, 3)
+        * scale
+    )
+
+    if weights is not None and len(weights) > 0:
+        weight_values = np.asarray(weights[:point_count], dtype=np.float32)
+        co[: len(weight_values), 3] = weight_values
+
+    # a new spline already has one point
+    if point_count > len(spline.points):
+        spline.points.add(point_count - len(spline.points))
+
+    spline.points.foreach_set("co", co.ravel())
+
+
 def polyline_to_native(
     speckle_polyline: Polyline,
     object_name: str,
@@ -376,35 +490,30 @@ def polyline_to_native(
     """
     converts a speckle polyline to blender curve
     """
+    return splines_to_native(
+        speckle_polyline, object_name, data_block_name, scale, polyline_to_spline
+    )
+
+
+def polyline_to_spline(
+    speckle_polyline: Polyline, curve: bpy.types.Curve, scale: float = 1.0
+) -> bpy.types.Spline:
+    """
+    adds a speckle polyline to a blender curve as a poly spline
+    """
     if not speckle_polyline.value or len(speckle_polyline.value) < 6:
         raise ValueError("Polyline must have at least two points")
 
-    curve = bpy.data.curves.new(data_block_name, type="CURVE")
-    curve.dimensions = "3D"
-
     spline = curve.splines.new("POLY")
 
     num_points = len(speckle_polyline.value) // 3  # divide by 3 to get point count
 
-    # Add the required number of points to the spline
-    if num_points > 1:
-        spline.points.add(num_points - 1)
-
-    for i in range(num_points):
-        # Note: Blender curve points are 4D (x, y, z, w) where w is weight
-        spline.points[i].co = (
-            float(speckle_polyline.value[i * 3]) * scale,
-            float(speckle_polyline.value[i * 3 + 1]) * scale,
-            float(speckle_polyline.value[i * 3 + 2]) * scale,
-            1.0,
-        )
+    write_spline_points(spline, speckle_polyline.value, num_points, scale)
 
     if hasattr(speckle_polyline, "closed") and speckle_polyline.closed:
         spline.use_cyclic_u = True
 
-    curve_obj = bpy.data.objects.new(object_name, curve)
-
-    return curve_obj
+    return spline
 
 
 def mesh_to_native(
@@ -463,110 +572,93 @@ def meshes_to_native(
     """
     blender_mesh = bpy.data.meshes.new(name)
 
-    mesh_face_ranges: List[
-        Tuple[int, int, int]
-    ] = []  # List of (start_face, end_face, mesh_index)
-    current_face = 0
-
-    mesh_materials: Dict[int, bpy.types.Material] = {}  # Maps mesh index to material
-
     has_normals = any(
         hasattr(m, "vertexNormals") and len(m.vertexNormals) > 0 for m in meshes
     )
 
-    all_vertices: List[Tuple[float, float, float]] = []
-    all_faces: List[List[float]] = []
-    all_normals: Optional[List[List[float]]] = [] if has_normals else None
+    all_vertices: List[np.ndarray] = []
+    all_loop_totals: List[np.ndarray] = []
+    all_corners: List[np.ndarray] = []
+    all_normals: Optional[List[np.ndarray]] = [] if has_normals else None
 
-    vertex_offset = 0
+    # material of every mesh, None where it has none, and its face count
+    mesh_materials: List[Optional[bpy.types.Material]] = []
+    face_counts: List[int] = []
 
-    for mesh_idx, mesh in enumerate(meshes):
-        start_face = current_face
+    vertex_offset = 0
 
-        # check if we have a material for this mesh
+    for mesh in meshes:
+        material = None
         if material_mapping and hasattr(mesh, "applicationId"):
-            app_id = mesh.applicationId
-            if app_id in material_mapping:
-                mesh_materials[mesh_idx] = material_mapping[app_id]
-
-        # Add vertices with scale applied
-        for i in range(0, len(mesh.vertices), 3):
-            all_vertices.append(
-                (
-                    float(mesh.vertices[i]) * scale,
-                    float(mesh.vertices[i + 1]) * scale,
-                    float(mesh.vertices[i + 2]) * scale,
-                )
-            )
-
-        # Add faces
-        i = 0
-        face_count = 0
-        while i < len(mesh.faces):
-            vertex_count = mesh.faces[i]
-            face: List[float] = []
-            for j in range(1, vertex_count + 1):
-                vertex_index = mesh.faces[i + j]
-                face.append(vertex_index + vertex_offset)
-
-                ii = vertex_index * 3
-
-                if all_normals is not None:
-                    if hasattr(mesh, "vertexNormals") and len(mesh.vertexNormals) > 0:
-                        all_normals.append(
-                            [
-                                mesh.vertexNormals[ii],
-                                mesh.vertexNormals[ii + 1],
-                                mesh.vertexNormals[ii + 2],
-                            ]
-                        )
-                    else:
-                        all_normals.append(
-                            (0, 0, 0)
-                        )  # Zero vector is treated as auto normal
-
-            all_faces.append(face)
+            material = material_mapping.get(mesh.applicationId)
+        mesh_materials.append(material)
 
-            i += vertex_count + 1
-            face_count += 1
-            current_face += 1
+        vertices = np.asarray(mesh.vertices, dtype=np.float64).reshape(-1, 3)
+        loop_totals, corners = face_corners(mesh.faces)
 
-        vertex_offset += len(mesh.vertices) // 3
+        all_vertices.append(vertices)
+        all_loop_totals.append(loop_totals)
+        all_corners.append(corners + vertex_offset)
+        face_counts.append(len(loop_totals))
 
-        # Store face range if this mesh has faces
-        if face_count > 0:
-            mesh_face_ranges.append((start_face, current_face - 1, mesh_idx))
-
-    blender_mesh.from_pydata(all_vertices, [], all_faces)
-    blender_mesh.update()
+        if all_normals is not None:
+            if hasattr(mesh, "vertexNormals") and len(mesh.vertexNormals) > 0:
+                vertex_normals = np.asarray(mesh.vertexNormals, dtype=np.float64)
+                all_normals.append(vertex_normals.reshape(-1, 3)[corners])
+            else:
+                # Zero vector is treated as auto normal
+                all_normals.append(np.zeros((len(corners), 3)))
+
+        vertex_offset += len(vertices)
+
+    co = np.concatenate(all_vertices) * scale if all_vertices else np.empty((0, 3))
+    loop_totals = np.concatenate(all_loop_totals) if meshes else np.empty(0, np.int64)
+    corners = np.concatenate(all_corners) if meshes else np.empty(0, np.int64)
+    del all_vertices, all_loop_totals, all_corners
+
+    # filled like from_pydata does, without a python tuple per vertex and face
+    blender_mesh.vertices.add(len(co))
+    blender_mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+    blender_mesh.loops.add(len(corners))
+    blender_mesh.loops.foreach_set("vertex_index", corners.astype(np.int32))
+    blender_mesh.polygons.add(len(loop_totals))
+    blender_mesh.polygons.foreach_set(
+        "loop_start", (np.cumsum(loop_totals) - loop_totals).astype(np.int32)
+    )
+    blender_mesh.shade_flat()
+    blender_mesh.update(calc_edges=True)
+    # the blender mesh has its own copy now, free ours before the normals
+    del co, corners
 
     # Set normals
     if all_normals is not None:
-        blender_mesh.normals_split_custom_set(all_normals)
+        normals = np.concatenate(all_normals)
+        del all_normals
+        blender_mesh.normals_split_custom_set(normals)
     else:
         blender_mesh.shade_smooth()
 
     # If we have materials, add them to the mesh
-    if mesh_materials:
-        materials_added = set()
+    if any(material is not None for material in mesh_materials):
         material_indices = {}  # Maps material name to index in the mesh
+        mesh_material_indices = []
 
-        # first add all unique materials
-        for mesh_idx, material in mesh_materials.items():
-            if material.name not in materials_added:
+        for material in mesh_materials:
+            if material is None:
+                mesh_material_indices.append(0)
+                continue
+            if material.name not in material_indices:
                 blender_mesh.materials.append(material)
                 material_indices[material.name] = len(blender_mesh.materials) - 1
-                materials_added.add(material.name)
-
-        # then assign material indices to faces
-        for start_face, end_face, mesh_idx in mesh_face_ranges:
-            if mesh_idx in mesh_materials:
-                material = mesh_materials[mesh_idx]
-                material_index = material_indices[material.name]
-
-                for face_idx in range(start_face, end_face + 1):
-                    if face_idx < len(blender_mesh.polygons):
-                        blender_mesh.polygons[face_idx].material_index = material_index
+            mesh_material_indices.append(material_indices[material.name])
+
+        blender_mesh.polygons.foreach_set(
+            "material_index",
+            np.repeat(
+                np.asarray(mesh_material_indices, dtype=np.int32),
+                face_counts,
+            ),
+        )
 
     return blender_mesh
 
@@ -584,19 +676,15 @@ def add_vertex_colors(blender_mesh: bpy.types.Mesh, colors: List[int]) -> None:
 
     color_layer = blender_mesh.vertex_colors.active
 
-    # Set vertex colors for each loop
-    for poly in blender_mesh.polygons:
-        for loop_idx in poly.loop_indices:
-            vertex_idx = blender_mesh.loops[loop_idx].vertex_index
-            color_idx = vertex_idx * 4
-
-            # RGBA values normalized to 0.0-1.0 range
-            r = colors[color_idx] / 255.0
-            g = colors[color_idx + 1] / 255.0
-            b = colors[color_idx + 2] / 255.0
-            a = colors[color_idx + 3] / 255.0
-
-            color_layer.data[loop_idx].color = (r, g, b, a)
+    # RGBA values normalized to 0.0-1.0 range, set for each loop
+    vertex_colors = np.asarray(colors, dtype=np.float64).ravel()
+    vertex_colors = vertex_colors[: len(blender_mesh.vertices) * 4].reshape(-1, 4)
+    color_layer.data.foreach_set(
+        "color",
+        (vertex_colors[_loop_vertex_indices(blender_mesh)] / 255.0)
+        .astype(np.float32)
+        .ravel(),
+    )
 
 
 def add_texture_coordinates(
@@ -613,15 +701,17 @@ def add_texture_coordinates(
 
     uv_layer = blender_mesh.uv_layers.active
 
-    for poly in blender_mesh.polygons:
-        for loop_idx in poly.loop_indices:
-            vertex_idx = blender_mesh.loops[loop_idx].vertex_index
-            uv_idx = vertex_idx * 2
+    uvs = np.asarray(tex_coords, dtype=np.float64).ravel()
+    uvs = uvs[: len(blender_mesh.vertices) * 2].reshape(-1, 2)
+    uv_layer.data.foreach_set(
+        "uv", uvs[_loop_vertex_indices(blender_mesh)].astype(np.float32).ravel()
+    )
 
-            u = tex_coords[uv_idx]
-            v = tex_coords[uv_idx + 1]
 
-            uv_layer.data[loop_idx].uv = (u, v)
+def _loop_vertex_indices(blender_mesh: bpy.types.Mesh) -> np.ndarray:
+    vertex_indices = np.empty(len(blender_mesh.loops), dtype=np.int32)
+    blender_mesh.loops.foreach_get("vertex_index", vertex_indices)
+    return vertex_indices
 
 
 def render_material_proxy_to_native(
@@ -638,6 +728,9 @@ def render_material_proxy_to_native(
         print("No render material proxies found!")
         return assigned_objects
 
+    # materials already in the file, by render material hash
+    material_index = build_material_index()
+
     # process each render material proxy
     for proxy in speckle_object.renderMaterialProxies:
         if not hasattr(proxy, "value") or not hasattr(proxy, "objects"):
@@ -648,7 +741,9 @@ def render_material_proxy_to_native(
         material_name = getattr(render_material, "name", "Material")
 
         # create or get existing material
-        blender_material = create_material_from_proxy(render_material, material_name)
+        blender_material = create_material_from_proxy(
+            render_material, material_name, material_index
+        )
 
         # assign material to objects by applicationId
         for applicationId in proxy.objects:
@@ -663,12 +758,20 @@ def arc_to_native(
     """
     converts a Speckle arc to a Blender NURBS curve.
     """
+    return splines_to_native(
+        speckle_arc, object_name, data_block_name, scale, arc_to_spline
+    )
+
+
+def arc_to_spline(
+    speckle_arc: Arc, curve: bpy.types.Curve, scale: float = 1.0
+) -> bpy.types.Spline:
+    """
+    adds a Speckle arc to a Blender curve as a NURBS spline.
+    """
     import math
     import mathutils
 
-    curve = bpy.data.curves.new(data_block_name, type="CURVE")
-    curve.dimensions = "3D"
-
     plane = speckle_arc.plane
     if not plane:
         raise ValueError("Arc is missing plane")
@@ -771,8 +874,7 @@ def arc_to_native(
     Ndiv = max(int(abs(sweep_angle / 0.3)), 4)
     step = sweep_angle / float(Ndiv)
 
-    spline.points.add(Ndiv)
-
+    coordinates: List[float] = []
     for i in range(Ndiv + 1):
         angle = start_angle + step * i
         local_x = math.cos(angle) * radius
@@ -780,15 +882,15 @@ def arc_to_native(
 
         # Convert back to global coordinates
         point = center + x_dir * local_x + y_dir * local_y
-        spline.points[i].co = (point.x, point.y, point.z, 1.0)  # 1.0 is the weight
+        coordinates.extend((point.x, point.y, point.z))
+
+    write_spline_points(spline, coordinates, Ndiv + 1)
 
     spline.use_endpoint_u = True
     spline.order_u = 3
     spline.resolution_u = 12
 
-    curve_obj = bpy.data.objects.new(object_name, curve)
-
-    return curve_obj
+    return spline
 
 
 def circle_to_native(
@@ -797,12 +899,20 @@ def circle_to_native(
     """
     converts a Speckle circle to a Blender NURBS curve.
     """
+    return splines_to_native(
+        speckle_circle, object_name, data_block_name, scale, circle_to_spline
+    )
+
+
+def circle_to_spline(
+    speckle_circle: Circle, curve: bpy.types.Curve, scale: float = 1.0
+) -> bpy.types.Spline:
+    """
+    adds a Speckle circle to a Blender curve as a cyclic NURBS spline.
+    """
     import math
     import mathutils
 
-    curve = bpy.data.curves.new(data_block_name, type="CURVE")
-    curve.dimensions = "3D"
-
     center = mathutils.Vector(
         (
             float(speckle_circle.plane.origin.x) * scale,
@@ -844,8 +954,8 @@ def circle_to_native(
 
     # number of points for the circle
     num_points = 16  # set it to 16 as default - looks smooth
-    spline.points.add(num_points - 1)  # -1 because it already has one point
 
+    coordinates: List[float] = []
     for i in range(num_points):
         angle = 2 * math.pi * i / num_points
 
@@ -855,16 +965,16 @@ def circle_to_native(
             + y_axis * (radius * math.sin(angle))
         )
 
-        spline.points[i].co = (point.x, point.y, point.z, 1.0)  # 1.0 is the weight
+        coordinates.extend((point.x, point.y, point.z))
+
+    write_spline_points(spline, coordinates, num_points)
 
     spline.use_cyclic_u = True
 
     spline.order_u = 4
     spline.resolution_u = 12
 
-    curve_obj = bpy.data.objects.new(object_name, curve)
-
-    return curve_obj
+    return spline
 
 
 def ellipse_to_native(
@@ -873,10 +983,18 @@ def ellipse_to_native(
     """
     converts a Speckle ellipse to a Blender NURBS curve.
     """
-    import mathutils
+    return splines_to_native(
+        speckle_ellipse, object_name, data_block_name, scale, ellipse_to_spline
+    )
 
-    curve = bpy.data.curves.new(data_block_name, type="CURVE")
-    curve.dimensions = "3D"
+
+def ellipse_to_spline(
+    speckle_ellipse: Ellipse, curve: bpy.types.Curve, scale: float = 1.0
+) -> bpy.types.Spline:
+    """
+    adds a Speckle ellipse to a Blender curve as a cyclic Bezier spline.
+    """
+    import mathutils
 
     center = mathutils.Vector(
         (
@@ -963,9 +1081,7 @@ def ellipse_to_native(
 
     spline.use_cyclic_u = True
 
-    curve_obj = bpy.data.objects.new(object_name, curve)
-
-    return curve_obj
+    return spline
 
 
 def curve_to_native(
@@ -983,7 +1099,10 @@ def curve_to_native(
         and hasattr(speckle_curve, "displayValue")
         and speckle_curve.displayValue
     ):
-        print("curve_to_native: degree 2 curve, falling back to displayValue")
+        logger.debug(
+            "curve_to_native: degree 2 curve %s, falling back to displayValue",
+            speckle_curve.id,
+        )
         mesh, children = display_value_to_native(
             speckle_curve, object_name, data_block_name, scale
         )
@@ -995,8 +1114,23 @@ def curve_to_native(
         else:
             return None
 
-    curve = bpy.data.curves.new(data_block_name, type="CURVE")
-    curve.dimensions = "3D"
+    return splines_to_native(
+        speckle_curve, object_name, data_block_name, scale, curve_to_spline
+    )
+
+
+def curve_to_spline(
+    speckle_curve: Curve, curve: bpy.types.Curve, scale: float = 1.0
+) -> bpy.types.Spline:
+    """
+    adds a speckle NURBS curve to a Blender curve as a NURBS spline
+    """
+    # degree 2 curves are written from their polyline displayValue, if there is one
+    display_value = getattr(speckle_curve, "displayValue", None)
+    if getattr(speckle_curve, "degree", None) == 2 and isinstance(
+        display_value, Polyline
+    ):
+        return polyline_to_spline(display_value, curve, scale)
 
     spline = curve.splines.new("NURBS")
 
@@ -1017,28 +1151,20 @@ def curve_to_native(
     ):
         point_count = point_count - speckle_curve.degree
 
-    if point_count > 1:
-        spline.points.add(point_count - 1)
-
-    for i in range(point_count):
-        x = float(points[i * 3]) * scale
-        y = float(points[i * 3 + 1]) * scale
-        z = float(points[i * 3 + 2]) * scale
-
-        w = 1.0
-        if weights and i < len(weights):
-            w = float(weights[i])
-
-        print(f"curve_to_native: point {i}: ({x}, {y}, {z}, {w})")
-        spline.points[i].co = (x, y, z, w)
+    logger.debug(
+        "curve_to_native: %s with %d control points, degree %s",
+        speckle_curve.id,
+        point_count,
+        speckle_curve.degree,
+    )
+    write_spline_points(spline, points, point_count, scale, weights)
 
     spline.use_cyclic_u = speckle_curve.closed
     spline.use_endpoint_u = not speckle_curve.periodic
     spline.order_u = speckle_curve.degree + 1
     spline.resolution_u = 12
 
-    curve_obj = bpy.data.objects.new(object_name, curve)
-    return curve_obj
+    return spline
 
 
 def polycurve_to_native(
@@ -1068,71 +1194,86 @@ def polycurve_to_native(
                 return None
         raise ValueError("Polycurve is missing segments and has no displayValue")
 
+    return splines_to_native(
+        speckle_polycurve, object_name, data_block_name, scale, polycurve_to_splines
+    )
+
+
+def polycurve_to_splines(
+    speckle_polycurve: Polycurve, curve: bpy.types.Curve, scale: float = 1.0
+) -> List[bpy.types.Spline]:
+    """
+    adds every segment of a speckle polycurve to a Blender curve as its own spline
+    """
+    splines = []
+    for segment in speckle_polycurve.segments:
+        spline = curve_segment_to_spline(segment, curve, scale)
+        spline.resolution_u = 12
+        spline.use_endpoint_u = True
+        splines.append(spline)
+
+    return splines
+
+
+def curve_segment_to_spline(
+    segment: Base, curve: bpy.types.Curve, scale: float = 1.0
+) -> bpy.types.Spline:
+    """
+    adds a single speckle curve segment to a Blender curve using the matching converter
+    """
+    if isinstance(segment, Line):
+        return line_to_spline(segment, curve, scale)
+    elif isinstance(segment, Polyline):
+        return polyline_to_spline(segment, curve, scale)
+    elif isinstance(segment, Arc):
+        return arc_to_spline(segment, curve, scale)
+    elif isinstance(segment, Circle):
+        return circle_to_spline(segment, curve, scale)
+    elif isinstance(segment, Ellipse):
+        return ellipse_to_spline(segment, curve, scale)
+    elif isinstance(segment, Curve):
+        return curve_to_spline(segment, curve, scale)
+
+    raise ValueError(f"Unsupported curve segment type: {type(segment)}")
+
+
+def curves_to_merged_native(
+    speckle_curves: Iterable[Base], object_name: str, data_block_name: str
+) -> Optional[Object]:
+    """
+    writes many simple speckle curves into a single curve object, one spline each.
+    spline i belongs to the i-th entries of speckle_element_ids and
+    speckle_element_application_ids on the returned object
+    """
     curve = bpy.data.curves.new(data_block_name, type="CURVE")
     curve.dimensions = "3D"
 
-    for idx, segment in enumerate(speckle_polycurve.segments):
-        temp_curve = bpy.data.curves.new(f"temp_curve_{idx}", type="CURVE")
-        temp_curve.dimensions = "3D"
-        temp_obj = None
+    speckle_ids: List[str] = []
+    application_ids: List[str] = []
 
-        # convert the segment using the appropriate function
-        if isinstance(segment, Line):
-            temp_obj = line_to_native(
-                segment, f"temp_line_{idx}", f"temp_line_data_{idx}", scale
-            )
-        elif isinstance(segment, Polyline):
-            temp_obj = polyline_to_native(
-                segment, f"temp_polyline_{idx}", f"temp_polyline_data_{idx}", scale
-            )
-        elif isinstance(segment, Arc):
-            temp_obj = arc_to_native(
-                segment, f"temp_arc_{idx}", f"temp_arc_data_{idx}", scale
-            )
-        elif isinstance(segment, Circle):
-            temp_obj = circle_to_native(
-                segment, f"temp_circle_{idx}", f"temp_circle_data_{idx}", scale
-            )
-        elif isinstance(segment, Ellipse):
-            temp_obj = ellipse_to_native(
-                segment, f"temp_ellipse_{idx}", f"temp_ellipse_data_{idx}", scale
-            )
-        elif isinstance(segment, Curve):
-            temp_obj = curve_to_native(
-                segment, f"temp_curve_{idx}", f"temp_curve_data_{idx}", scale
+    for speckle_curve in speckle_curves:
+        try:
+            curve_segment_to_spline(
+                speckle_curve, curve, get_scale_factor(speckle_curve)
             )
-        else:
-            bpy.data.curves.remove(temp_curve)
-            raise ValueError(f"Unsupported curve segment type: {type(segment)}")
-
-        # copy splines from temp_obj to main curve
-        if temp_obj and temp_obj.data and hasattr(temp_obj.data, "splines"):
-            for src_spline in temp_obj.data.splines:
-                dst_spline = curve.splines.new(src_spline.type)
-                if src_spline.type == "BEZIER":
-                    dst_spline.bezier_points.add(len(src_spline.bezier_points) - 1)
-                    for i, bp in enumerate(src_spline.bezier_points):
-                        dst_spline.bezier_points[i].co = bp.co
-                        dst_spline.bezier_points[i].handle_left = bp.handle_left
-                        dst_spline.bezier_points[i].handle_right = bp.handle_right
-                else:
-                    dst_spline.points.add(len(src_spline.points) - 1)
-                    for i, point in enumerate(src_spline.points):
-                        dst_spline.points[i].co = point.co
-                dst_spline.use_cyclic_u = src_spline.use_cyclic_u
-                if hasattr(src_spline, "order_u"):
-                    dst_spline.order_u = src_spline.order_u
-                if hasattr(src_spline, "resolution_u"):
-                    dst_spline.resolution_u = 12
-                if hasattr(src_spline, "use_endpoint_u"):
-                    dst_spline.use_endpoint_u = True
-            bpy.data.objects.remove(temp_obj)
-        else:
-            raise ValueError(f"Failed to convert segment of type {type(segment)}")
+        except Exception as e:
+            print(f"Error converting {speckle_curve.speckle_type}: {str(e)}")
+            # keep spline indices aligned with the lookup table
+            if len(curve.splines) > len(speckle_ids):
+                curve.splines.remove(curve.splines[-1])
+            continue
+
+        speckle_ids.append(speckle_curve.id)
+        application_ids.append(getattr(speckle_curve, "applicationId", None) or "")
 
-        bpy.data.curves.remove(temp_curve)
+    if not speckle_ids:
+        bpy.data.curves.remove(curve)
+        return None
 
     curve_obj = bpy.data.objects.new(object_name, curve)
+    curve_obj["speckle_element_ids"] = speckle_ids
+    curve_obj["speckle_element_application_ids"] = application_ids
+
     return curve_obj
 
 
@@ -1156,6 +1297,156 @@ def point_to_native(
     return point_obj
 
 
+def is_pointcloud(speckle_object: Base) -> bool:
+    """
+    checks for both specklepy's PointCloud and the flat .NET Pointcloud
+    """
+    return isinstance(speckle_object, PointCloud) or speckle_object.speckle_type in (
+        "Objects.Geometry.Pointcloud",
+        "Objects.Geometry.PointCloud",
+    )
+
+
+def pointcloud_to_native(
+    speckle_pointcloud: Base,
+    object_name: str,
+    data_block_name: str,
+    scale: float = 1.0,
+) -> bpy.types.Object:
+    """
+    converts a speckle point cloud to a vertex-only mesh,
+    colors and sizes become the Color and radius point attributes
+    """
+    points = unpack_chunks(getattr(speckle_pointcloud, "points", None))
+    if points and isinstance(points[0], Point):
+        co = np.array(
+            [(float(p.x), float(p.y), float(p.z)) for p in points], dtype=np.float64
+        )
+    else:
+        co = np.asarray(points, dtype=np.float64)
+    co = co.reshape(-1, 3) * scale
+    point_count = len(co)
+
+    mesh = bpy.data.meshes.new(data_block_name)
+    mesh.vertices.add(point_count)
+    mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+
+    colors = unpack_chunks(getattr(speckle_pointcloud, "colors", None))
+    if point_count and len(colors) == point_count:
+        color_attribute = mesh.color_attributes.new("Color", "FLOAT_COLOR", "POINT")
+        color_attribute.data.foreach_set(
+            "color_srgb", to_rgba_array(colors).astype(np.float32).ravel()
+        )
+
+    sizes = unpack_chunks(getattr(speckle_pointcloud, "sizes", None))
+    if point_count and len(sizes) == point_count:
+        radius_attribute = mesh.attributes.new("radius", "FLOAT", "POINT")
+        radius_attribute.data.foreach_set(
+            "value", (np.asarray(sizes, dtype=np.float64) * scale).astype(np.float32)
+        )
+
+    mesh.update()
+
+    return bpy.data.objects.new(object_name, mesh)
+
+
+def points_to_merged_native(
+    speckle_points: Iterable[Point],
+    object_name: str,
+    data_block_name: str,
+    use_instancer: bool = False,
+) -> Optional[Object]:
+    """
+    writes many speckle points into the vertices of a single vertex-only mesh.
+    vertex i belongs to the i-th entries of speckle_element_ids and
+    speckle_element_application_ids on the returned object
+    """
+    coordinates: List[float] = []
+    point_scales: List[float] = []
+    speckle_ids: List[str] = []
+    application_ids: List[str] = []
+
+    # units are usually shared by all points, resolve each one only once
+    unit_scales: Dict[Optional[str], float] = {}
+
+    for speckle_point in speckle_points:
+        units = getattr(speckle_point, "units", None)
+        if units not in unit_scales:
+            unit_scales[units] = get_scale_factor(speckle_point)
+
+        coordinates.extend(
+            (float(speckle_point.x), float(speckle_point.y), float(speckle_point.z))
+        )
+        point_scales.append(unit_scales[units])
+        speckle_ids.append(speckle_point.id)
+        application_ids.append(getattr(speckle_point, "applicationId", None) or "")
+
+    if not speckle_ids:
+        return None
+
+    co = np.asarray(coordinates, dtype=np.float64).reshape(-1, 3)
+    co *= np.asarray(point_scales, dtype=np.float64)[:, None]
+
+    mesh = bpy.data.meshes.new(data_block_name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+    mesh.update()
+
+    point_obj = bpy.data.objects.new(object_name, mesh)
+    point_obj["speckle_element_ids"] = speckle_ids
+    point_obj["speckle_element_application_ids"] = application_ids
+
+    if use_instancer:
+        add_point_instancer(point_obj)
+
+    return point_obj
+
+
+def add_point_instancer(point_obj: Object) -> None:
+    """
+    displays the vertices of a merged point object through a geometry nodes instancer
+    """
+    node_group = bpy.data.node_groups.get(POINT_INSTANCER_NAME)
+    if node_group is None:
+        node_group = create_point_instancer_node_group()
+
+    modifier = point_obj.modifiers.new(POINT_INSTANCER_NAME, "NODES")
+    modifier.node_group = node_group
+
+
+def create_point_instancer_node_group() -> bpy.types.NodeTree:
+    """
+    creates the geometry nodes group that instances a small sphere on every vertex
+    """
+    node_group = bpy.data.node_groups.new(POINT_INSTANCER_NAME, "GeometryNodeTree")
+    node_group.interface.new_socket(
+        "Geometry", in_out="INPUT", socket_type="NodeSocketGeometry"
+    )
+    node_group.interface.new_socket(
+        "Geometry", in_out="OUTPUT", socket_type="NodeSocketGeometry"
+    )
+
+    nodes = node_group.nodes
+    group_input = nodes.new("NodeGroupInput")
+    group_output = nodes.new("NodeGroupOutput")
+    instance_on_points = nodes.new("GeometryNodeInstanceOnPoints")
+    sphere = nodes.new("GeometryNodeMeshIcoSphere")
+    sphere.inputs["Radius"].default_value = 0.05  # same as the empties' display size
+    sphere.inputs["Subdivisions"].default_value = 1
+
+    group_input.location = (-400, 0)
+    sphere.location = (-400, -150)
+    instance_on_points.location = (-150, 0)
+    group_output.location = (100, 0)
+
+    links = node_group.links
+    links.new(group_input.outputs[0], instance_on_points.inputs["Points"])
+    links.new(sphere.outputs["Mesh"], instance_on_points.inputs["Instance"])
+    links.new(instance_on_points.outputs["Instances"], group_output.inputs[0])
+
+    return node_group
+
+
 def find_instance_definitions(root_object: Base) -> Dict[str, Base]:
     """
     finds all instance definitions in the root object
@@ -1,11 +1,16 @@
 from bpy.types import Object
-from typing import Union, Optional, Tuple, List
+from typing import Union, Optional, List
+import numpy as np
 from specklepy.objects.geometry import Polyline, Curve
 from specklepy.objects.primitive import Interval
 from specklepy.objects.base import Base
 from mathutils import Matrix
-from mathutils.geometry import interpolate_bezier
-from .utils import nurb_make_curve, make_knots
+from .utils import (
+    nurb_make_curve,
+    make_knots,
+    read_bezier_points,
+    transform_points,
+)
 
 
 def curve_to_speckle(
@@ -47,42 +52,21 @@ def bezier_to_speckle(
     units: str = "m",
 ) -> Curve:
     degree = 3
-    closed = spline.use_cyclic_u
-    points: List[Tuple[float, float, float]] = []
-
-    for i, bp in enumerate(spline.bezier_points):
-        if i > 0:
-            transformed_point = matrix @ bp.handle_left * scale_factor
-            points.append(
-                (transformed_point.x, transformed_point.y, transformed_point.z)
-            )
-
-        transformed_point = matrix @ bp.co * scale_factor
-        points.append((transformed_point.x, transformed_point.y, transformed_point.z))
+    co, handle_left, handle_right = read_bezier_points(spline)
 
-        if i < len(spline.bezier_points) - 1:
-            transformed_point = matrix @ bp.handle_right * scale_factor
-            points.append(
-                (transformed_point.x, transformed_point.y, transformed_point.z)
-            )
-
-    if closed:
-        transformed_point = (
-            matrix @ spline.bezier_points[-1].handle_right * scale_factor
-        )
-        points.append((transformed_point.x, transformed_point.y, transformed_point.z))
+    # co, handle_right, handle_left, co, ... without the two dangling handles
+    control_points = np.stack([handle_left, co, handle_right], axis=1)
+    control_points = control_points.reshape(-1, 3)[1:-1]
 
-        transformed_point = matrix @ spline.bezier_points[0].handle_left * scale_factor
-        points.append((transformed_point.x, transformed_point.y, transformed_point.z))
-
-        transformed_point = matrix @ spline.bezier_points[0].co * scale_factor
-        points.append((transformed_point.x, transformed_point.y, transformed_point.z))
+    if spline.use_cyclic_u:
+        closing_points = np.stack([handle_right[-1], handle_left[0], co[0]])
+        control_points = np.concatenate([control_points, closing_points])
 
-    num_points = len(points)
+    num_points = len(control_points)
 
-    flattened_points = []
-    for point in points:
-        flattened_points.extend(point)
+    flattened_points: List[float] = (
+        transform_points(matrix, control_points, scale_factor).ravel().tolist()
+    )
 
     knot_count = num_points + degree - 1
     knots = [0] * knot_count
@@ -133,25 +117,36 @@ def bezier_to_speckle_polyline(
         return None
 
     resolution = spline.resolution_u + 1
-    points: List[float] = []
 
     if not spline.use_cyclic_u:
         segments -= 1
 
-    for i in range(segments):
-        inext = (i + 1) % len(spline.bezier_points)
-
-        knot1 = spline.bezier_points[i].co
-        handle1 = spline.bezier_points[i].handle_right
-        handle2 = spline.bezier_points[inext].handle_left
-        knot2 = spline.bezier_points[inext].co
+    co, handle_left, handle_right = read_bezier_points(spline)
+    current = np.arange(segments)
+    following = (current + 1) % len(co)
+
+    # (segments, 4, 3) control polygons, sampled like interpolate_bezier
+    # from t=0 to t=1 inclusive
+    segment_points = np.stack(
+        [
+            co[current],
+            handle_right[current],
+            handle_left[following],
+            co[following],
+        ],
+        axis=1,
+    )
+    t = np.linspace(0.0, 1.0, resolution)[:, None]
+    bernstein = np.hstack(
+        [(1 - t) ** 3, 3 * t * (1 - t) ** 2, 3 * t**2 * (1 - t), t**3]
+    )
+    sampled_points = np.einsum("rk,skj->srj", bernstein, segment_points)
 
-        sampled_points = interpolate_bezier(knot1, handle1, handle2, knot2, resolution)
-        for p in sampled_points:
-            scaled_point = matrix @ p * scale_factor
-            points.append(scaled_point.x)
-            points.append(scaled_point.y)
-            points.append(scaled_point.z)
+    points: List[float] = (
+        transform_points(matrix, sampled_points.reshape(-1, 3), scale_factor)
+        .ravel()
+        .tolist()
+    )
 
     length = length or spline.calc_length()
 
@@ -236,23 +231,13 @@ def nurbs_to_speckle_polyline(
     units: str = "m",
     resolution_multiplier: int = 1,
 ) -> Polyline:
-    from mathutils import Vector
-
-    points: List[float] = []
-
     resolution = spline.resolution_u * resolution_multiplier
 
-    sampled_points = nurb_make_curve(spline, resolution)
+    sampled_points = nurb_make_curve(spline, resolution).reshape(-1, 3)
 
-    for i in range(0, len(sampled_points), 3):
-        point_vector = Vector(
-            (sampled_points[i], sampled_points[i + 1], sampled_points[i + 2])
-        )
-        transformed_point = matrix @ point_vector * scale_factor
-
-        points.append(transformed_point.x)
-        points.append(transformed_point.y)
-        points.append(transformed_point.z)
+    points: List[float] = (
+        transform_points(matrix, sampled_points, scale_factor).ravel().tolist()
+    )
 
     length = length or spline.calc_length()
 
@@ -1,5 +1,9 @@
+import bpy
+import numpy as np
 from bpy.types import Object
 from specklepy.objects.geometry import Point
+from ..utils import Pointcloud, to_argb_int_array
+from .utils import transform_points
 
 
 def point_to_speckle(blender_object: Object, scale_factor: float = 1.0) -> Point:
@@ -15,3 +19,51 @@ def point_to_speckle(blender_object: Object, scale_factor: float = 1.0) -> Point
     )
 
     return speckle_point
+
+
+def is_vertex_only_mesh(data: bpy.types.Mesh) -> bool:
+    """
+    checks if a mesh only has loose vertices, e.g. a point cloud
+    """
+    return len(data.vertices) > 0 and not data.edges and not data.polygons
+
+
+def mesh_to_speckle_pointcloud(
+    blender_object: Object, data: bpy.types.Mesh, scale_factor: float, units: str
+) -> Pointcloud:
+    """
+    converts the vertices of a vertex-only mesh to a speckle point cloud,
+    the point domain color attribute and radius attribute become colors and sizes
+    """
+    point_count = len(data.vertices)
+
+    co = np.empty(point_count * 3, dtype=np.float32)
+    data.vertices.foreach_get("co", co)
+    points = transform_points(
+        blender_object.matrix_world, co.reshape(-1, 3).astype(np.float64), scale_factor
+    )
+
+    colors = []
+    color_attribute = data.color_attributes.active_color
+    if color_attribute and color_attribute.domain == "POINT":
+        rgba = np.empty(point_count * 4, dtype=np.float32)
+        color_attribute.data.foreach_get("color_srgb", rgba)
+        colors = to_argb_int_array(rgba.reshape(-1, 4))
+
+    sizes = []
+    radius_attribute = data.attributes.get("radius")
+    if (
+        radius_attribute
+        and radius_attribute.domain == "POINT"
+        and radius_attribute.data_type == "FLOAT"
+    ):
+        radius = np.empty(point_count, dtype=np.float32)
+        radius_attribute.data.foreach_get("value", radius)
+        sizes = (radius.astype(np.float64) * scale_factor).tolist()
+
+    return Pointcloud(
+        points=points.ravel().tolist(),
+        colors=colors,
+        sizes=sizes,
+        units=units,
+    )
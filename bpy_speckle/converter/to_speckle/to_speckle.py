@@ -1,11 +1,14 @@
 from bpy.types import Object
 from typing import Optional
 from specklepy.objects.data_objects import BlenderObject
+from ..profiler import profiled
 from .curve_to_speckle import curve_to_speckle
 from .mesh_to_speckle import mesh_to_speckle_meshes
+from .point_to_speckle import is_vertex_only_mesh, mesh_to_speckle_pointcloud
 from .utils import get_object_id, get_curve_element_id
 
 
+@profiled("to_speckle")
 def convert_to_speckle(
     blender_object: Object,
     scale_factor: float = 1.0,
@@ -57,9 +60,16 @@ def convert_to_speckle(
             evaluated_mesh = evaluated_obj.to_mesh()
             mesh_data = evaluated_mesh
         
-        meshes = mesh_to_speckle_meshes(
-            blender_object, mesh_data, scale_factor, units
-        )
+        if is_vertex_only_mesh(mesh_data):
+            meshes = [
+                mesh_to_speckle_pointcloud(
+                    blender_object, mesh_data, scale_factor, units
+                )
+            ]
+        else:
+            meshes = mesh_to_speckle_meshes(
+                blender_object, mesh_data, scale_factor, units
+            )
         
         if apply_modifiers and blender_object.modifiers and mesh_data != blender_object.data:
             blender_object.to_mesh_clear()
@@ -1,6 +1,8 @@
 import bpy
 from bpy.types import ID, Object
+from mathutils import Matrix
 import math
+import numpy as np
 from typing import Tuple, Optional
 
 OBJECT_NAME_SPECKLE_SEPARATOR = " -- "
@@ -72,142 +74,134 @@ def calc_knots(knots: list[float], point_count: int, order: int, flag: int) -> N
 
 
 def basis_nurb(
-    t: float,
+    t: np.ndarray,
     order: int,
     point_count: int,
-    knots: list[float],
-    basis: list[float],
-    start: int,
-    end: int,
-) -> Tuple[int, int]:
-    i1 = i2 = 0
+    knots: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    evaluates the non-zero basis functions for every parameter in t at once
+    returns an (n, order) array of basis values and the index of the first one
+    """
     orderpluspnts = order + point_count
     opp2 = orderpluspnts - 1
+    last_knot = len(knots) - 1
 
     # this is for float inaccuracy
-    if t < knots[0]:
-        t = knots[0]
-    elif t > knots[opp2]:
-        t = knots[opp2]
+    t = np.clip(t, knots[0], knots[opp2])
 
     # this part is order '1'
-    o2 = order + 1
-    for i in range(opp2):
-        if knots[i] != knots[i + 1] and t >= knots[i] and t <= knots[i + 1]:
-            basis[i] = 1.0
-            i1 = i - o2
-            if i1 < 0:
-                i1 = 0
-            i2 = i
-            i += 1
-            while i < opp2:
-                basis[i] = 0.0
-                i += 1
-            break
-
-        else:
-            basis[i] = 0.0
-
-    basis[i] = 0.0  # type: ignore
+    # first non-empty span with knots[i] <= t <= knots[i + 1]
+    if np.all(np.diff(knots[: opp2 + 1]) >= 0.0):
+        span = np.searchsorted(knots, t, side="left") - 1
+        at_start = span < 0
+        span[at_start] = np.searchsorted(knots, t[at_start], side="right") - 1
+    else:
+        # CU_NURB_BEZIER knots of order 3 aren't sorted, test every span
+        lo = knots[:opp2]
+        hi = knots[1 : opp2 + 1]
+        matches = (lo != hi) & (lo <= t[:, None]) & (t[:, None] <= hi)
+        span = np.where(matches.any(axis=1), matches.argmax(axis=1), opp2)
+    found = span < opp2
+    span = np.minimum(span, opp2 - 1)
+
+    first = span - order + 1
+    index = first[:, None] + np.arange(order)
+    inside = index >= 0
+
+    basis = np.zeros((len(t), order))
+    basis[:, -1] = 1.0
+
+    tt = t[:, None]
+    k_i = knots[np.clip(index, 0, last_knot)]
+    k_i1 = knots[np.clip(index + 1, 0, last_knot)]
 
     # this is order 2, 3, ...
     for j in range(2, order + 1):
-        if i2 + j >= orderpluspnts:
-            i2 = opp2 - j
+        next_basis = np.zeros_like(basis)
+        next_basis[:, :-1] = basis[:, 1:]
 
-        for i in range(i1, i2 + 1):
-            if basis[i] != 0.0:
-                d = ((t - knots[i]) * basis[i]) / (knots[i + j - 1] - knots[i])
-            else:
-                d = 0.0
+        k_ij1 = knots[np.clip(index + j - 1, 0, last_knot)]
+        k_ij = knots[np.clip(index + j, 0, last_knot)]
 
-            if basis[i + 1] != 0.0:
-                e = ((knots[i + j] - t) * basis[i + 1]) / (knots[i + j] - knots[i + 1])
-            else:
-                e = 0.0
+        d = _divide_or_zero((tt - k_i) * basis, k_ij1 - k_i)
+        e = _divide_or_zero((k_ij - tt) * next_basis, k_ij - k_i1)
 
-            basis[i] = d + e
+        basis = np.where(inside & (index + j < orderpluspnts), d + e, 0.0)
 
-    start = 1000
-    end = 0
+    basis[~found] = 0.0
 
-    for i in range(i1, i2 + 1):
-        if basis[i] > 0.0:
-            end = i
-            if start == 1000:
-                start = i
+    return basis, first
 
-    return start, end
+
+def _divide_or_zero(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros_like(numerator),
+        where=denominator != 0.0,
+    )
 
 
-def nurb_make_curve(nu: bpy.types.Spline, resolu: int, stride: int = 3) -> list[float]:
-    """ "BKE_nurb_makeCurve"""
+def nurb_make_curve(nu: bpy.types.Spline, resolu: int, stride: int = 3) -> np.ndarray:
+    """ "BKE_nurb_makeCurve", evaluated for all parameter samples at once"""
     EPS = 1e-6
-    coord_index = istart = iend = 0
+    point_count = nu.point_count_u
+    order = nu.order_u
 
-    coord_array = [0.0] * (3 * nu.resolution_u * macro_segmentsu(nu))
-    sum_array = [0] * nu.point_count_u
-    basisu = [0.0] * macro_knotsu(nu)
-    knots = make_knots(nu)
+    co = np.empty(len(nu.points) * 4, dtype=np.float32)
+    nu.points.foreach_get("co", co)
+    co = co.reshape(-1, 4).astype(np.float64)
+
+    knots = np.asarray(make_knots(nu), dtype=np.float64)
 
     resolu = resolu * macro_segmentsu(nu)
-    ustart = knots[nu.order_u - 1]
-    uend = (
-        knots[nu.point_count_u + nu.order_u - 1]
-        if nu.use_cyclic_u
-        else knots[nu.point_count_u]
-    )
-    ustep = (uend - ustart) / (resolu - (0 if nu.use_cyclic_u else 1))
-    cycl = nu.order_u - 1 if nu.use_cyclic_u else 0
-
-    u = ustart
-    while resolu:
-        resolu -= 1
-        istart, iend = basis_nurb(
-            u, nu.order_u, nu.point_count_u + cycl, knots, basisu, istart, iend
-        )
-
-        # /* calc sum */
-        sumdiv = 0.0
-        sum_index = 0
-        pt_index = istart - 1
-        for i in range(istart, iend + 1):
-            if i >= nu.point_count_u:
-                pt_index = i - nu.point_count_u
-            else:
-                pt_index += 1
-
-            sum_array[sum_index] = basisu[i] * nu.points[pt_index].co[3]  # type: ignore
-            sumdiv += sum_array[sum_index]
-            sum_index += 1
-
-        if (sumdiv != 0.0) and (sumdiv < 1.0 - EPS or sumdiv > 1.0 + EPS):
-            sum_index = 0
-            for i in range(istart, iend + 1):
-                sum_array[sum_index] /= sumdiv  # type: ignore
-                sum_index += 1
-
-        coord_array[coord_index : coord_index + 3] = (0.0, 0.0, 0.0)
-
-        sum_index = 0
-        pt_index = istart - 1
-        for i in range(istart, iend + 1):
-            if i >= nu.point_count_u:
-                pt_index = i - nu.point_count_u
-            else:
-                pt_index += 1
-
-            if sum_array[sum_index] != 0.0:
-                for j in range(3):
-                    coord_array[coord_index + j] += (
-                        sum_array[sum_index] * nu.points[pt_index].co[j]
-                    )
-            sum_index += 1
-
-        coord_index += stride
-        u += ustep
-
-    return coord_array
+    ustart = knots[order - 1]
+    uend = knots[point_count + order - 1] if nu.use_cyclic_u else knots[point_count]
+    ustep = (uend - ustart) / max(resolu - (0 if nu.use_cyclic_u else 1), 1)
+    cycl = order - 1 if nu.use_cyclic_u else 0
+
+    u = ustart + ustep * np.arange(resolu)
+    basis, first = basis_nurb(u, order, point_count + cycl, knots)
+
+    # wrap the indices past the last point around for cyclic curves
+    pt_index = (first[:, None] + np.arange(order)) % point_count
+
+    # /* calc sum */
+    sum_array = basis * co[pt_index, 3]
+    sumdiv = sum_array.sum(axis=1)
+    rational = (sumdiv != 0.0) & ((sumdiv < 1.0 - EPS) | (sumdiv > 1.0 + EPS))
+    sum_array[rational] /= sumdiv[rational, None]
+
+    coord_array = np.zeros((resolu, stride))
+    coord_array[:, :3] = np.einsum("sk,skj->sj", sum_array, co[pt_index, :3])
+
+    return coord_array.ravel()
+
+
+def transform_points(
+    matrix: Matrix, points: np.ndarray, scale_factor: float = 1.0
+) -> np.ndarray:
+    """
+    applies a 4x4 matrix and a scale factor to an (n, 3) array of points
+    """
+    m = np.array(matrix, dtype=np.float64)
+    return (points @ m[:3, :3].T + m[:3, 3]) * scale_factor
+
+
+def read_bezier_points(
+    spline: bpy.types.Spline,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    reads co, handle_left and handle_right of all bezier points as (n, 3) arrays
+    """
+    bezier_points = spline.bezier_points
+    arrays = []
+    for attribute in ("co", "handle_left", "handle_right"):
+        values = np.empty(len(bezier_points) * 3, dtype=np.float32)
+        bezier_points.foreach_get(attribute, values)
+        arrays.append(values.reshape(-1, 3).astype(np.float64))
+    return arrays[0], arrays[1], arrays[2]
 
 
 def get_unique_id(native_object: ID, suffix: Optional[str] = None) -> str:
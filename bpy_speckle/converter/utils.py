@@ -1,7 +1,12 @@
-from typing import Tuple, List, Optional
+import hashlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Tuple, List, Optional, Sequence
 import bpy
 import mathutils
+import numpy as np
 from specklepy.objects import Base
+from specklepy.objects.interfaces import IHasUnits
 from specklepy.objects.graph_traversal.default_traversal import (
     create_default_traversal_function,
 )
@@ -28,17 +33,102 @@ def to_argb_int(rgba_color: List[float]) -> int:
     return int.from_bytes(int_color, byteorder="big", signed=True)
 
 
+def to_rgba_array(argb_ints: Sequence[int]) -> np.ndarray:
+    """
+    converts int colours into an (n, 4) array of RGBA floats, see to_rgba
+    """
+    argb = np.asarray(argb_ints, dtype=np.int64).reshape(-1, 1)
+    return ((argb >> np.array([16, 8, 0, 24])) & 255) / 255
+
+
+def to_argb_int_array(rgba_colors: np.ndarray) -> List[int]:
+    """
+    converts an (n, 4) array of RGBA floats to ARGB integers, see to_argb_int
+    """
+    rgba = np.clip(np.asarray(rgba_colors, dtype=np.float64), 0.0, 1.0)
+    channels = (rgba * 255).astype(np.uint32)
+    argb = (
+        (channels[:, 3] << 24)
+        | (channels[:, 0] << 16)
+        | (channels[:, 1] << 8)
+        | channels[:, 2]
+    )
+    return argb.view(np.int32).tolist()
+
+
+def unpack_chunks(values: Any) -> List[Any]:
+    """
+    flattens a list of data chunks into a plain list, other lists are returned as is
+    """
+    if isinstance(values, list) and values and hasattr(values[0], "data"):
+        return [value for chunk in values for value in chunk.data]
+    return values or []
+
+
+@dataclass(kw_only=True)
+class Pointcloud(
+    Base,
+    IHasUnits,
+    speckle_type="Objects.Geometry.Pointcloud",
+    detachable={"points", "colors", "sizes"},
+    chunkable={"points": 31250, "colors": 62500, "sizes": 62500},
+):
+    """
+    a point cloud with flat points, colors and sizes arrays, as sent by the
+    .NET connectors. specklepy's PointCloud stores a Point object per point
+    """
+
+    points: List[float] = field(default_factory=list)
+    colors: List[int] = field(default_factory=list)
+    sizes: List[float] = field(default_factory=list)
+
+
+# custom property holding the render material hash of materials created on load
+MATERIAL_HASH_PROPERTY = "speckle_material_hash"
+
+
+def render_material_hash(render_material) -> str:
+    """
+    hashes the RenderMaterial properties a Blender material is built from
+    """
+    values = tuple(
+        getattr(render_material, name, None)
+        for name in ("diffuse", "opacity", "metalness", "roughness", "emissive")
+    )
+    return hashlib.md5(repr(values).encode()).hexdigest()
+
+
+def build_material_index() -> Dict[str, bpy.types.Material]:
+    """
+    maps render material hashes to the materials already in the file
+    """
+    return {
+        material[MATERIAL_HASH_PROPERTY]: material
+        for material in bpy.data.materials
+        if MATERIAL_HASH_PROPERTY in material
+    }
+
+
 def create_material_from_proxy(
-    render_material, material_name: str
+    render_material,
+    material_name: str,
+    material_index: Optional[Dict[str, bpy.types.Material]] = None,
 ) -> bpy.types.Material:
     """
-    creates a Blender material from a Speckle RenderMaterial
+    creates a Blender material from a Speckle RenderMaterial, or returns the
+    existing material built from identical properties
     """
-    if material_name in bpy.data.materials:
-        return bpy.data.materials[material_name]
+    if material_index is None:
+        material_index = build_material_index()
+
+    material_hash = render_material_hash(render_material)
+    if material_hash in material_index:
+        return material_index[material_hash]
 
     # create new material
     material = bpy.data.materials.new(name=material_name)
+    material[MATERIAL_HASH_PROPERTY] = material_hash
+    material_index[material_hash] = material
     material.use_nodes = True
     node_tree = material.node_tree
     nodes = node_tree.nodes
@@ -189,9 +279,50 @@ def find_object_by_id(root_object: Base, target_id: str) -> Optional[Base]:
     return deep_search(root_object)
 
 
+# seconds before cached server and project details are fetched again
+SERVER_CACHE_TTL = 600.0
+
+# server url -> (fetch time, capabilities)
+_server_capabilities: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+# (server url, project id) -> (fetch time, workspace id)
+_project_workspace_ids: Dict[Tuple[str, str], Tuple[float, Optional[str]]] = {}
+
+
+def _is_fresh(fetched_at: float) -> bool:
+    return time.monotonic() - fetched_at < SERVER_CACHE_TTL
+
+
+def get_server_capabilities(client: SpeckleClient) -> Dict[str, Any]:
+    """
+    returns the server version and whether workspaces are enabled, cached per server.
+    a failed query raises and isn't cached, the next call asks the server again
+    """
+    cached = _server_capabilities.get(client.url)
+    if cached and _is_fresh(cached[0]):
+        return cached[1]
+
+    capabilities = {
+        "version": client.project.server_version or client.server.version(),
+        "workspaces_enabled": client.server.get().workspaces.workspaces_enabled,
+    }
+    _server_capabilities[client.url] = (time.monotonic(), capabilities)
+    return capabilities
+
+
 def get_project_workspace_id(client: SpeckleClient, project_id: str) -> Optional[str]:
+    cached = _project_workspace_ids.get((client.url, project_id))
+    if cached and _is_fresh(cached[0]):
+        return cached[1]
+
+    # only reported with metrics, a server that can't tell shouldn't stop a load
+    # or publish. nothing is cached so the next call asks again
+    try:
+        server_version = get_server_capabilities(client)["version"]
+    except Exception as e:
+        print(f"Failed to get the server version: {str(e)}")
+        return None
+
     workspace_id = None
-    server_version = client.project.server_version or client.server.version()
 
     # Local yarn builds of server will report a server version if "dev"
     # We'll assume that local builds are up-to-date with the latest features
@@ -204,4 +335,6 @@ def get_project_workspace_id(client: SpeckleClient, project_id: str) -> Optional
 
     if maj > 2 or (maj == 2 and min > 20):
         workspace_id = client.project.get(project_id).workspace_id
+
+    _project_workspace_ids[(client.url, project_id)] = (time.monotonic(), workspace_id)
     return workspace_id
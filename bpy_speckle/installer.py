@@ -2,11 +2,13 @@
 Provides uniform and consistent path helpers for `specklepy`
 """
 
+import hashlib
 import os
 import sys
 from pathlib import Path
 from typing import Optional
 from importlib import import_module, invalidate_caches
+from importlib.util import find_spec
 
 _user_data_env_var = "SPECKLE_USERDATA_PATH"
 
@@ -92,6 +94,10 @@ print(sys.executable)
 
 PYTHON_PATH = sys.executable
 
+# written next to the installed packages, holds the hash of the requirements they
+# were installed from so later starts can skip pip entirely
+REQUIREMENTS_STAMP = "requirements.stamp"
+
 
 def connector_installation_path(host_application: str) -> Path:
     connector_installation_path = user_speckle_connector_installation_path(
@@ -100,7 +106,7 @@ def connector_installation_path(host_application: str) -> Path:
     connector_installation_path.mkdir(exist_ok=True, parents=True)
 
     # set user modules path at beginning of paths for earlier hit
-    if sys.path[0] != connector_installation_path:
+    if sys.path[0] != str(connector_installation_path):
         sys.path.insert(0, str(connector_installation_path))
 
     print(f"Using connector installation path {connector_installation_path}")
@@ -136,6 +142,19 @@ def get_requirements_path() -> Path:
     return path
 
 
+def get_requirements_hash(requirements_path: Path) -> str:
+    return hashlib.sha256(requirements_path.read_bytes()).hexdigest()
+
+
+def is_requirements_stamp_current(path: Path, requirements_path: Path) -> bool:
+    """Whether the packages in path were installed from these requirements."""
+    try:
+        stamp = path.joinpath(REQUIREMENTS_STAMP).read_text().strip()
+        return stamp == get_requirements_hash(requirements_path)
+    except OSError:
+        return False
+
+
 def install_requirements(host_application: str) -> None:
     # set up addons/modules under the user
     # script path. Here we'll install the
@@ -187,39 +206,38 @@ def install_requirements(host_application: str) -> None:
 
     print("Successfully installed dependencies")
 
-    if not is_debug:
-        requirements_path.unlink()
+    path.joinpath(REQUIREMENTS_STAMP).write_text(
+        get_requirements_hash(requirements_path)
+    )
 
 
 def install_dependencies(host_application: str) -> None:
+    path = connector_installation_path(host_application)
+    requirements_path = get_requirements_path()
+    if requirements_path.exists() and is_requirements_stamp_current(
+        path, requirements_path
+    ):
+        print("Speckle dependencies are up to date")
+        return
+
     if not is_pip_available():
         ensure_pip()
 
     install_requirements(host_application)
 
 
-def _import_dependencies() -> None:
-    import_module("specklepy")
-    # the code above doesn't work for now, it fails on importing graphql-core
-    # despite that, the connector seams to be working as expected
-    # But it would be nice to make this solution work
-    # it would ensure that all dependencies are fully loaded
-    # requirements = get_requirements_path().read_text()
-    # reqs = [
-    #     req.split(" ; ")[0].split("==")[0].split("[")[0].replace("-", "_")
-    #     for req in requirements.split("\n")
-    #     if req and not req.startswith(" ")
-    # ]
-    # for req in reqs:
-    #     print(req)
-    #     import_module("specklepy")
+def _find_dependencies() -> None:
+    # only specklepy is located, the other requirements are installed with it.
+    # importing it is left to the first operator that needs it
+    if find_spec("specklepy") is None:
+        raise ImportError("specklepy")
 
 
 def ensure_dependencies(host_application: str) -> None:
     try:
         install_dependencies(host_application)
         invalidate_caches()
-        _import_dependencies()
+        _find_dependencies()
         print("Successfully found dependencies")
     except ImportError:
         raise Exception(
@@ -0,0 +1,16 @@
+import sys
+import types
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# bare packages skip bpy_speckle/__init__.py and bpy_speckle/converter/__init__.py,
+# which import bpy, so the modules that don't need it are tested without Blender
+for name, path in (
+    ("bpy_speckle", REPO_ROOT / "bpy_speckle"),
+    ("bpy_speckle.converter", REPO_ROOT / "bpy_speckle" / "converter"),
+):
+    if name not in sys.modules:
+        package = types.ModuleType(name)
+        package.__path__ = [str(path)]
+        sys.modules[name] = package
@@ -0,0 +1,55 @@
+import pytest
+
+from bpy_speckle.converter.mesh_faces import face_corners
+
+
+def test_face_corners_of_triangles():
+    loop_totals, corners = face_corners([3, 0, 1, 2, 3, 2, 1, 3])
+
+    assert loop_totals.tolist() == [3, 3]
+    assert corners.tolist() == [0, 1, 2, 2, 1, 3]
+
+
+def test_face_corners_of_mixed_faces():
+    faces = [3, 0, 1, 2, 4, 0, 1, 2, 3, 5, 0, 1, 2, 3, 4, 4, 4, 5, 6, 7]
+
+    loop_totals, corners = face_corners(faces)
+
+    assert loop_totals.tolist() == [3, 4, 5, 4]
+    assert corners.tolist() == [0, 1, 2, 0, 1, 2, 3, 0, 1, 2, 3, 4, 4, 5, 6, 7]
+
+
+def test_face_corners_of_mixed_faces_with_regular_length():
+    # as long as a list of quads, but not only quads
+    loop_totals, corners = face_corners([4, 0, 1, 2, 3, 3, 0, 1, 3, 0])
+
+    assert loop_totals.tolist() == [4, 3]
+    assert corners.tolist() == [0, 1, 2, 3, 0, 1, 3]
+
+
+def test_face_corners_skip_faces_without_vertices():
+    loop_totals, corners = face_corners([0, 3, 0, 1, 2, 0, 4, 0, 1, 2, 3, 0])
+
+    assert loop_totals.tolist() == [3, 4]
+    assert corners.tolist() == [0, 1, 2, 0, 1, 2, 3]
+
+
+def test_face_corners_of_no_faces():
+    loop_totals, corners = face_corners([])
+
+    assert len(loop_totals) == 0
+    assert len(corners) == 0
+
+
+@pytest.mark.parametrize(
+    "faces",
+    [
+        [3, 0, 1],
+        [3, 0, 1, 2, 4, 0, 1],
+        [3, 0, 1, 2, 5],
+        [-1, 0, 1],
+    ],
+)
+def test_face_corners_of_truncated_faces(faces):
+    with pytest.raises(ValueError):
+        face_corners(faces)
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from bpy_speckle.connector.utils.typed_arrays import decode_data_chunk
+
+
+def test_decode_data_chunk_with_data_first():
+    chunk = '{"data":[1,2,3],"id":"a","speckle_type":"Speckle.Core.Models.DataChunk"}'
+
+    values = decode_data_chunk(chunk, np.int32)
+
+    assert values.dtype == np.int32
+    assert values.tolist() == [1, 2, 3]
+
+
+def test_decode_data_chunk_with_data_last():
+    chunk = (
+        '{"id":"a","speckle_type":"Speckle.Core.Models.DataChunk",'
+        '"metadata":"x","data": [0.5, -2.5e3, 3]}'
+    )
+
+    values = decode_data_chunk(chunk, np.float64)
+
+    assert values.tolist() == [0.5, -2500.0, 3.0]
+
+
+def test_decode_data_chunk_with_floats_in_int_array():
+    values = decode_data_chunk('{"id":"a","data":[1.0,2.0,3.0]}', np.int32)
+
+    assert values.dtype == np.int32
+    assert values.tolist() == [1, 2, 3]
+
+
+@pytest.mark.parametrize("data", ["[]", "[ ]", "[\n]"])
+def test_decode_empty_data_chunk(data):
+    values = decode_data_chunk(f'{{"id":"a","data":{data}}}', np.float64)
+
+    assert values.dtype == np.float64
+    assert len(values) == 0
+
+
+def test_decode_data_chunk_without_data():
+    with pytest.raises(ValueError):
+        decode_data_chunk('{"id":"a","speckle_type":"Base"}', np.float64)